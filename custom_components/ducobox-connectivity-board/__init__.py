@@ -1,9 +1,28 @@
 import logging
 from homeassistant.core import HomeAssistant
 from homeassistant.config_entries import ConfigEntry, ConfigEntryNotReady
-from .const import DOMAIN
+from homeassistant.exceptions import ConfigEntryAuthFailed
+from .const import (
+    DOMAIN,
+    CONF_CERT_FINGERPRINT,
+    CONF_RESTORE_DATA,
+    DEFAULT_RESTORE_DATA,
+    CONF_TREND_ANALYSIS,
+    DEFAULT_TREND_ANALYSIS,
+    CONF_WRITE_QUEUE,
+    DEFAULT_WRITE_QUEUE,
+    CONF_REQUEST_TIMEOUT,
+    DEFAULT_REQUEST_TIMEOUT,
+)
 from ducopy import DucoPy
 from .model.coordinator import DucoboxCoordinator
+from .model.preset_store import DucoboxPresetStore
+from .model.restore import DucoboxRestoreStore
+from .model.schema_cache import DucoboxSchemaCache
+from .model.trend_store import DucoboxTrendStore
+from .model.write_queue_store import DucoboxWriteQueueStore
+from .model.transport import DucoboxTransportSettings, configure_transport, fetch_certificate_fingerprint
+from .services import async_setup_services
 
 _LOGGER = logging.getLogger(__name__)
 _PLATFORMS = ['sensor', 'number', 'select']
@@ -12,6 +31,7 @@ _PLATFORMS = ['sensor', 'number', 'select']
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     """Set up the Ducobox Connectivity Board integration."""
     _LOGGER.debug("Setting up Ducobox Connectivity Board integration")
+    async_setup_services(hass)
     return True
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -19,23 +39,86 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     base_url = entry.data["base_url"]
     _LOGGER.debug(f"Base URL from config entry: {base_url}")
 
+    fingerprint = entry.data.get(CONF_CERT_FINGERPRINT)
+    if fingerprint is None:
+        # Pin the certificate the board presents the first time it is set up
+        try:
+            fingerprint = await hass.async_add_executor_job(fetch_certificate_fingerprint, base_url)
+        except Exception as ex:
+            _LOGGER.warning(f"Could not read the board certificate of {base_url}: {ex}")
+        if fingerprint is not None:
+            hass.config_entries.async_update_entry(entry, data={**entry.data, CONF_CERT_FINGERPRINT: fingerprint})
+            _LOGGER.info(f"Pinned board certificate {fingerprint}")
+
     try:
+        # The board certificate is self-signed; instead of chain validation the
+        # transport compares the pinned fingerprint on every full handshake
         duco_client = DucoPy(base_url=base_url, verify=False)
-        coordinator = DucoboxCoordinator(hass, duco_client)
-        await coordinator.async_config_entry_first_refresh()
+        transport = DucoboxTransportSettings(entry.options.get(CONF_REQUEST_TIMEOUT, DEFAULT_REQUEST_TIMEOUT))
+        # One connection per client: every request in flight gets a client of its own
+        tls = configure_transport(duco_client, fingerprint, 1, transport)
+
+        def create_client() -> DucoPy:
+            client = DucoPy(base_url=base_url, verify=False)
+            configure_transport(client, fingerprint, 1, transport, tls)
+            return client
+
+        schema_cache = DucoboxSchemaCache(hass, entry.entry_id)
+        await schema_cache.async_load()
+        restore_store = (
+            DucoboxRestoreStore(hass, entry.entry_id)
+            if entry.options.get(CONF_RESTORE_DATA, DEFAULT_RESTORE_DATA) else None
+        )
+        trend_store = None
+        if entry.options.get(CONF_TREND_ANALYSIS, DEFAULT_TREND_ANALYSIS):
+            trend_store = DucoboxTrendStore(hass, entry.entry_id)
+            await trend_store.async_load()
+        write_queue = None
+        if entry.options.get(CONF_WRITE_QUEUE, DEFAULT_WRITE_QUEUE):
+            write_queue = await DucoboxWriteQueueStore(hass, entry.entry_id).async_load()
+        coordinator = DucoboxCoordinator(
+            hass, duco_client, dict(entry.options), schema_cache, restore_store, trend_store, write_queue,
+            client_factory=create_client,
+        )
+        coordinator.tls = tls
+        coordinator.transport = transport
+        try:
+            await coordinator.async_config_entry_first_refresh()
+        except ConfigEntryNotReady:
+            # Start from the saved payloads and keep polling, rather than retrying setup
+            if not await coordinator.async_restore():
+                raise
+        presets = DucoboxPresetStore(hass, entry.entry_id)
+        await presets.async_load()
         _LOGGER.debug(f"DucoPy initialized with base URL: {base_url}")
         hass.data.setdefault(DOMAIN, {})
-        hass.data[DOMAIN][entry.entry_id] = {'client': duco_client, 'coordinator': coordinator}
+        hass.data[DOMAIN][entry.entry_id] = {'client': duco_client, 'coordinator': coordinator, 'presets': presets}
+    except ConfigEntryAuthFailed:
+        # The board certificate changed: ask to re-pin it instead of retrying
+        raise
     except Exception as ex:
         _LOGGER.error("Could not connect to Ducobox: %s", ex)
         raise ConfigEntryNotReady from ex
 
+    entry.async_on_unload(entry.add_update_listener(async_options_updated))
+    entry.async_on_unload(coordinator.async_start_sampling())
+    entry.async_on_unload(coordinator.async_start_countdowns())
+    entry.async_on_unload(coordinator.async_start_write_queue())
+
     await hass.config_entries.async_forward_entry_setups(entry, _PLATFORMS)
     return True
 
+async def async_options_updated(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply changed options to the running coordinator; reload only when it cannot apply them live."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]['coordinator']
+    if not await coordinator.async_apply_options(entry.options):
+        _LOGGER.info("Reloading Ducobox to apply the changed options")
+        await hass.config_entries.async_reload(entry.entry_id)
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, _PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator = hass.data[DOMAIN].pop(entry.entry_id)['coordinator']
+        await coordinator.async_close()
     return unload_ok
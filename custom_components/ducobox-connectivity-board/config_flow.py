@@ -5,7 +5,87 @@ from homeassistant.helpers.service_info.zeroconf import ZeroconfServiceInfo
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.core import callback
 from homeassistant.helpers import selector
-from .const import DOMAIN
+from homeassistant.helpers import entity_registry as er
+from .const import (
+    DOMAIN,
+    CONF_CERT_FINGERPRINT,
+    CONF_SCAN_INTERVAL,
+    CONF_REQUEST_TIMEOUT,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_REQUEST_TIMEOUT,
+    CONF_REQUESTS_PER_SECOND,
+    CONF_MAX_IN_FLIGHT,
+    DEFAULT_REQUESTS_PER_SECOND,
+    DEFAULT_MAX_IN_FLIGHT,
+    CONF_ROLLING_STATISTICS,
+    CONF_ROLLING_WINDOW,
+    DEFAULT_ROLLING_STATISTICS,
+    DEFAULT_ROLLING_WINDOW,
+    DEADBAND_DEVICE_CLASSES,
+    DEADBAND_OTHER,
+    CONF_DEADBAND_ABSOLUTE,
+    CONF_DEADBAND_RELATIVE,
+    CONF_DEADBAND_HEARTBEAT,
+    DEFAULT_DEADBAND_HEARTBEAT,
+    CONF_SAMPLE_INTERVAL,
+    CONF_COUNTDOWN_INTERVAL,
+    CONF_SAMPLE_AGGREGATE,
+    DEFAULT_SAMPLE_INTERVAL,
+    DEFAULT_COUNTDOWN_INTERVAL,
+    DEFAULT_SAMPLE_AGGREGATE,
+    CONF_EXTERNAL_STATISTICS,
+    DEFAULT_EXTERNAL_STATISTICS,
+    CONF_SNAPSHOT_EVENT,
+    DEFAULT_SNAPSHOT_EVENT,
+    CONF_TREND_ANALYSIS,
+    DEFAULT_TREND_ANALYSIS,
+    CONF_ADVANCED_PARAMETERS,
+    DEFAULT_ADVANCED_PARAMETERS,
+    CONF_ZONES,
+    DEFAULT_ZONES,
+    CONF_WRITE_QUEUE,
+    DEFAULT_WRITE_QUEUE,
+    CONF_EXPORT,
+    CONF_EXPORT_MODE,
+    CONF_EXPORT_RETENTION,
+    DEFAULT_EXPORT,
+    DEFAULT_EXPORT_MODE,
+    DEFAULT_EXPORT_RETENTION,
+    CONF_PROJECTED_REQUESTS,
+    DEFAULT_PROJECTED_REQUESTS,
+    CONF_NODE_SCHEDULING,
+    CONF_NODE_INTERVALS,
+    DEFAULT_NODE_SCHEDULING,
+    DEFAULT_NODE_INTERVALS,
+    CONF_AVAILABILITY_GRACE,
+    CONF_RESTORE_DATA,
+    DEFAULT_AVAILABILITY_GRACE,
+    DEFAULT_RESTORE_DATA,
+    CONF_CONTROL,
+    CONF_CONTROL_NODES,
+    CONF_CONTROL_CO2_HIGH,
+    CONF_CONTROL_CO2_LOW,
+    CONF_CONTROL_RH_HIGH,
+    CONF_CONTROL_RH_LOW,
+    CONF_CONTROL_STATE_HIGH,
+    CONF_CONTROL_STATE_LOW,
+    CONF_CONTROL_MIN_HOLD,
+    DEFAULT_CONTROL,
+    DEFAULT_CONTROL_NODES,
+    DEFAULT_CONTROL_CO2_HIGH,
+    DEFAULT_CONTROL_CO2_LOW,
+    DEFAULT_CONTROL_RH_HIGH,
+    DEFAULT_CONTROL_RH_LOW,
+    DEFAULT_CONTROL_STATE_HIGH,
+    DEFAULT_CONTROL_STATE_LOW,
+    DEFAULT_CONTROL_MIN_HOLD,
+)
+from .model.control import parse_node_ids
+from .model.node_schedule import parse_node_intervals
+from .model.exporter import EXPORT_MODES
+from .model.sampling import AGGREGATES
+from .model.zones import parse_zones
+from .model.transport import fetch_certificate_fingerprint
 import requests
 import asyncio
 
@@ -97,12 +177,68 @@ class DucoboxConnectivityBoardConfigFlow(config_entries.ConfigFlow, domain=DOMAI
             },
         )
 
+    async def async_step_reauth(self, entry_data) -> FlowResult:
+        """Handle a board certificate that no longer matches the pinned fingerprint."""
+        return await self.async_step_reauth_confirm()
+
+    async def async_step_reauth_confirm(self, user_input=None) -> FlowResult:
+        """Show the new certificate fingerprint and pin it once the user confirms."""
+        entry = self.hass.config_entries.async_get_entry(self.context["entry_id"])
+        try:
+            fingerprint = await self.hass.async_add_executor_job(
+                fetch_certificate_fingerprint, entry.data["base_url"]
+            )
+        except OSError as e:
+            _LOGGER.warning(f"Could not read the board certificate of {entry.data['base_url']}: {e}")
+            return self.async_abort(reason="cannot_connect")
+
+        if user_input is not None:
+            _LOGGER.warning(f"Pinned new board certificate {fingerprint}")
+            return self.async_update_reload_and_abort(
+                entry, data={**entry.data, CONF_CERT_FINGERPRINT: fingerprint}
+            )
+
+        return self.async_show_form(
+            step_id="reauth_confirm",
+            description_placeholders={
+                "pinned": entry.data.get(CONF_CERT_FINGERPRINT),
+                "fingerprint": fingerprint,
+            },
+        )
+
     @staticmethod
     @callback
     def async_get_options_flow(config_entry):
         return DucoboxOptionsFlowHandler(config_entry)
 
 
+def _node_ids(value: str) -> str:
+    """Validate a comma separated list of node ids."""
+    try:
+        parse_node_ids(value)
+    except ValueError as e:
+        raise vol.Invalid(f"invalid node ids: {value}") from e
+    return value
+
+
+def _node_intervals(value: str) -> str:
+    """Validate a comma separated list of <node type>=<seconds>."""
+    try:
+        parse_node_intervals(value)
+    except ValueError as e:
+        raise vol.Invalid(f"invalid node intervals: {e}") from e
+    return value
+
+
+def _zones(value: str) -> str:
+    """Validate a semicolon separated list of <zone>: <node id>, ..."""
+    try:
+        parse_zones(value)
+    except ValueError as e:
+        raise vol.Invalid(f"invalid zones: {e}") from e
+    return value
+
+
 class DucoboxOptionsFlowHandler(config_entries.OptionsFlow):
     """Handle options flow for Ducobox Connectivity Board."""
 
@@ -113,4 +249,167 @@ class DucoboxOptionsFlowHandler(config_entries.OptionsFlow):
         """Manage options."""
         if user_input is not None:
             return self.async_create_entry(title="", data=user_input)
-        return self.async_show_form(step_id="init", data_schema=vol.Schema({}))
+
+        options = self.config_entry.options
+        options_schema = vol.Schema({
+            vol.Optional(
+                CONF_SCAN_INTERVAL,
+                default=options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
+            ): vol.All(vol.Coerce(int), vol.Range(min=10, max=3600)),
+            vol.Optional(
+                CONF_REQUEST_TIMEOUT,
+                default=options.get(CONF_REQUEST_TIMEOUT, DEFAULT_REQUEST_TIMEOUT),
+            ): vol.All(vol.Coerce(int), vol.Range(min=1, max=120)),
+            vol.Optional(
+                CONF_REQUESTS_PER_SECOND,
+                default=options.get(CONF_REQUESTS_PER_SECOND, DEFAULT_REQUESTS_PER_SECOND),
+            ): vol.All(vol.Coerce(float), vol.Range(min=0.1, max=20)),
+            vol.Optional(
+                CONF_MAX_IN_FLIGHT,
+                default=options.get(CONF_MAX_IN_FLIGHT, DEFAULT_MAX_IN_FLIGHT),
+            ): vol.All(vol.Coerce(int), vol.Range(min=1, max=8)),
+            vol.Optional(
+                CONF_ROLLING_STATISTICS,
+                default=options.get(CONF_ROLLING_STATISTICS, DEFAULT_ROLLING_STATISTICS),
+            ): bool,
+            vol.Optional(
+                CONF_ROLLING_WINDOW,
+                default=options.get(CONF_ROLLING_WINDOW, DEFAULT_ROLLING_WINDOW),
+            ): vol.All(vol.Coerce(int), vol.Range(min=2, max=1440)),
+            vol.Optional(
+                CONF_SAMPLE_INTERVAL,
+                default=options.get(CONF_SAMPLE_INTERVAL, DEFAULT_SAMPLE_INTERVAL),
+            ): vol.All(vol.Coerce(int), vol.Range(min=0, max=59)),
+            vol.Optional(
+                CONF_SAMPLE_AGGREGATE,
+                default=options.get(CONF_SAMPLE_AGGREGATE, DEFAULT_SAMPLE_AGGREGATE),
+            ): vol.In(AGGREGATES),
+            vol.Optional(
+                CONF_COUNTDOWN_INTERVAL,
+                default=options.get(CONF_COUNTDOWN_INTERVAL, DEFAULT_COUNTDOWN_INTERVAL),
+            ): vol.All(vol.Coerce(int), vol.Range(min=0, max=60)),
+            vol.Optional(
+                CONF_EXTERNAL_STATISTICS,
+                default=options.get(CONF_EXTERNAL_STATISTICS, DEFAULT_EXTERNAL_STATISTICS),
+            ): bool,
+            vol.Optional(
+                CONF_SNAPSHOT_EVENT,
+                default=options.get(CONF_SNAPSHOT_EVENT, DEFAULT_SNAPSHOT_EVENT),
+            ): bool,
+            vol.Optional(
+                CONF_ADVANCED_PARAMETERS,
+                default=options.get(CONF_ADVANCED_PARAMETERS, DEFAULT_ADVANCED_PARAMETERS),
+            ): bool,
+            vol.Optional(
+                CONF_ZONES,
+                default=options.get(CONF_ZONES, DEFAULT_ZONES),
+            ): vol.All(str, _zones),
+            vol.Optional(
+                CONF_WRITE_QUEUE,
+                default=options.get(CONF_WRITE_QUEUE, DEFAULT_WRITE_QUEUE),
+            ): bool,
+            vol.Optional(
+                CONF_EXPORT,
+                default=options.get(CONF_EXPORT, DEFAULT_EXPORT),
+            ): bool,
+            vol.Optional(
+                CONF_EXPORT_MODE,
+                default=options.get(CONF_EXPORT_MODE, DEFAULT_EXPORT_MODE),
+            ): vol.In(EXPORT_MODES),
+            vol.Optional(
+                CONF_EXPORT_RETENTION,
+                default=options.get(CONF_EXPORT_RETENTION, DEFAULT_EXPORT_RETENTION),
+            ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+            vol.Optional(
+                CONF_TREND_ANALYSIS,
+                default=options.get(CONF_TREND_ANALYSIS, DEFAULT_TREND_ANALYSIS),
+            ): bool,
+            vol.Optional(
+                CONF_PROJECTED_REQUESTS,
+                default=options.get(CONF_PROJECTED_REQUESTS, DEFAULT_PROJECTED_REQUESTS),
+            ): bool,
+            vol.Optional(
+                CONF_NODE_SCHEDULING,
+                default=options.get(CONF_NODE_SCHEDULING, DEFAULT_NODE_SCHEDULING),
+            ): bool,
+            vol.Optional(
+                CONF_NODE_INTERVALS,
+                default=options.get(CONF_NODE_INTERVALS, DEFAULT_NODE_INTERVALS),
+            ): vol.All(str, _node_intervals),
+            vol.Optional(
+                CONF_AVAILABILITY_GRACE,
+                default=options.get(CONF_AVAILABILITY_GRACE, DEFAULT_AVAILABILITY_GRACE),
+            ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+            vol.Optional(
+                CONF_RESTORE_DATA,
+                default=options.get(CONF_RESTORE_DATA, DEFAULT_RESTORE_DATA),
+            ): bool,
+            vol.Optional(
+                CONF_CONTROL,
+                default=options.get(CONF_CONTROL, DEFAULT_CONTROL),
+            ): bool,
+            vol.Optional(
+                CONF_CONTROL_NODES,
+                default=options.get(CONF_CONTROL_NODES, DEFAULT_CONTROL_NODES),
+            ): vol.All(str, _node_ids),
+            vol.Optional(
+                CONF_CONTROL_CO2_HIGH,
+                default=options.get(CONF_CONTROL_CO2_HIGH, DEFAULT_CONTROL_CO2_HIGH),
+            ): vol.All(vol.Coerce(int), vol.Range(min=0, max=5000)),
+            vol.Optional(
+                CONF_CONTROL_CO2_LOW,
+                default=options.get(CONF_CONTROL_CO2_LOW, DEFAULT_CONTROL_CO2_LOW),
+            ): vol.All(vol.Coerce(int), vol.Range(min=0, max=5000)),
+            vol.Optional(
+                CONF_CONTROL_RH_HIGH,
+                default=options.get(CONF_CONTROL_RH_HIGH, DEFAULT_CONTROL_RH_HIGH),
+            ): vol.All(vol.Coerce(int), vol.Range(min=0, max=100)),
+            vol.Optional(
+                CONF_CONTROL_RH_LOW,
+                default=options.get(CONF_CONTROL_RH_LOW, DEFAULT_CONTROL_RH_LOW),
+            ): vol.All(vol.Coerce(int), vol.Range(min=0, max=100)),
+            vol.Optional(
+                CONF_CONTROL_STATE_HIGH,
+                default=options.get(CONF_CONTROL_STATE_HIGH, DEFAULT_CONTROL_STATE_HIGH),
+            ): str,
+            vol.Optional(
+                CONF_CONTROL_STATE_LOW,
+                default=options.get(CONF_CONTROL_STATE_LOW, DEFAULT_CONTROL_STATE_LOW),
+            ): str,
+            vol.Optional(
+                CONF_CONTROL_MIN_HOLD,
+                default=options.get(CONF_CONTROL_MIN_HOLD, DEFAULT_CONTROL_MIN_HOLD),
+            ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+            vol.Optional(
+                CONF_DEADBAND_HEARTBEAT,
+                default=options.get(CONF_DEADBAND_HEARTBEAT, DEFAULT_DEADBAND_HEARTBEAT),
+            ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+        })
+        for device_class in (*DEADBAND_DEVICE_CLASSES, DEADBAND_OTHER):
+            for conf_key in (CONF_DEADBAND_ABSOLUTE.format(device_class), CONF_DEADBAND_RELATIVE.format(device_class)):
+                options_schema = options_schema.extend({
+                    vol.Optional(conf_key, default=options.get(conf_key, 0)): vol.All(
+                        vol.Coerce(float), vol.Range(min=0)
+                    ),
+                })
+        return self.async_show_form(
+            step_id="init",
+            data_schema=options_schema,
+            description_placeholders=self._parameter_placeholders(),
+        )
+
+    def _parameter_placeholders(self) -> dict[str, str]:
+        """Describe the number entities and config index memory that advanced_parameters results in."""
+        entities = [
+            entity
+            for entity in er.async_entries_for_config_entry(er.async_get(self.hass), self.config_entry.entry_id)
+            if entity.domain == 'number'
+        ]
+        coordinator = self.hass.data.get(DOMAIN, {}).get(self.config_entry.entry_id, {}).get('coordinator')
+        stats = coordinator.config_index.stats() if coordinator is not None else None
+        return {
+            'number_entities': str(len(entities)),
+            'number_enabled': str(sum(1 for entity in entities if not entity.disabled)),
+            'tracked_parameters': str(stats['tracked']) if stats is not None else '-',
+            'tracked_kib': f"{stats['tracked_bytes'] / 1024:.1f}" if stats is not None else '-',
+        }
@@ -1,4 +1,137 @@
 from datetime import timedelta
 
 DOMAIN = "ducobox_connectivity_board"
-SCAN_INTERVAL = timedelta(seconds=60)
+
+# Options
+CONF_SCAN_INTERVAL = "scan_interval"
+CONF_REQUEST_TIMEOUT = "request_timeout"
+
+DEFAULT_SCAN_INTERVAL = 60
+DEFAULT_REQUEST_TIMEOUT = 30
+SCAN_INTERVAL = timedelta(seconds=DEFAULT_SCAN_INTERVAL)
+
+CONF_REQUESTS_PER_SECOND = "requests_per_second"
+CONF_MAX_IN_FLIGHT = "max_in_flight"
+
+DEFAULT_REQUESTS_PER_SECOND = 2.0
+DEFAULT_MAX_IN_FLIGHT = 2
+CONF_ROLLING_STATISTICS = "rolling_statistics"
+CONF_ROLLING_WINDOW = "rolling_window"
+
+DEFAULT_ROLLING_STATISTICS = False
+DEFAULT_ROLLING_WINDOW = 30
+
+# Deadbands are configured per sensor device class; sensors without one use "other"
+DEADBAND_DEVICE_CLASSES = ("temperature", "humidity", "carbon_dioxide", "pressure", "signal_strength")
+DEADBAND_OTHER = "other"
+CONF_DEADBAND_ABSOLUTE = "deadband_{}_absolute"
+CONF_DEADBAND_RELATIVE = "deadband_{}_relative"
+CONF_DEADBAND_HEARTBEAT = "deadband_heartbeat"
+
+DEFAULT_DEADBAND_HEARTBEAT = 900
+
+CONF_SAMPLE_INTERVAL = "sample_interval"
+CONF_SAMPLE_AGGREGATE = "sample_aggregate"
+
+DEFAULT_SAMPLE_INTERVAL = 0
+DEFAULT_SAMPLE_AGGREGATE = "mean"
+
+CONF_COUNTDOWN_INTERVAL = "countdown_interval"
+
+DEFAULT_COUNTDOWN_INTERVAL = 0
+
+CONF_EXTERNAL_STATISTICS = "external_statistics"
+
+DEFAULT_EXTERNAL_STATISTICS = False
+
+EVENT_SNAPSHOT = f"{DOMAIN}_snapshot"
+CONF_SNAPSHOT_EVENT = "snapshot_event"
+
+DEFAULT_SNAPSHOT_EVENT = False
+
+# Services
+SERVICE_GET_SNAPSHOT = "get_snapshot"
+SERVICE_SET_MANY = "set_many"
+SERVICE_SAVE_PRESET = "save_preset"
+SERVICE_APPLY_PRESET = "apply_preset"
+SERVICE_DELETE_PRESET = "delete_preset"
+
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_ITEMS = "items"
+ATTR_NAME = "name"
+ATTR_NODES = "nodes"
+ATTR_KEYS = "keys"
+
+CONF_AVAILABILITY_GRACE = "availability_grace"
+CONF_RESTORE_DATA = "restore_data"
+
+DEFAULT_AVAILABILITY_GRACE = 300
+DEFAULT_RESTORE_DATA = False
+
+CONF_ADVANCED_PARAMETERS = "advanced_parameters"
+
+DEFAULT_ADVANCED_PARAMETERS = False
+
+CONF_ZONES = "zones"
+
+DEFAULT_ZONES = ""
+
+CONF_WRITE_QUEUE = "write_queue"
+
+DEFAULT_WRITE_QUEUE = False
+
+CONF_EXPORT = "export"
+CONF_EXPORT_MODE = "export_mode"
+CONF_EXPORT_RETENTION = "export_retention"
+
+DEFAULT_EXPORT = False
+DEFAULT_EXPORT_MODE = "diff"
+DEFAULT_EXPORT_RETENTION = 7
+
+# Directory under the Home Assistant configuration directory for exported payloads
+EXPORT_DIRECTORY = "ducobox_export"
+
+CONF_TREND_ANALYSIS = "trend_analysis"
+
+DEFAULT_TREND_ANALYSIS = False
+
+CONF_PROJECTED_REQUESTS = "projected_requests"
+
+DEFAULT_PROJECTED_REQUESTS = False
+
+CONF_NODE_SCHEDULING = "node_scheduling"
+CONF_NODE_INTERVALS = "node_intervals"
+
+DEFAULT_NODE_SCHEDULING = False
+DEFAULT_NODE_INTERVALS = ""
+
+# Demand-controlled ventilation
+CONF_CONTROL = "control"
+CONF_CONTROL_NODES = "control_nodes"
+CONF_CONTROL_CO2_HIGH = "control_co2_high"
+CONF_CONTROL_CO2_LOW = "control_co2_low"
+CONF_CONTROL_RH_HIGH = "control_rh_high"
+CONF_CONTROL_RH_LOW = "control_rh_low"
+CONF_CONTROL_STATE_HIGH = "control_state_high"
+CONF_CONTROL_STATE_LOW = "control_state_low"
+CONF_CONTROL_MIN_HOLD = "control_min_hold"
+
+DEFAULT_CONTROL = False
+DEFAULT_CONTROL_NODES = ""
+DEFAULT_CONTROL_CO2_HIGH = 1000
+DEFAULT_CONTROL_CO2_LOW = 800
+DEFAULT_CONTROL_RH_HIGH = 80
+DEFAULT_CONTROL_RH_LOW = 70
+DEFAULT_CONTROL_STATE_HIGH = "MAN2"
+DEFAULT_CONTROL_STATE_LOW = "AUTO"
+DEFAULT_CONTROL_MIN_HOLD = 300
+
+# Options that add or remove entities or stores; changing them reloads the entry
+RELOAD_OPTIONS = frozenset({
+    CONF_ROLLING_STATISTICS, CONF_RESTORE_DATA, CONF_TREND_ANALYSIS, CONF_WRITE_QUEUE, CONF_ADVANCED_PARAMETERS,
+})
+
+# Config entry data
+CONF_CERT_FINGERPRINT = "cert_fingerprint"
+# The advanced_parameters value the entity registry was last synced to
+CONF_ADVANCED_PARAMETERS_SYNCED = "advanced_parameters_synced"
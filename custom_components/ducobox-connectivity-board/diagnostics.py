@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import time
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+
+from .const import DOMAIN
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]['coordinator']
+    entities = er.async_entries_for_config_entry(er.async_get(hass), entry.entry_id)
+
+    return {
+        'options': dict(entry.options),
+        'scheduler': coordinator.scheduler.stats(),
+        'transport': coordinator.tls.stats() if coordinator.tls is not None else None,
+        'clients': coordinator.clients.stats(),
+        'entities': {
+            'registered': len(entities),
+            'enabled': sum(1 for entity in entities if not entity.disabled),
+            'number': sum(1 for entity in entities if entity.domain == 'number'),
+            'number_enabled': sum(1 for entity in entities if entity.domain == 'number' and not entity.disabled),
+        },
+        'config_parameters': coordinator.config_index.stats(),
+        'zones': {
+            zone: {'nodes': sorted(node_ids), 'values': coordinator.zone_values.get(zone)}
+            for zone, node_ids in coordinator.zones.items()
+        },
+        'write_queue': coordinator.write_queue.stats() if coordinator.write_queue is not None else None,
+        'export': coordinator.exporter.stats() if coordinator.exporter is not None else None,
+        'trends': coordinator.trends.stats(time.time()) if coordinator.trends is not None else None,
+        'projection': coordinator.projection.stats() if coordinator.projected_requests else None,
+        'node_scheduling': coordinator.node_scheduler.stats() if coordinator.node_scheduler is not None else None,
+        'countdowns': coordinator.countdowns.stats() if coordinator.countdown_interval else None,
+        'history': coordinator.history_stats(),
+        'deadband': coordinator.deadband.stats(),
+        'statistics': {'pending_hourly_rows': coordinator.statistics.pending_rows()},
+        'control': coordinator.control.stats() if coordinator.control is not None else None,
+    }
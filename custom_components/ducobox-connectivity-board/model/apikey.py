@@ -0,0 +1,62 @@
+from importlib import metadata
+import logging
+
+_LOGGER = logging.getLogger(__name__)
+
+# DucoPy has no public API for its API key: its session keeps it in
+# api_key, api_key_timestamp and api_key_cache_duration, sends it as the
+# Api-Key header and refreshes it from the full /info in _ensure_apikey.
+# That state is only touched for the DucoPy versions it was checked against;
+# with any other version DucoPy manages the key and each client fetches its own.
+SUPPORTED_DUCOPY_VERSIONS = frozenset({'18'})
+
+_SESSION_ATTRIBUTES = ('api_key', 'api_key_timestamp', 'api_key_cache_duration', '_ensure_apikey', 'headers')
+
+
+def _ducopy_version() -> str | None:
+    try:
+        return metadata.version('ducopy')
+    except metadata.PackageNotFoundError:
+        return None
+
+
+DUCOPY_VERSION = _ducopy_version()
+
+
+def supports_apikey(client) -> bool:
+    """Whether the API key state of this client's session can be read and shared."""
+    if DUCOPY_VERSION not in SUPPORTED_DUCOPY_VERSIONS:
+        return False
+    session = getattr(getattr(client, 'client', None), 'session', None)
+    return session is not None and all(hasattr(session, name) for name in _SESSION_ATTRIBUTES)
+
+
+def log_unsupported() -> None:
+    _LOGGER.info(
+        f"DucoPy {DUCOPY_VERSION} is not known to keep its API key in the checked session state; "
+        "each client refreshes its own key"
+    )
+
+
+def get_apikey(client) -> tuple[str | None, float]:
+    """Return (key, timestamp) of the client's API key."""
+    session = client.client.session
+    return session.api_key, session.api_key_timestamp
+
+
+def set_apikey(client, key: str, timestamp: float) -> None:
+    """Hand an API key fetched by another client to this one."""
+    session = client.client.session
+    session.api_key = key
+    session.api_key_timestamp = timestamp
+    session.headers.update({'Api-Key': key})
+
+
+def apikey_cache_duration(client) -> float:
+    """Return the number of seconds DucoPy uses an API key before fetching a new one."""
+    return client.client.session.api_key_cache_duration
+
+
+def refresh_apikey(client) -> None:
+    """Refresh the client's API key if it expired; DucoPy reads the full /info for it."""
+    client.client.session._ensure_apikey()
@@ -0,0 +1,195 @@
+from collections.abc import Callable
+import logging
+import sys
+
+_LOGGER = logging.getLogger(__name__)
+
+ConfigKey = tuple[int, str]
+ConfigValue = tuple[int, int, int, int]
+
+# Tolerance when checking that a value is a whole number of steps above Min
+STEP_TOLERANCE = 1e-9
+
+# Commonly tuned /config/nodes parameters; all others are advanced
+COMMON_PARAMETERS = frozenset({
+    'FlowLvlAutoMin', 'FlowLvlAutoMax', 'FlowMax',
+    'FlowLvlMan1', 'FlowLvlMan2', 'FlowLvlMan3', 'TimeMan',
+    'Co2SetPoint', 'RhSetPoint',
+})
+
+
+def is_common_parameter(key: str) -> bool:
+    return key in COMMON_PARAMETERS
+
+
+def to_config_value(value: float) -> int | float:
+    """Return a validated value as sent in a PATCH: ints stay ints, integral floats become ints."""
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def is_number_parameter(value) -> bool:
+    """Return whether a /config/nodes value can be exposed as a number."""
+    return isinstance(value, dict) and 'Val' in value and 'Min' in value and 'Max' in value and 'Inc' in value
+
+
+class DucoboxConfigIndex:
+    """Flat (node_id, key) -> (val, min, max, inc) index over /config/nodes.
+
+    Updates only compare tuples per parameter, and listeners are called for
+    the entries that actually changed.
+
+    Only tracked parameters are diffed: the common ones, every parameter when
+    `track_all` is set, and advanced ones while a listener (an enabled
+    entity) follows them. The other parameters are only noted as present and
+    read from the latest payload when asked for.
+    """
+
+    def __init__(self, track_all: bool = True):
+        self.track_all = track_all
+        self._entries: dict[ConfigKey, ConfigValue] = {}
+        self._untracked: set[ConfigKey] = set()
+        self._nodes: dict[int, dict] = {}
+        self._listeners: dict[ConfigKey, list[Callable[[ConfigValue | None], None]]] = {}
+
+    def __contains__(self, key: ConfigKey) -> bool:
+        return key in self._entries or key in self._untracked
+
+    def __len__(self) -> int:
+        return len(self._entries) + len(self._untracked)
+
+    def _is_tracked(self, index_key: ConfigKey) -> bool:
+        return self.track_all or is_common_parameter(index_key[1]) or index_key in self._listeners
+
+    def _read(self, index_key: ConfigKey) -> ConfigValue | None:
+        value = self._nodes.get(index_key[0], {}).get(index_key[1])
+        if not is_number_parameter(value):
+            return None
+        return value['Val'], value['Min'], value['Max'], value['Inc']
+
+    def get(self, node_id: int, key: str) -> ConfigValue | None:
+        """Return the (val, min, max, inc) tuple for a parameter."""
+        index_key = (node_id, key)
+        entry = self._entries.get(index_key)
+        if entry is None and index_key in self._untracked:
+            return self._read(index_key)
+        return entry
+
+    def keys(self) -> list[ConfigKey]:
+        return [*self._entries, *sorted(self._untracked)]
+
+    def node_values(self) -> dict[int, dict[str, int]]:
+        """Return the current value of every parameter grouped per node."""
+        nodes: dict[int, dict[str, int]] = {}
+        for node_id, key in self.keys():
+            nodes.setdefault(node_id, {})[key] = self.get(node_id, key)[0]
+        return nodes
+
+    def validate(self, node_id: int, key: str, value: float) -> str | None:
+        """Return why `value` cannot be written to (node_id, key), or None if it can."""
+        entry = self.get(node_id, key)
+        if entry is None:
+            return f"unknown parameter {key} for node {node_id}"
+        _, minimum, maximum, step = entry
+        if not minimum <= value <= maximum:
+            return f"{value} is outside {minimum}..{maximum} for {key} of node {node_id}"
+        if step > 0:
+            steps = (value - minimum) / step
+            if abs(steps - round(steps)) > STEP_TOLERANCE:
+                return f"{value} is not {minimum} plus a multiple of {step} for {key} of node {node_id}"
+        return None
+
+    def update(self, config_nodes: dict | None) -> set[ConfigKey]:
+        """Apply a full /config/nodes payload and return the changed keys."""
+        seen: set[ConfigKey] = set()
+        changed: set[ConfigKey] = set()
+        self._untracked = set()
+        self._nodes = {}
+
+        for node in (config_nodes or {}).get('Nodes') or []:
+            changed |= self._apply_node(node, seen)
+
+        for key in self._entries.keys() - seen:
+            del self._entries[key]
+            changed.add(key)
+
+        self._notify(changed)
+        return changed
+
+    def update_node(self, config_node: dict | None) -> set[ConfigKey]:
+        """Apply a single /config/nodes/<id> payload and return the changed keys."""
+        if not config_node:
+            return set()
+
+        changed = self._apply_node(config_node, set())
+        self._notify(changed)
+        return changed
+
+    def _apply_node(self, node: dict, seen: set[ConfigKey]) -> set[ConfigKey]:
+        node_id = node.get('Node')
+        self._nodes[node_id] = node
+        changed = set()
+        for key, value in node.items():
+            if not is_number_parameter(value):
+                continue
+
+            index_key = (node_id, key)
+            if not self._is_tracked(index_key):
+                self._untracked.add(index_key)
+                continue
+
+            entry = (value['Val'], value['Min'], value['Max'], value['Inc'])
+            seen.add(index_key)
+            if self._entries.get(index_key) != entry:
+                self._entries[index_key] = entry
+                changed.add(index_key)
+        return changed
+
+    def add_listener(self, node_id: int, key: str, listener: Callable[[ConfigValue | None], None]) -> Callable[[], None]:
+        """Call `listener` with the new entry whenever (node_id, key) changes."""
+        index_key = (node_id, key)
+        self._listeners.setdefault(index_key, []).append(listener)
+        if index_key in self._untracked:
+            # Start diffing the parameter now that it is followed
+            self._untracked.discard(index_key)
+            self._entries[index_key] = self._read(index_key)
+
+        def remove_listener() -> None:
+            listeners = self._listeners.get(index_key, [])
+            if listener in listeners:
+                listeners.remove(listener)
+            if not listeners:
+                self._listeners.pop(index_key, None)
+                if index_key in self._entries and not self._is_tracked(index_key):
+                    del self._entries[index_key]
+                    self._untracked.add(index_key)
+
+        return remove_listener
+
+    def _notify(self, changed: set[ConfigKey]) -> None:
+        for index_key in changed:
+            entry = self._entries.get(index_key)
+            for listener in list(self._listeners.get(index_key, ())):
+                try:
+                    listener(entry)
+                except Exception as e:
+                    _LOGGER.error(f"Error notifying config listener for {index_key}: {e}")
+
+    def stats(self) -> dict:
+        """Return parameter counts and the approximate memory of the tracked entries."""
+        keys = self.keys()
+        advanced = sum(1 for _, key in keys if not is_common_parameter(key))
+        tracked_bytes = sys.getsizeof(self._entries) + sum(
+            sys.getsizeof(index_key) + sys.getsizeof(entry) for index_key, entry in self._entries.items()
+        )
+        return {
+            'track_all': self.track_all,
+            'parameters': len(keys),
+            'common': len(keys) - advanced,
+            'advanced': advanced,
+            'tracked': len(self._entries),
+            'untracked': len(self._untracked),
+            'followed': len(self._listeners),
+            'tracked_bytes': tracked_bytes,
+        }
@@ -0,0 +1,169 @@
+from ..const import (
+    CONF_CONTROL_NODES,
+    CONF_CONTROL_CO2_HIGH,
+    CONF_CONTROL_CO2_LOW,
+    CONF_CONTROL_RH_HIGH,
+    CONF_CONTROL_RH_LOW,
+    CONF_CONTROL_STATE_HIGH,
+    CONF_CONTROL_STATE_LOW,
+    CONF_CONTROL_MIN_HOLD,
+    DEFAULT_CONTROL_NODES,
+    DEFAULT_CONTROL_CO2_HIGH,
+    DEFAULT_CONTROL_CO2_LOW,
+    DEFAULT_CONTROL_RH_HIGH,
+    DEFAULT_CONTROL_RH_LOW,
+    DEFAULT_CONTROL_STATE_HIGH,
+    DEFAULT_CONTROL_STATE_LOW,
+    DEFAULT_CONTROL_MIN_HOLD,
+)
+from .snapshot import DucoboxSnapshot
+
+CONTROL_ACTION = 'SetVentilationState'
+
+
+class ControlRule:
+    """Demand on `key` starts at or above `high` and ends at or below `low`."""
+
+    __slots__ = ('key', 'high', 'low')
+
+    def __init__(self, key: str, high: float, low: float):
+        self.key = key
+        self.high = high
+        self.low = min(low, high)
+
+
+class _NodeControl:
+    __slots__ = ('active', 'changed_at', 'pending')
+
+    def __init__(self):
+        self.active = False
+        self.changed_at = float('-inf')
+        self.pending = False
+
+
+def parse_node_ids(value: str) -> frozenset[int] | None:
+    """Parse a comma separated list of node ids; empty means all nodes."""
+    node_ids = frozenset(int(part) for part in value.replace(' ', '').split(',') if part)
+    return node_ids or None
+
+
+class DucoboxControlEngine:
+    """Decide ventilation state changes from node CO₂ and humidity readings.
+
+    A node is in demand while any rule is active. Rules use hysteresis: a
+    rule activates when its value reaches `high` and releases when it drops to
+    `low`. A node's demand does not change again within `min_hold` seconds of
+    the previous change. Each change yields one (node_id, option) decision:
+    `state_high` when demand starts, `state_low` when it ends.
+    """
+
+    def __init__(
+        self,
+        rules: list[ControlRule],
+        state_high: str,
+        state_low: str,
+        min_hold: float,
+        node_ids: frozenset[int] | None = None,
+    ):
+        self.rules = rules
+        self.state_high = state_high
+        self.state_low = state_low
+        self.min_hold = min_hold
+        self.node_ids = node_ids
+        self._nodes: dict[int, _NodeControl] = {}
+        self.counters = {'evaluations': 0, 'decisions': 0, 'held': 0, 'failed': 0}
+        self.last_latency = None
+
+    @classmethod
+    def from_options(cls, options: dict) -> 'DucoboxControlEngine':
+        rules = []
+        for key, conf_high, conf_low, default_high, default_low in (
+            ('Co2', CONF_CONTROL_CO2_HIGH, CONF_CONTROL_CO2_LOW, DEFAULT_CONTROL_CO2_HIGH, DEFAULT_CONTROL_CO2_LOW),
+            ('Rh', CONF_CONTROL_RH_HIGH, CONF_CONTROL_RH_LOW, DEFAULT_CONTROL_RH_HIGH, DEFAULT_CONTROL_RH_LOW),
+        ):
+            high = float(options.get(conf_high, default_high))
+            # A threshold of 0 disables the rule
+            if high > 0:
+                rules.append(ControlRule(key, high, float(options.get(conf_low, default_low))))
+
+        return cls(
+            rules,
+            options.get(CONF_CONTROL_STATE_HIGH, DEFAULT_CONTROL_STATE_HIGH),
+            options.get(CONF_CONTROL_STATE_LOW, DEFAULT_CONTROL_STATE_LOW),
+            float(options.get(CONF_CONTROL_MIN_HOLD, DEFAULT_CONTROL_MIN_HOLD)),
+            parse_node_ids(options.get(CONF_CONTROL_NODES, DEFAULT_CONTROL_NODES)),
+        )
+
+    def _demand(self, node, active: bool) -> bool | None:
+        """Return the node's demand, or None if it reports none of the rule keys."""
+        demand = None
+        for rule in self.rules:
+            value = node.get(rule.key)
+            if value is None:
+                continue
+            threshold = rule.low if active else rule.high
+            rule_active = value > threshold if active else value >= threshold
+            demand = bool(demand) or rule_active
+        return demand
+
+    def evaluate(self, snapshot: DucoboxSnapshot, now: float, controllable: frozenset[int] | None = None) -> list[tuple[int, str]]:
+        """Return the (node_id, option) decisions for a fresh snapshot.
+
+        `now` is a monotonic timestamp; `controllable` limits the nodes to
+        those that accept the control action.
+        """
+        self.counters['evaluations'] += 1
+        decisions = []
+
+        for node in snapshot.nodes.values():
+            node_id = node.node_id
+            if self.node_ids is not None and node_id not in self.node_ids:
+                continue
+            if controllable is not None and node_id not in controllable:
+                continue
+
+            control = self._nodes.get(node_id)
+            if control is None:
+                control = self._nodes[node_id] = _NodeControl()
+            if control.pending:
+                continue
+
+            demand = self._demand(node, control.active)
+            if demand is None or demand == control.active:
+                continue
+
+            if now - control.changed_at < self.min_hold:
+                self.counters['held'] += 1
+                continue
+
+            control.active = demand
+            control.changed_at = now
+            control.pending = True
+            self.counters['decisions'] += 1
+            decisions.append((node_id, self.state_high if demand else self.state_low))
+
+        return decisions
+
+    def complete(self, node_id: int, success: bool, latency: float) -> None:
+        """Record the outcome of a decision; failed decisions are retried."""
+        control = self._nodes.get(node_id)
+        if control is None or not control.pending:
+            return
+        control.pending = False
+        self.last_latency = latency
+        if not success:
+            self.counters['failed'] += 1
+            control.active = not control.active
+            control.changed_at = float('-inf')
+
+    def stats(self) -> dict:
+        return {
+            'rules': [{'key': rule.key, 'high': rule.high, 'low': rule.low} for rule in self.rules],
+            'state_high': self.state_high,
+            'state_low': self.state_low,
+            'min_hold': self.min_hold,
+            'nodes': sorted(self.node_ids) if self.node_ids is not None else 'all',
+            'active_nodes': sorted(node_id for node_id, control in self._nodes.items() if control.active),
+            'counters': self.counters,
+            'last_latency': self.last_latency,
+        }
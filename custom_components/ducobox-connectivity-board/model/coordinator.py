@@ -1,59 +1,756 @@
+import asyncio
+from abc import abstractmethod
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+import json
+import logging
+import time
+from typing import Any
+
+from homeassistant.components.sensor import SensorEntity, SensorEntityDescription, SensorStateClass
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
     DataUpdateCoordinator,
     UpdateFailed,
 )
-from homeassistant.core import HomeAssistant
-from ..const import SCAN_INTERVAL
-from .devices import DucoboxSensorEntityDescription, DucoboxNodeSensorEntityDescription
-from .utils import safe_get
-from typing import Any
 from ducopy import DucoPy
-from ducopy.rest.models import ConfigNodeRequest
-import logging
-from homeassistant.components.sensor import SensorEntity
-from homeassistant.helpers.device_registry import DeviceInfo
-import time
-import json
+
+from ..const import DOMAIN, EVENT_SNAPSHOT
+
+from .apikey import refresh_apikey
+from .config_index import to_config_value
+from .control import CONTROL_ACTION
+from .countdown import DucoboxCountdowns, COUNTDOWN_KEY
+from .derived import compute_derived_metrics, DERIVED_SOURCES
+from .devices import (
+    DucoboxSensorEntityDescription,
+    DucoboxNodeSensorEntityDescription,
+    SENSORS,
+    DERIVED_SENSORS,
+    DERIVED_SENSOR_KEYS,
+    TREND_SENSOR_KEYS,
+    ROLLING_STATISTICS_KEYS,
+    node_sensor_descriptions,
+)
+from .options import DucoboxOptionsMixin, scan_interval
+from .presets import diff_preset
+from .projection import DucoboxInfoProjection, FULL_INFO, merge_info, payload_size
+from .restore import DucoboxRestoreStore
+from .ringbuffer import RingBuffer
+from .sampling import SampleWindow
+from .schema import compile_node_types, layout_fields
+from .schema_cache import DucoboxSchemaCache
+from .scheduler import (
+    PRIORITY_USER_WRITE,
+    PRIORITY_READ_BACK,
+    PRIORITY_LIVE_POLL,
+    PRIORITY_CONFIG_POLL,
+)
+from .snapshot import DucoboxSnapshot, BOX_LAYOUT, NODE_LAYOUT
+from .statistics import DucoboxStatisticsAccumulator
+from .transport import DucoboxCertificateMismatch, DucoboxClientPool, is_retryable_write_error
+from .trend_store import DucoboxTrendStore
+from .trends import TREND_SOURCES
+from .utils import safe_get
+from .write_queue import DucoboxWriteQueue
+from .zones import compute_zone_aggregates
 
 
 _LOGGER = logging.getLogger(__name__)
 
-class DucoboxCoordinator(DataUpdateCoordinator):
+
+class DucoboxCoordinator(DucoboxOptionsMixin, DataUpdateCoordinator):
     """Coordinator to manage data updates for Ducobox sensors."""
 
-    def __init__(self, hass: HomeAssistant, duco_client: DucoPy):
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        duco_client: DucoPy,
+        options: dict | None = None,
+        schema_cache: DucoboxSchemaCache | None = None,
+        restore_store: DucoboxRestoreStore | None = None,
+        trend_store: DucoboxTrendStore | None = None,
+        write_queue: DucoboxWriteQueue | None = None,
+        client_factory: Callable[[], DucoPy] | None = None,
+    ):
         super().__init__(
             hass,
             _LOGGER,
             name="Ducobox Connectivity Board",
-            update_interval=SCAN_INTERVAL,
+            update_interval=scan_interval(options or {}),
         )
 
+        self._init_options(options or {})
         self.duco_client = duco_client
+        self.tls = None
+        self.transport = None
+        self.history: dict[tuple[int | None, str], RingBuffer] = {}
+        self.sample_window = SampleWindow()
+        self._sampling = False
+        self._sample_unsub: Callable[[], None] | None = None
+        self.countdowns = DucoboxCountdowns()
+        self._countdown_unsub: Callable[[], None] | None = None
+        self._countdown_listeners: dict[int, list[Callable[[], None]]] = {}
+        self._countdown_ticking: set[int] = set()
+        self.statistics = DucoboxStatisticsAccumulator(sampling=bool(self._sample_interval))
+        self._statistic_descriptions = {}
+        self.values: dict = {}
+        self._event_values: dict = {}
+        self._controllable: frozenset[int] | None = None
+        self.schema_cache = schema_cache
+        self._schema_sw_version = None
+        self.node_schema: dict[str, list[dict]] = {}
+        self.node_sensors: dict[str, list[DucoboxNodeSensorEntityDescription]] = {}
+        self._node_layout = NODE_LAYOUT
+        self.restore_store = restore_store
+        self.last_good_update: float | None = None
+        self.trend_store = trend_store
+        self.trends = trend_store.analyzer if trend_store is not None else None
+        self.zone_values: dict[str, dict] = {}
+        self.write_queue = write_queue
+        self._draining = False
+        self._drain_retry: Callable[[], None] | None = None
+        self._export_lock = asyncio.Lock()
+        # Entities register their /info sections even while projection is off,
+        # so it can be switched on without re-adding them
+        self.projection = DucoboxInfoProjection()
+        self._full_info_response = None
+        self._client_factory = client_factory
+        duco_client.client.session.hooks['response'].append(self._capture_full_info)
+        self.clients = DucoboxClientPool(duco_client, self._create_client)
         self._static_data = None
 
-    async def _async_update_data(self) -> dict:
+    def _create_client(self) -> DucoPy:
+        """Create another client for concurrent requests."""
+        client = self._client_factory()
+        client.client.session.hooks['response'].append(self._capture_full_info)
+        return client
+
+    async def _async_request(self, priority: int, func, *args):
+        """Run a blocking DucoPy call, `func(client, *args)`, once the scheduler grants a slot.
+
+        Each call gets a client of its own, because a requests session must
+        not be used by several executor threads at once.
+        """
+        async with self.scheduler.slot(priority):
+            client = self.clients.checkout()
+            try:
+                return await self.hass.async_add_executor_job(func, client, *args)
+            finally:
+                self.clients.checkin(client)
+
+    async def _async_update_data(self) -> DucoboxSnapshot:
         """Fetch data from the Ducobox API."""
         try:
-            return await self.hass.async_add_executor_job(self._fetch_data)
+            data = await self._fetch_data()
+        except DucoboxCertificateMismatch as e:
+            raise ConfigEntryAuthFailed(str(e)) from e
         except Exception as e:
             _LOGGER.error("Failed to fetch data from Ducobox API: %s", e)
             raise UpdateFailed(f"Failed to fetch data from Ducobox API: {e}") from e
 
+        if self._sample_interval:
+            # Publish the aggregate over everything sampled since the last publication
+            self.sample_window.add(data)
+            if self._external_statistics:
+                # The poll is a raw sample too; its published aggregate is left out of the statistics
+                self._add_statistics_samples(self._build_sample_snapshot(data))
+            data = self.sample_window.apply(data, self._sample_aggregate)
+            self.sample_window.reset()
+
+        if self.trends is not None:
+            self.trends.update(time.time(), data['info'], data['nodes'])
+            self.trend_store.save()
+
+        snapshot = self._build_snapshot(data)
+        self.last_good_update = time.time()
+        self.countdowns.update(
+            snapshot,
+            time.monotonic(),
+            self.node_scheduler.fetched_at if self.node_scheduler is not None else None,
+        )
+        if self.restore_store is not None:
+            self.restore_store.save(self.last_good_update, data, self._static_data['action_nodes'])
+        if self.exporter is not None:
+            self._async_export(data, snapshot)
+        self.values = self._extract_values(snapshot)
+        if self.zones:
+            self.zone_values = compute_zone_aggregates(snapshot, self.zones)
+        self._update_history(self.values)
+        if self._external_statistics:
+            self._async_import_statistics(snapshot)
+        if self._snapshot_event:
+            self._async_fire_snapshot_event(snapshot, self.values)
+        if self.control is not None:
+            self._async_run_control(snapshot)
+        if self.write_queue and not self._draining:
+            # The board answers again: send the queued writes now instead of after the backoff
+            self._async_schedule_drain(0)
+        return snapshot
+
+    def _build_snapshot(self, data: dict) -> DucoboxSnapshot:
+        """Build the snapshot of one poll from its raw payloads."""
+        self._update_schema(data['info'], data['nodes'])
+        derived = compute_derived_metrics(data['info'])
+        if self.trends is not None:
+            derived.update(self.trends.metrics(time.time()))
+        return DucoboxSnapshot.build(
+            data['info'],
+            data['nodes'],
+            derived=derived,
+            action_nodes=self._static_data['action_nodes'],
+            previous=self.data,
+            node_layout=self._node_layout,
+        )
+
+    async def async_restore(self) -> bool:
+        """Serve the payloads saved by the restore store until the board responds.
+
+        Used when the first refresh fails; returns whether saved data was found.
+        """
+        if self.restore_store is None:
+            return False
+
+        saved = await self.restore_store.async_load()
+        if saved is None:
+            return False
+
+        self._static_data = {'action_nodes': saved['action_nodes']}
+        self.config_index.update(saved['config_nodes'])
+        self.data = self._build_snapshot(saved)
+        self.values = self._extract_values(self.data)
+        if self.zones:
+            self.zone_values = compute_zone_aggregates(self.data, self.zones)
+        self.last_good_update = saved['time']
+        _LOGGER.warning(f"Board unreachable, serving data saved {self.data_age():.0f} seconds ago")
+        return True
+
+    def data_age(self) -> float | None:
+        """Return the number of seconds since the last successful poll."""
+        if self.last_good_update is None:
+            return None
+        return time.time() - self.last_good_update
+
+    @property
+    def is_stale(self) -> bool:
+        """Whether the latest poll failed and the last good data is being served."""
+        return not self.last_update_success and self.data is not None
+
+    @property
+    def data_available(self) -> bool:
+        """Whether entities are available: the last poll succeeded or failed within the grace period."""
+        if self.last_update_success:
+            return True
+        age = self.data_age()
+        return self.data is not None and age is not None and age < self._availability_grace
+
+    def stale_attributes(self) -> dict | None:
+        """Return the staleness attributes for entities while last good data is served."""
+        if not self.is_stale or self.last_good_update is None:
+            return None
+        return {
+            'stale': True,
+            'stale_age': int(self.data_age()),
+            'last_good_update': datetime.fromtimestamp(self.last_good_update, tz=timezone.utc).isoformat(),
+        }
+
+    def _update_schema(self, info: dict, nodes: list[dict]) -> None:
+        """Compile the fields of node types seen for the first time.
+
+        Node types already compiled for the board's firmware are taken from the
+        schema cache instead of being introspected again.
+        """
+        sw_version = safe_get(info, 'General', 'Board', 'SwVersionBox', 'Val')
+        if sw_version != self._schema_sw_version:
+            self._schema_sw_version = sw_version
+            self.node_schema = {}
+
+        node_types = {
+            safe_get(node, 'General', 'Type', 'Val') or 'Unknown' for node in nodes
+        } - self.node_schema.keys()
+        if not node_types:
+            return
+
+        cached = {}
+        if self.schema_cache is not None:
+            for node_type in node_types:
+                fields = self.schema_cache.get(sw_version, node_type)
+                if fields is not None:
+                    cached[node_type] = fields
+
+        missing = node_types - cached.keys()
+        compiled = compile_node_types(nodes, missing) if missing else {}
+        if compiled and self.schema_cache is not None:
+            self.schema_cache.set(sw_version, compiled)
+
+        _LOGGER.debug(
+            f"Node schema for firmware {sw_version}: cached {sorted(cached)}, compiled {sorted(compiled)}"
+        )
+
+        self.node_schema.update(cached)
+        self.node_schema.update(compiled)
+        for node_type in node_types:
+            self.node_sensors[node_type] = node_sensor_descriptions(node_type, self.node_schema.get(node_type, []))
+        self._node_layout = NODE_LAYOUT.extend(layout_fields(self.node_schema))
+
+    def _controllable_nodes(self, snapshot: DucoboxSnapshot) -> frozenset[int]:
+        """Return the nodes whose ventilation state action accepts both control states."""
+        if self._controllable is None:
+            states = {self.control.state_high, self.control.state_low}
+            self._controllable = frozenset(
+                node['Node']
+                for node in (snapshot.action_nodes or {}).get('Nodes') or []
+                for action in node.get('Actions', [])
+                if action.get('Action') == CONTROL_ACTION and states <= set(action.get('Enum') or [])
+            )
+        return self._controllable
+
+    @callback
+    def _async_run_control(self, snapshot: DucoboxSnapshot) -> None:
+        """Evaluate the control rules and send the resulting state changes."""
+        started = time.monotonic()
+        for node_id, option in self.control.evaluate(snapshot, started, self._controllable_nodes(snapshot)):
+            _LOGGER.debug(f"Control: setting node {node_id} to {option}")
+            self.hass.async_create_task(self._async_apply_control(node_id, option, started))
+
+    async def _async_apply_control(self, node_id: int, option: str, started: float) -> None:
+        """Send a control action directly; a write the board did not take is a failure.
+
+        Control actions bypass the write queue: replayed hours later they
+        would act on stale readings, while a failure lets the engine revert
+        its state and retry on the next evaluation.
+        """
+        try:
+            await self._async_send_action(node_id, option, CONTROL_ACTION)
+            success = True
+        except Exception:
+            success = False
+        self.control.complete(node_id, success, time.monotonic() - started)
+
+    @callback
+    def _async_fire_snapshot_event(self, snapshot: DucoboxSnapshot, values: dict) -> None:
+        """Fire one event carrying every value that changed since the previous refresh."""
+        full = not self._event_values
+        box = {}
+        nodes = {}
+        units = {}
+        for (node_id, key), (description, value) in values.items():
+            if not full and self._event_values.get((node_id, key)) == value:
+                continue
+            if node_id is None:
+                box[key] = value
+            else:
+                nodes.setdefault(str(node_id), {})[key] = value
+            if description.native_unit_of_measurement:
+                units[key] = description.native_unit_of_measurement
+
+        self._event_values = {index_key: value for index_key, (_, value) in values.items()}
+        if not box and not nodes:
+            return
+
+        payload = json.dumps({
+            't': round(time.time(), 3),
+            'full': full,
+            'box': box,
+            'nodes': nodes,
+            'units': units,
+        }, separators=(',', ':'))
+
+        self.hass.bus.async_fire(EVENT_SNAPSHOT, {
+            'device_id': snapshot.board.device_id,
+            'changed': len(box) + sum(len(node) for node in nodes.values()),
+            'payload': payload,
+        })
+
+    @callback
+    def async_start_sampling(self) -> Callable[[], None]:
+        """Start sampling live data between publications; returns a stop callback."""
+        self._async_restart_sampling()
+
+        @callback
+        def stop() -> None:
+            if self._sample_unsub is not None:
+                self._sample_unsub()
+                self._sample_unsub = None
+
+        return stop
+
+    @callback
+    def _async_restart_sampling(self) -> None:
+        if self._sample_unsub is not None:
+            self._sample_unsub()
+            self._sample_unsub = None
+        self.sample_window.reset()
+        if self._sample_interval:
+            self._sample_unsub = async_track_time_interval(
+                self.hass, self._async_sample, timedelta(seconds=self._sample_interval)
+            )
+
+    @callback
+    def async_start_countdowns(self) -> Callable[[], None]:
+        """Start publishing the interpolated countdown timers; returns a stop callback."""
+        self._async_restart_countdowns()
+
+        @callback
+        def stop() -> None:
+            if self._countdown_unsub is not None:
+                self._countdown_unsub()
+                self._countdown_unsub = None
+
+        return stop
+
+    @callback
+    def _async_restart_countdowns(self) -> None:
+        if self._countdown_unsub is not None:
+            self._countdown_unsub()
+            self._countdown_unsub = None
+        self._countdown_ticking = set()
+        if self.countdown_interval:
+            self._countdown_unsub = async_track_time_interval(
+                self.hass, self._async_tick_countdowns, timedelta(seconds=self.countdown_interval)
+            )
+
+    @callback
+    def async_add_countdown_listener(self, node_id: int, update_callback: Callable[[], None]) -> Callable[[], None]:
+        """Call `update_callback` on every countdown tick while the node's timer runs."""
+        listeners = self._countdown_listeners.setdefault(node_id, [])
+        listeners.append(update_callback)
+
+        @callback
+        def remove() -> None:
+            listeners.remove(update_callback)
+            if not listeners:
+                del self._countdown_listeners[node_id]
+
+        return remove
+
+    @callback
+    def _async_tick_countdowns(self, now=None) -> None:
+        """Publish the interpolated timers without a request to the board."""
+        if not self.data_available:
+            return
+        ticking = set(self.countdowns.running(time.monotonic()))
+        # Nodes whose timer ran out since the last tick publish their final 0
+        for node_id in ticking | self._countdown_ticking:
+            for update_callback in list(self._countdown_listeners.get(node_id, ())):
+                update_callback()
+        self._countdown_ticking = ticking
+
+    async def _async_sample(self, now=None) -> None:
+        """Add one sample of /info and /info/nodes to the sample window."""
+        if self._sampling:
+            return
+
+        self._sampling = True
+        try:
+            data = await self._fetch_live_data(sample=True)
+            self.sample_window.add(data)
+            if self._external_statistics or self.control is not None:
+                snapshot = self._build_sample_snapshot(data)
+            if self._external_statistics:
+                self._add_statistics_samples(snapshot)
+            if self.control is not None:
+                # React to fresh readings without waiting for the next publication
+                self._async_run_control(snapshot)
+        except Exception as e:
+            _LOGGER.debug(f"Failed to sample Ducobox live data: {e}")
+        finally:
+            self._sampling = False
+
+    def _build_sample_snapshot(self, data: dict) -> DucoboxSnapshot:
+        """Build a snapshot of raw sampled payloads, outside the published snapshots."""
+        return DucoboxSnapshot.build(
+            data['info'],
+            data['nodes'],
+            derived=compute_derived_metrics(data['info']),
+            previous=self.data,
+            node_layout=self._node_layout,
+        )
+
+    def _add_statistics_samples(self, snapshot: DucoboxSnapshot) -> None:
+        """Add the raw values of a sample to the statistics accumulator."""
+        now = time.time()
+        for node_id, description, value in self._iter_numeric_values(self._extract_values(snapshot)):
+            key = (node_id, description.key)
+            self._statistic_descriptions[key] = description
+            self.statistics.add(key, now, value)
+
+    @callback
+    def _async_export(self, data: dict, snapshot: DucoboxSnapshot) -> None:
+        """Buffer the payloads of this poll and write the buffer in the background when due."""
+        now = time.time()
+        self.exporter.add(now, snapshot.board.device_id, data)
+        if not self._export_lock.locked() and self.exporter.should_flush(now):
+            self.hass.async_create_task(self.async_flush_export())
+
+    async def async_flush_export(self) -> None:
+        """Write the buffered export records in the executor, after any write already running."""
+        async with self._export_lock:
+            if self.exporter is None:
+                return
+            # Take the records on the event loop, where `add` appends to the buffer
+            records = self.exporter.take()
+            if records:
+                await self.hass.async_add_executor_job(self.exporter.write, records)
+
+    async def async_close(self) -> None:
+        """Write the pending export records and close the sessions of every client."""
+        await self.async_flush_export()
+        clients = self.clients.close()
+
+        def close_clients() -> None:
+            for client in clients:
+                client.close()
+
+        await self.hass.async_add_executor_job(close_clients)
+
+    def _extract_values(self, snapshot: DucoboxSnapshot) -> dict:
+        """Run every sensor description once over a snapshot.
+
+        Returns {(node_id, key): (description, value)} for all values that are
+        present; node_id is None for box-level sensors.
+        """
+        values = {}
+
+        def extract(node_id, description, source):
+            try:
+                value = description.value_fn(source)
+            except Exception:
+                return
+            if value is not None:
+                values[(node_id, description.key)] = (description, value)
+
+        for description in (*SENSORS, *DERIVED_SENSORS):
+            extract(None, description, snapshot)
+
+        for node in snapshot.nodes.values():
+            for description in self.node_sensors.get(node.node_type, []):
+                extract(node.node_id, description, node)
+
+        return values
+
+    @staticmethod
+    def _iter_numeric_values(values: dict):
+        """Yield (node_id, description, value) for the numeric measurement sensors."""
+        for (node_id, key), (description, value) in values.items():
+            if key not in ROLLING_STATISTICS_KEYS:
+                continue
+            if not isinstance(value, (int, float)) or isinstance(value, bool):
+                continue
+            yield node_id, description, value
+
+    def _update_history(self, values: dict) -> None:
+        """Append this poll's numeric sensor values to their ring buffers."""
+        now = time.monotonic()
+        wall_now = time.time()
+
+        for node_id, description, value in self._iter_numeric_values(values):
+            history_key = (node_id, description.key)
+            buffer = self.history.get(history_key)
+            if buffer is None:
+                buffer = self.history[history_key] = RingBuffer(self._history_size)
+            buffer.append(now, value)
+
+            if self._external_statistics:
+                self._statistic_descriptions[history_key] = description
+                self.statistics.add_published(history_key, wall_now, value)
+
+    @callback
+    def _async_import_statistics(self, snapshot: DucoboxSnapshot) -> None:
+        """Import completed hourly aggregates as external statistics in one batch per sensor."""
+        if 'recorder' not in self.hass.config.components:
+            return
+
+        hours = self.statistics.pop_hours()
+        if not hours:
+            return
+
+        from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+        from homeassistant.components.recorder.statistics import async_add_external_statistics
+
+        device_id = snapshot.board.device_id
+
+        for (node_id, key), rows in hours.items():
+            description = self._statistic_descriptions.get((node_id, key))
+            if description is None:
+                continue
+
+            node_part = 'box' if node_id is None else f'node{node_id}'
+            metadata = StatisticMetaData(
+                has_mean=True,
+                has_sum=False,
+                name=f"{device_id} {node_part} {description.name}",
+                source=DOMAIN,
+                statistic_id=f"{DOMAIN}:{device_id}_{node_part}_{key.lower()}",
+                unit_of_measurement=description.native_unit_of_measurement,
+            )
+            statistics = [
+                StatisticData(
+                    start=datetime.fromtimestamp(start, tz=timezone.utc),
+                    mean=mean,
+                    min=min_value,
+                    max=max_value,
+                )
+                for start, mean, min_value, max_value in rows
+            ]
+            async_add_external_statistics(self.hass, metadata, statistics)
+
+        _LOGGER.debug(f"Imported {sum(len(rows) for rows in hours.values())} hourly statistics rows")
+
+    def history_stats(self) -> dict:
+        """Return the number of ring buffers and their total sample storage."""
+        return {
+            'buffers': len(self.history),
+            'window': self._history_size,
+            'bytes': sum(buffer.nbytes for buffer in self.history.values()),
+        }
+
     async def _async_setup(self) -> None:
         """Do initialization logic."""
-        self._static_data = await self.hass.async_add_executor_job(self._fetch_once_data)
+        self._static_data = await self._fetch_once_data()
 
-    def _fetch_once_data(self) -> dict:
+    async def _fetch_once_data(self) -> dict:
         data = {}
-        node_actions = self.duco_client.raw_get('/action/nodes')
+        node_actions = await self._async_request(
+            PRIORITY_CONFIG_POLL, DucoPy.raw_get, '/action/nodes'
+        )
         data['action_nodes'] = node_actions
         _LOGGER.debug(f"Data received from /action/nodes = {node_actions}")
 
         return data
 
-    def _fetch_data(self) -> dict:
+    async def _fetch_live_data(self, sample: bool = False) -> dict:
+        """Fetch the live sensor payloads from /info and /info/nodes.
+
+        Samples fetch the full node list outside the per-node schedule, which
+        only follows the publishing polls.
+        """
+        data = {}
+        data['info'] = await self._fetch_info()
+        _LOGGER.debug(f"Data received from /info: {data}")
+
+        data['nodes'] = await (self._fetch_all_nodes() if sample else self._fetch_nodes())
+        return data
+
+    def _capture_full_info(self, response, *args, **kwargs):
+        """Response hook keeping the last full /info, which DucoPy also fetches to refresh its API key."""
+        if response.request.method == 'GET' and response.request.path_url == '/info':
+            self._full_info_response = response
+
+    async def _fetch_info(self) -> dict:
+        """Fetch /info, narrowed to the sections enabled entities read when projection is on."""
+        plan = None
+        if self.projected_requests:
+            reason = self._projection_inactive_reason()
+            if reason != self.projection.inactive_reason:
+                self.projection.inactive_reason = reason
+                if reason is not None:
+                    _LOGGER.warning(f"Projected requests are inactive: {reason}")
+            if reason is None:
+                plan = self.projection.plan()
+
+        if plan is None:
+            info = await self._async_request(PRIORITY_LIVE_POLL, DucoPy.get_info)
+            self.projection.record_full(payload_size(info))
+            return info
+
+        self._full_info_response = None
+        if self.clients.apikey_due():
+            # The key refresh fetches the full /info anyway: refresh it on its own and use that payload
+            await self._async_request(PRIORITY_LIVE_POLL, refresh_apikey)
+            response, self._full_info_response = self._full_info_response, None
+            if response is not None:
+                info = response.json()
+                self.projection.record_apikey(payload_size(info))
+                return info
+
+        parts = await asyncio.gather(
+            *(self._async_request(PRIORITY_LIVE_POLL, DucoPy.get_info, *projection) for projection in plan)
+        )
+        info = merge_info(parts)
+        response, self._full_info_response = self._full_info_response, None
+        # A key that expired during the requests still cost a full /info
+        self.projection.record_projected(
+            payload_size(info), len(response.content) if response is not None else 0
+        )
+        return info
+
+    def _projection_inactive_reason(self) -> str | None:
+        """Return why projected requests save nothing with the current intervals, or None.
+
+        DucoPy refreshes its API key from a full /info once the key is older
+        than its cache duration; when /info is not fetched more often than
+        that, every fetch needs the full /info for the key anyway.
+        """
+        duration = self.clients.apikey_cache_duration()
+        interval = self._sample_interval or self.update_interval.total_seconds()
+        if duration is None or interval < duration:
+            return None
+        return (
+            f"/info is fetched every {interval:.0f} seconds, which is not more often than DucoPy's "
+            f"{duration:.0f} second API key lifetime, so every fetch reads the full /info for the key"
+        )
+
+    @callback
+    def async_require_info(self, key: str) -> Callable[[], None]:
+        """Register the /info sections a box sensor reads; returns the release callback."""
+        if key in BOX_LAYOUT.index:
+            sources = [BOX_LAYOUT.fields[BOX_LAYOUT.index[key]][1][:2]]
+        elif key in DERIVED_SENSOR_KEYS:
+            sources = list(DERIVED_SOURCES)
+        elif key in TREND_SENSOR_KEYS:
+            sources = list(TREND_SOURCES)
+        else:
+            sources = [FULL_INFO]
+        return self.projection.require(sources)
+
+    async def _fetch_nodes(self) -> list[dict]:
+        """Fetch /info/nodes, or only the nodes that are due when per-node scheduling is on."""
+        now = time.monotonic()
+        due = self.node_scheduler.due(now) if self.node_scheduler is not None else None
+
+        if due is None:
+            nodes = await self._fetch_all_nodes()
+            if self.node_scheduler is not None:
+                self.node_scheduler.full_refresh(nodes, now)
+            return nodes
+
+        responses = await asyncio.gather(
+            *(self._async_request(PRIORITY_LIVE_POLL, DucoPy.get_node_info, node_id) for node_id in due),
+            return_exceptions=True,
+        )
+        for node_id, response in zip(due, responses):
+            if isinstance(response, Exception):
+                # Keep the previous payload; the node stays due for the next poll
+                _LOGGER.debug(f"Failed to fetch /info/nodes/{node_id}: {response}")
+                self.node_scheduler.failed()
+                continue
+            self.node_scheduler.update(response.dict(), now)
+
+        _LOGGER.debug(f"Refreshed nodes {due} through /info/nodes/<id>")
+        return self.node_scheduler.nodes()
+
+    async def _fetch_all_nodes(self) -> list[dict]:
+        """Fetch every node in one /info/nodes request."""
+        nodes_response = await self._async_request(PRIORITY_LIVE_POLL, DucoPy.get_nodes)
+        _LOGGER.debug(f"Data received from /info/nodes: {nodes_response}")
+
+        if nodes_response and hasattr(nodes_response, 'Nodes'):
+            return [node.dict() for node in nodes_response.Nodes]
+        return []
+
+    def _node_type_has_sensors(self, node_type: str) -> bool:
+        """Whether the schema of a node type has sensor values; unknown types are assumed to."""
+        fields = self.node_schema.get(node_type)
+        if fields is None:
+            return True
+        return any(field['path'][0] == 'Sensor' for field in fields)
+
+    async def _fetch_data(self) -> dict:
         duco_client = self.duco_client
 
         data = {}
@@ -62,59 +759,304 @@ class DucoboxCoordinator(DataUpdateCoordinator):
             raise Exception("Duco client is not initialized")
 
         try:
-            data['info'] = duco_client.get_info()
-            _LOGGER.debug(f"Data received from /info: {data}")
+            data.update(await self._fetch_live_data())
 
-            nodes_response = duco_client.get_nodes()
-            _LOGGER.debug(f"Data received from /info/nodes: {nodes_response}")
-
-            if nodes_response and hasattr(nodes_response, 'Nodes'):
-                data['nodes'] = [node.dict() for node in nodes_response.Nodes]
-            else:
-                data['nodes'] = []
-
-            config_nodes = duco_client.raw_get('/config/nodes')
+            config_nodes = await self._async_request(
+                PRIORITY_CONFIG_POLL, DucoPy.raw_get, '/config/nodes'
+            )
             data['config_nodes'] = config_nodes
             _LOGGER.debug(f"Data received from /config/nodes = {data['config_nodes']}")
+            self.config_index.update(config_nodes)
 
-            data['mappings'] = {'node_id_to_name': {}, 'node_id_to_type': {}}
-            for node in data['nodes']:
-                node_id = node.get('Node')
-                node_type = safe_get(node, 'General', 'Type', 'Val') or 'Unknown'
-                node_name = f"{node_id}:{node_type}"
-
-                data['mappings']['node_id_to_name'][node_id] = node_name
-                data['mappings']['node_id_to_type'][node_id] = node_type
-
-
-            return {**data, **self._static_data}
+            return data
         except Exception as e:
             _LOGGER.error("Error fetching data from Ducobox API: %s", e)
             raise e
 
+    async def _async_read_back_config_node(self, node_id) -> None:
+        """Re-read the config of a single node after a write."""
+        config_node = await self._async_request(
+            PRIORITY_READ_BACK, DucoPy.raw_get, f'/config/nodes/{node_id}'
+        )
+
+        self.config_index.update_node(config_node)
+
     async def async_set_value(self, node_id, key, value):
-        """Send an update to the device."""
+        """Send an update to the device, or queue it while the board is unreachable."""
+        await self.async_set_or_queue_values(node_id, {key: value})
+
+    async def async_set_or_queue_values(self, node_id, values: dict) -> bool:
+        """Send several parameters of one node, or queue them; returns False when queued."""
+        # Invalid values are refused here rather than dropped once the queue is sent
+        self._validate_values(node_id, values)
+
+        def put() -> None:
+            for key, value in values.items():
+                self.write_queue.put_value(node_id, key, value)
+
+        return await self._async_write_or_queue(lambda: self.async_set_values(node_id, values), put)
+
+    async def _async_write_or_queue(self, send, put) -> bool:
+        """Run `send`; with the write queue on, `put` the write in the queue when the board cannot be reached.
+
+        While earlier writes are queued, new ones are queued behind them
+        without a request, so they reach the board in order. Returns False
+        when the write was queued instead of sent.
+        """
+        if self.write_queue is None:
+            await send()
+            return True
+
+        if self.write_queue:
+            put()
+            _LOGGER.info(f"Queued write behind {len(self.write_queue) - 1} earlier writes")
+            return False
+
+        try:
+            await send()
+        except Exception as e:
+            if not is_retryable_write_error(e):
+                raise
+            put()
+            delay = self.write_queue.failed()
+            _LOGGER.warning(f"Board unreachable, queued the write and retrying in {delay:.0f} seconds: {e}")
+            self._async_schedule_drain(delay)
+            return False
+        return True
+
+    @callback
+    def async_start_write_queue(self) -> Callable[[], None]:
+        """Send the writes queued before a restart; returns a callback that cancels pending retries."""
+        if self.write_queue is None:
+            return lambda: None
+
+        if self.write_queue:
+            self._async_schedule_drain(0)
+
+        @callback
+        def stop() -> None:
+            if self._drain_retry is not None:
+                self._drain_retry()
+                self._drain_retry = None
+
+        return stop
+
+    @callback
+    def _async_schedule_drain(self, delay: float) -> None:
+        if self._drain_retry is not None:
+            self._drain_retry()
+        self._drain_retry = async_call_later(self.hass, delay, self._async_drain_writes)
+
+    async def _async_drain_writes(self, now=None) -> None:
+        """Send the queued writes in order; stops and backs off when the board cannot be reached."""
+        self._drain_retry = None
+        if self._draining:
+            return
+
+        self._draining = True
+        try:
+            while (item := self.write_queue.peek()) is not None:
+                try:
+                    if 'key' in item:
+                        await self.async_set_values(item['node'], {item['key']: item['value']})
+                    else:
+                        await self._async_send_action(item['node'], item['option'], item['action'])
+                except DucoboxCertificateMismatch as e:
+                    # Keep the writes for the board; the next poll asks to re-pin its certificate
+                    _LOGGER.error(f"Stopped sending {len(self.write_queue)} queued writes: {e}")
+                    return
+                except Exception as e:
+                    if is_retryable_write_error(e):
+                        delay = self.write_queue.failed()
+                        _LOGGER.warning(
+                            f"Board unreachable, retrying {len(self.write_queue)} queued writes "
+                            f"in {delay:.0f} seconds: {e}"
+                        )
+                        self._async_schedule_drain(delay)
+                        return
+                    _LOGGER.error(f"Dropped queued write {item}: {e}")
+                    self.write_queue.done(item, sent=False)
+                else:
+                    self.write_queue.done(item)
+        finally:
+            self._draining = False
+
+    def _validate_values(self, node_id, values: dict) -> None:
+        """Raise ValueError if a value cannot be written to its parameter."""
+        errors = [
+            error for key, value in values.items()
+            if (error := self.config_index.validate(node_id, key, value)) is not None
+        ]
+        if errors:
+            raise ValueError('; '.join(errors))
+
+    async def async_set_values(self, node_id, values: dict):
+        """Send several parameters of one node in a single PATCH.
+
+        Raises ValueError without sending anything if a value is unknown,
+        out of range or not on the parameter's step.
+        """
+        self._validate_values(node_id, values)
         try:
             data = json.dumps({
-                key: {'Val': int(round(value, 0))},
+                key: {'Val': to_config_value(value)} for key, value in values.items()
             }, separators=(',', ':'))
 
-            logging.error(str(data))
-            logging.error(f'/config/nodes/{node_id}')
+            _LOGGER.debug(f"PATCH /config/nodes/{node_id}: {data}")
             # Use the DucoPy client to update the configuration
-            await self.hass.async_add_executor_job(
-                self.duco_client.raw_patch, f'/config/nodes/{node_id}', data
+            await self._async_request(
+                PRIORITY_USER_WRITE, DucoPy.raw_patch, f'/config/nodes/{node_id}', data
             )
 
-            _LOGGER.info(f"Successfully set value for node {node_id}, key {key} to {value}")
+            _LOGGER.info(f"Successfully set values for node {node_id}: {values}")
         except Exception as e:
-            _LOGGER.error(f"Failed to set value for node {node_id}, key {key}: {e}")
+            _LOGGER.error(f"Failed to set values for node {node_id}, keys {list(values)}: {e}")
             raise
 
-    async def async_set_ventilation_state(self, node_id, option, action):
         try:
-            await self.hass.async_add_executor_job(
-                self.duco_client.change_action_node, action, option, node_id
+            await self._async_read_back_config_node(node_id)
+        except Exception as e:
+            _LOGGER.warning(f"Failed to read back config for node {node_id}: {e}")
+
+    async def async_set_many(self, items: list[dict]) -> dict:
+        """Apply (node, key, value) and (node, action, option) items.
+
+        Config items are combined into one PATCH per node and actions follow
+        in order; nodes run concurrently, bounded by the request scheduler.
+        Items go through the write queue like entity writes, so they never
+        overtake queued writes; queued items are reported as `queued`, not
+        as succeeded. Returns a result per item, in the order of `items`.
+        """
+        started = time.monotonic()
+        results: list[dict | None] = [None] * len(items)
+        per_node: dict[int, list[int]] = {}
+        for index, item in enumerate(items):
+            per_node.setdefault(item['node'], []).append(index)
+
+        def result(index, error, node_started, queued=False):
+            return {
+                **items[index],
+                'success': error is None and not queued,
+                'queued': queued,
+                'error': error,
+                'duration': round(time.monotonic() - node_started, 3),
+            }
+
+        async def run_node(node_id, indexes):
+            node_started = time.monotonic()
+            values = {}
+            config_indexes = []
+            for index in indexes:
+                item = items[index]
+                if 'key' not in item:
+                    continue
+                error = self.config_index.validate(node_id, item['key'], item['value'])
+                if error is not None:
+                    results[index] = result(index, error, node_started)
+                    continue
+                values[item['key']] = item['value']
+                config_indexes.append(index)
+
+            if values:
+                queued = False
+                try:
+                    queued = not await self.async_set_or_queue_values(node_id, values)
+                    error = None
+                except Exception as e:
+                    error = str(e)
+                for index in config_indexes:
+                    results[index] = result(index, error, node_started, queued)
+
+            for index in indexes:
+                item = items[index]
+                if 'action' not in item:
+                    continue
+                queued = False
+                try:
+                    queued = not await self.async_set_ventilation_state(node_id, item['option'], item['action'])
+                    error = None
+                except Exception as e:
+                    error = str(e)
+                results[index] = result(index, error, node_started, queued)
+
+        await asyncio.gather(*(run_node(node_id, indexes) for node_id, indexes in per_node.items()))
+
+        return {
+            'results': results,
+            'nodes': len(per_node),
+            'succeeded': sum(1 for item in results if item['success']),
+            'queued': sum(1 for item in results if item['queued']),
+            'failed': sum(1 for item in results if item['error'] is not None),
+            'duration': round(time.monotonic() - started, 3),
+        }
+
+    async def async_apply_config(self, values: dict[int, dict[str, float]]) -> dict:
+        """Write a set of node parameters as one transaction.
+
+        Only the parameters that differ from the config index are sent, one
+        PATCH per node, all dispatched at once so the scheduler can pipeline
+        them. If any node fails, every node that was written is restored to the
+        values it had before. Raises ValueError without writing anything if a
+        value is unknown or out of range, or while writes are queued: they
+        would overwrite the transaction once the queue is sent.
+        """
+        started = time.monotonic()
+        if self.write_queue:
+            raise ValueError(f"{len(self.write_queue)} queued writes have not reached the board yet")
+        changes, original, errors = diff_preset(self.config_index, values)
+        if errors:
+            raise ValueError('; '.join(errors))
+
+        node_ids = list(changes)
+        outcomes = await asyncio.gather(
+            *(self.async_set_values(node_id, changes[node_id]) for node_id in node_ids),
+            return_exceptions=True,
+        )
+        failed = {
+            node_id: str(outcome)
+            for node_id, outcome in zip(node_ids, outcomes)
+            if isinstance(outcome, Exception)
+        }
+
+        rollback_failed = {}
+        if failed:
+            # A failed PATCH may still have been partially applied, so restore every node
+            _LOGGER.warning(f"Applying config to nodes {list(failed)} failed, restoring {node_ids}")
+            outcomes = await asyncio.gather(
+                *(self.async_set_values(node_id, original[node_id]) for node_id in node_ids),
+                return_exceptions=True,
+            )
+            rollback_failed = {
+                node_id: str(outcome)
+                for node_id, outcome in zip(node_ids, outcomes)
+                if isinstance(outcome, Exception)
+            }
+            for node_id, error in rollback_failed.items():
+                _LOGGER.error(f"Failed to restore config of node {node_id}: {error}")
+
+        return {
+            'success': not failed,
+            'nodes': len(node_ids),
+            'changed': sum(len(node_values) for node_values in changes.values()),
+            'unchanged': sum(len(node_values) for node_values in values.values())
+            - sum(len(node_values) for node_values in changes.values()),
+            'errors': failed,
+            'rolled_back': bool(failed) and not rollback_failed,
+            'rollback_errors': rollback_failed,
+            'duration': round(time.monotonic() - started, 3),
+        }
+
+    async def async_set_ventilation_state(self, node_id, option, action) -> bool:
+        """Run a node action, or queue it while the board is unreachable; returns False when queued."""
+        return await self._async_write_or_queue(
+            lambda: self._async_send_action(node_id, option, action),
+            lambda: self.write_queue.put_action(node_id, action, option),
+        )
+
+    async def _async_send_action(self, node_id, option, action):
+        try:
+            await self._async_request(
+                PRIORITY_USER_WRITE, DucoPy.change_action_node, action, option, node_id
             )
             
             _LOGGER.info(f"Successfully set config value for node {node_id}, action {action} to {option}")
@@ -122,7 +1064,59 @@ class DucoboxCoordinator(DataUpdateCoordinator):
             _LOGGER.error(f"Failed to set config value for node {node_id}, action {action}: {e}")
             raise
 
-class DucoboxSensorEntity(CoordinatorEntity[DucoboxCoordinator], SensorEntity):
+class DucoboxFilteredSensorEntity(CoordinatorEntity[DucoboxCoordinator], SensorEntity):
+    """Sensor entity that only writes state for significant changes.
+
+    Subclasses implement `_compute_value`; the coordinator's deadband filter
+    decides whether a new value is written or held back.
+    """
+
+    @abstractmethod
+    def _compute_value(self) -> Any:
+        """Return the current value of the sensor."""
+
+    def _init_published_value(self) -> None:
+        self._attr_native_value = self._compute_value()
+        self._published_at = time.monotonic()
+        self._published_flags = None
+
+    @property
+    def available(self) -> bool:
+        """Return if entity is available; last good values stay available during the grace period."""
+        return self.coordinator.data_available
+
+    @property
+    def extra_state_attributes(self) -> dict | None:
+        """Return the staleness of the value while the board is unreachable."""
+        return self.coordinator.stale_attributes()
+
+    def _state_flags(self) -> tuple:
+        """Return the state besides the value whose changes are always written."""
+        return self.available, self.coordinator.is_stale
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state if the value changed beyond the deadband, or one of the state flags changed."""
+        flags = self._state_flags()
+        value = self._compute_value()
+        now = time.monotonic()
+
+        if (
+            flags == self._published_flags
+            and not self.coordinator.deadband.should_publish(
+                self.device_class, self._attr_native_value, value, now - self._published_at
+            )
+        ):
+            return
+
+        if value != self._attr_native_value:
+            self._published_at = now
+        self._attr_native_value = value
+        self._published_flags = flags
+        self.async_write_ha_state()
+
+
+class DucoboxSensorEntity(DucoboxFilteredSensorEntity):
     """Representation of a Ducobox sensor entity."""
     entity_description: DucoboxSensorEntityDescription
 
@@ -139,22 +1133,22 @@ class DucoboxSensorEntity(CoordinatorEntity[DucoboxCoordinator], SensorEntity):
         self._attr_device_info = device_info
         self._attr_unique_id = unique_id
         self._attr_name = f"{device_info['name']} {description.name}"
+        self._init_published_value()
 
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        return self.coordinator.last_update_success
+    async def async_added_to_hass(self) -> None:
+        """Register the /info sections this sensor reads while it is enabled."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self.coordinator.async_require_info(self.entity_description.key))
 
-    @property
-    def native_value(self) -> Any:
-        """Return the state of the sensor."""
+    def _compute_value(self) -> Any:
+        """Return the current value of the sensor."""
         try:
             return self.entity_description.value_fn(self.coordinator.data)
         except Exception as e:
-            _LOGGER.debug(f"Error getting value for {self.name}: {e}")
+            _LOGGER.debug(f"Error getting value for {self._attr_name}: {e}")
             return None
 
-class DucoboxNodeSensorEntity(CoordinatorEntity[DucoboxCoordinator], SensorEntity):
+class DucoboxNodeSensorEntity(DucoboxFilteredSensorEntity):
     """Representation of a Ducobox node sensor entity."""
     entity_description: DucoboxNodeSensorEntityDescription
 
@@ -175,21 +1169,139 @@ class DucoboxNodeSensorEntity(CoordinatorEntity[DucoboxCoordinator], SensorEntit
         self._attr_unique_id = unique_id
         self._node_id = node_id
         self._attr_name = f"{node_name} {description.name}"
+        self._init_published_value()
+
+    async def async_added_to_hass(self) -> None:
+        """Follow the coordinator's countdown ticks for the remaining time of the node's state."""
+        await super().async_added_to_hass()
+        if self.entity_description.key == COUNTDOWN_KEY:
+            self.async_on_remove(
+                self.coordinator.async_add_countdown_listener(self._node_id, self._handle_countdown_tick)
+            )
+
+    @callback
+    def _handle_countdown_tick(self) -> None:
+        """Write the interpolated remaining time; ticks bypass the deadband."""
+        value = self._compute_value()
+        if value == self._attr_native_value:
+            return
+        self._attr_native_value = value
+        self._published_at = time.monotonic()
+        self.async_write_ha_state()
+
+    @property
+    def extra_state_attributes(self) -> dict | None:
+        """Add the drift from the peer nodes when the coordinator follows it."""
+        attributes = super().extra_state_attributes
+        trends = self.coordinator.trends
+        drift = trends.drift(self._node_id, self.entity_description.key) if trends is not None else None
+        if drift is None:
+            return attributes
+        return {**(attributes or {}), 'peer_drift': drift[0], 'drifting': drift[1]}
+
+    def _state_flags(self) -> tuple:
+        """Also write state when the sensor starts or stops drifting."""
+        trends = self.coordinator.trends
+        drifting = trends is not None and trends.is_drifting(self._node_id, self.entity_description.key)
+        return *super()._state_flags(), drifting
+
+    def _compute_value(self) -> Any:
+        """Return the current value of the sensor."""
+        node = self.coordinator.data.node(self._node_id)
+        if node is None:
+            return None
+
+        try:
+            value = self.entity_description.value_fn(node)
+        except Exception as e:
+            _LOGGER.debug(f"Error getting value for {self._attr_name}: {e}")
+            return None
+
+        if self.entity_description.key == COUNTDOWN_KEY and self.coordinator.countdown_interval:
+            remain = self.coordinator.countdowns.remain(self._node_id, time.monotonic())
+            # The board reports None rather than 0 while no timer runs
+            if remain is not None and (remain or value):
+                return remain
+        return value
+
+
+class DucoboxZoneSensorEntity(DucoboxFilteredSensorEntity):
+    """Aggregate of a node parameter over the nodes of a zone, computed once per poll."""
+
+    def __init__(
+        self,
+        coordinator: DucoboxCoordinator,
+        zone: str,
+        description: SensorEntityDescription,
+        device_info: DeviceInfo,
+        unique_id: str,
+    ) -> None:
+        """Initialize a zone sensor entity."""
+        super().__init__(coordinator)
+        self.entity_description = description
+        self._zone = zone
+        self._attr_device_info = device_info
+        self._attr_unique_id = unique_id
+        self._attr_name = f"{device_info['name']} {zone} {description.name}"
+        self._init_published_value()
+
+    @property
+    def extra_state_attributes(self) -> dict | None:
+        """Add the node ids of the zone."""
+        attributes = super().extra_state_attributes
+        return {**(attributes or {}), 'nodes': sorted(self.coordinator.zones.get(self._zone, ()))}
+
+    def _compute_value(self) -> Any:
+        """Return the aggregate computed by the coordinator."""
+        return self.coordinator.zone_values.get(self._zone, {}).get(self.entity_description.key)
+
+
+class DucoboxRollingStatisticSensorEntity(CoordinatorEntity[DucoboxCoordinator], SensorEntity):
+    """Rolling statistic over the coordinator's in-memory history of a sensor."""
+
+    def __init__(
+        self,
+        coordinator: DucoboxCoordinator,
+        node_id: int | None,
+        description: DucoboxSensorEntityDescription | DucoboxNodeSensorEntityDescription,
+        statistic: str,
+        statistic_name: str,
+        device_info: DeviceInfo,
+        unique_id: str,
+        name: str,
+    ) -> None:
+        """Initialize a rolling statistic sensor entity."""
+        super().__init__(coordinator)
+        self._history_key = (node_id, description.key)
+        self._statistic = statistic
+        self._attr_device_info = device_info
+        self._attr_unique_id = unique_id
+        self._attr_name = f"{name} {description.name} {statistic_name}"
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+        unit = description.native_unit_of_measurement
+        if statistic == 'rate':
+            self._attr_native_unit_of_measurement = f"{unit}/min" if unit else None
+        else:
+            self._attr_native_unit_of_measurement = unit
+            self._attr_device_class = description.device_class
+
+    async def async_added_to_hass(self) -> None:
+        """Register the /info sections of box statistics while this sensor is enabled."""
+        await super().async_added_to_hass()
+        if self._history_key[0] is None:
+            self.async_on_remove(self.coordinator.async_require_info(self._history_key[1]))
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        return self.coordinator.last_update_success
+        return self.coordinator.data_available and self._history_key in self.coordinator.history
 
     @property
     def native_value(self) -> Any:
-        """Return the state of the sensor."""
-        nodes = self.coordinator.data.get('nodes', [])
-        for node in nodes:
-            if node.get('Node') == self._node_id:
-                try:
-                    return self.entity_description.value_fn(node)
-                except Exception as e:
-                    _LOGGER.debug(f"Error getting value for {self.name}: {e}")
-                    return None
-        return None
+        """Return the statistic over the buffered samples."""
+        buffer = self.coordinator.history.get(self._history_key)
+        if buffer is None:
+            return None
+
+        value = buffer.stat(self._statistic)
+        return round(value, 2) if value is not None else None
@@ -0,0 +1,86 @@
+from collections.abc import Callable
+
+from .snapshot import DucoboxSnapshot
+
+COUNTDOWN_KEY = 'TimeStateRemain'
+
+# A reading this many seconds above the extrapolated value means the timer restarted
+RESET_TOLERANCE = 5.0
+
+
+class _Countdown:
+    __slots__ = ('remain', 'read_at', 'state', 'end')
+
+    def __init__(self, remain: float, read_at: float, state, end):
+        self.remain = remain
+        self.read_at = read_at
+        self.state = state
+        self.end = end
+
+    def value(self, now: float) -> float:
+        return max(self.remain - (now - self.read_at), 0.0)
+
+
+class DucoboxCountdowns:
+    """Extrapolate the TimeStateRemain countdown of every node between polls.
+
+    Each real reading resyncs the node's countdown; in between, the remaining
+    time is the last reading minus the monotonic time elapsed since it was
+    read. A changed ventilation state or TimeStateEnd, or a reading above
+    the extrapolated value, is a reset of the timer. TimeStateEnd is the
+    fixed end of the state and is not extrapolated itself. The board reports
+    no TimeStateRemain while no timer runs, which counts as 0.
+    """
+
+    def __init__(self):
+        self._countdowns: dict[int, _Countdown] = {}
+        self.counters = {'resyncs': 0, 'resets': 0}
+        self.max_drift = 0.0
+
+    def update(self, snapshot: DucoboxSnapshot, now: float, read_at: Callable[[int], float | None] | None = None) -> None:
+        """Resync from a poll; `read_at` returns when a node's payload was fetched, if not now."""
+        countdowns = {}
+        for node_id, node in snapshot.nodes.items():
+            remain = node.get(COUNTDOWN_KEY)
+            state = node.get('State')
+            end = node.get('TimeStateEnd')
+            if state is None:
+                # Not a node with a ventilation state
+                continue
+
+            node_read_at = (read_at(node_id) if read_at is not None else None) or now
+            previous = self._countdowns.get(node_id)
+            if previous is not None and previous.read_at == node_read_at:
+                # The payload was not refreshed on this poll
+                countdowns[node_id] = previous
+                continue
+
+            remain = float(remain or 0)
+            if previous is not None:
+                self.counters['resyncs'] += 1
+                expected = previous.value(node_read_at)
+                if state != previous.state or end != previous.end or remain > expected + RESET_TOLERANCE:
+                    self.counters['resets'] += 1
+                else:
+                    self.max_drift = max(self.max_drift, abs(remain - expected))
+            countdowns[node_id] = _Countdown(remain, node_read_at, state, end)
+
+        self._countdowns = countdowns
+
+    def remain(self, node_id: int, now: float) -> int | None:
+        """Return the extrapolated remaining seconds of a node's timer."""
+        countdown = self._countdowns.get(node_id)
+        if countdown is None:
+            return None
+        return round(countdown.value(now))
+
+    def running(self, now: float) -> list[int]:
+        """Return the nodes whose timer has not reached 0 yet."""
+        return [node_id for node_id, countdown in self._countdowns.items() if countdown.value(now) > 0]
+
+    def stats(self) -> dict:
+        return {
+            'nodes': len(self._countdowns),
+            'max_drift': round(self.max_drift, 1),
+            **self.counters,
+        }
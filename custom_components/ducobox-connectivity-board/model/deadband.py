@@ -0,0 +1,80 @@
+from ..const import (
+    DEADBAND_DEVICE_CLASSES,
+    DEADBAND_OTHER,
+    CONF_DEADBAND_ABSOLUTE,
+    CONF_DEADBAND_RELATIVE,
+    CONF_DEADBAND_HEARTBEAT,
+    DEFAULT_DEADBAND_HEARTBEAT,
+)
+
+
+class DucoboxDeadbandFilter:
+    """Decide whether a new sensor value is significant enough to write.
+
+    Each device class has an absolute and a relative (percent of the last
+    published value) deadband; the effective band is the larger of the two.
+    Values that stay inside the band are held back until the heartbeat
+    (maximum silence) expires. Unchanged values are counted apart from the
+    suppressed ones.
+    """
+
+    def __init__(self, deadbands: dict[str, tuple[float, float]], heartbeat: float):
+        self.deadbands = deadbands
+        self.heartbeat = heartbeat
+        self.counters = {
+            device_class: {'published': 0, 'suppressed': 0, 'unchanged': 0}
+            for device_class in (*DEADBAND_DEVICE_CLASSES, DEADBAND_OTHER)
+        }
+
+    @classmethod
+    def from_options(cls, options: dict) -> 'DucoboxDeadbandFilter':
+        deadbands = {
+            device_class: (
+                float(options.get(CONF_DEADBAND_ABSOLUTE.format(device_class), 0)),
+                float(options.get(CONF_DEADBAND_RELATIVE.format(device_class), 0)) / 100.0,
+            )
+            for device_class in (*DEADBAND_DEVICE_CLASSES, DEADBAND_OTHER)
+        }
+        return cls(deadbands, float(options.get(CONF_DEADBAND_HEARTBEAT, DEFAULT_DEADBAND_HEARTBEAT)))
+
+    def configure(self, options: dict) -> None:
+        """Apply new deadbands and heartbeat; the counters are kept."""
+        configured = self.from_options(options)
+        self.deadbands = configured.deadbands
+        self.heartbeat = configured.heartbeat
+
+    def _is_significant(self, device_class: str, previous, value, silence: float) -> bool:
+        numeric = (
+            isinstance(value, (int, float)) and isinstance(previous, (int, float))
+            and not isinstance(value, bool) and not isinstance(previous, bool)
+        )
+        if not numeric:
+            return True
+
+        absolute, relative = self.deadbands[device_class]
+        band = max(absolute, relative * abs(previous))
+        if abs(value - previous) > band:
+            return True
+
+        return self.heartbeat > 0 and silence >= self.heartbeat
+
+    def should_publish(self, device_class: str | None, previous, value, silence: float) -> bool:
+        """Return whether `value` should replace the last published `previous`."""
+        device_class = device_class if device_class in self.deadbands else DEADBAND_OTHER
+        if value == previous:
+            self.counters[device_class]['unchanged'] += 1
+            return False
+
+        significant = self._is_significant(device_class, previous, value, silence)
+        self.counters[device_class]['published' if significant else 'suppressed'] += 1
+        return significant
+
+    def stats(self) -> dict:
+        return {
+            'heartbeat': self.heartbeat,
+            'deadbands': {
+                device_class: {'absolute': absolute, 'relative': relative * 100.0}
+                for device_class, (absolute, relative) in self.deadbands.items()
+            },
+            'counters': self.counters,
+        }
@@ -0,0 +1,75 @@
+from math import sqrt
+
+from .utils import safe_get, process_temperature, process_pressure, process_speed
+
+# /info (module, submodule) sections the derived metrics are computed from
+DERIVED_SOURCES = (
+    ('Ventilation', 'Sensor'),
+    ('Ventilation', 'Fan'),
+)
+
+# Below this indoor/outdoor difference (K) the efficiency ratios are mostly noise
+MIN_EFFICIENCY_DELTA = 2.0
+
+
+def _ratio(numerator, denominator):
+    if numerator is None or not denominator:
+        return None
+    return numerator / denominator
+
+
+def compute_derived_metrics(info: dict | None) -> dict:
+    """Compute heat-recovery and airflow metrics from one /info snapshot.
+
+    All inputs are read once and every metric is computed in a single pass, so
+    consumers can use the result instead of re-rendering templates on each
+    individual state change.
+    """
+    ventilation = safe_get(info, 'Ventilation') or {}
+    temp_oda = process_temperature(safe_get(ventilation, 'Sensor', 'TempOda', 'Val'))
+    temp_sup = process_temperature(safe_get(ventilation, 'Sensor', 'TempSup', 'Val'))
+    temp_eta = process_temperature(safe_get(ventilation, 'Sensor', 'TempEta', 'Val'))
+    temp_eha = process_temperature(safe_get(ventilation, 'Sensor', 'TempEha', 'Val'))
+    speed_sup = process_speed(safe_get(ventilation, 'Fan', 'SpeedSup', 'Val'))
+    speed_eha = process_speed(safe_get(ventilation, 'Fan', 'SpeedEha', 'Val'))
+    press_sup = process_pressure(safe_get(ventilation, 'Fan', 'PressSup', 'Val'))
+    press_eha = process_pressure(safe_get(ventilation, 'Fan', 'PressEha', 'Val'))
+
+    derived = {
+        'SupplyEfficiency': None,
+        'ExtractEfficiency': None,
+        'TempGain': None,
+        'FanSpeedRatio': None,
+        'FlowSupRel': None,
+        'FlowEhaRel': None,
+        'FlowBalance': None,
+    }
+
+    if temp_oda is not None and temp_eta is not None:
+        indoor_delta = temp_eta - temp_oda
+        if abs(indoor_delta) >= MIN_EFFICIENCY_DELTA:
+            if temp_sup is not None:
+                derived['SupplyEfficiency'] = round((temp_sup - temp_oda) / indoor_delta * 100.0, 1)
+            if temp_eha is not None:
+                derived['ExtractEfficiency'] = round((temp_eta - temp_eha) / indoor_delta * 100.0, 1)
+
+    if temp_sup is not None and temp_oda is not None:
+        derived['TempGain'] = round(temp_sup - temp_oda, 1)
+
+    ratio = _ratio(speed_sup, speed_eha)
+    if ratio is not None:
+        derived['FanSpeedRatio'] = round(ratio, 3)
+
+    # For a fixed duct system the flow scales with the square root of the
+    # pressure it is pushed against (Q ~ sqrt(dP)); without a commissioning
+    # reference we can only express flow relative to 1 Pa.
+    if press_sup is not None and press_sup >= 0:
+        derived['FlowSupRel'] = round(sqrt(press_sup), 2)
+    if press_eha is not None and press_eha >= 0:
+        derived['FlowEhaRel'] = round(sqrt(press_eha), 2)
+
+    ratio = _ratio(derived['FlowSupRel'], derived['FlowEhaRel'])
+    if ratio is not None:
+        derived['FlowBalance'] = round(ratio * 100.0, 1)
+
+    return derived
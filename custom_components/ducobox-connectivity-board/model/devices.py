@@ -1,8 +1,4 @@
 from .utils import (
-    process_node_temperature,
-    process_node_humidity,
-    process_node_co2,
-    process_node_iaq,
     process_temperature,
     process_speed,
     process_pressure,
@@ -10,11 +6,13 @@ from .utils import (
     process_uptime,
     process_timefilterremain,
     process_bypass_position,
-    safe_get,
 )
+from .snapshot import DucoboxSnapshot, DucoboxNodeSnapshot
 
 from collections.abc import Callable
 from dataclasses import dataclass
+from datetime import datetime, timezone
+from operator import methodcaller
 from homeassistant.components.sensor import (
     SensorEntityDescription,
     SensorDeviceClass,
@@ -25,8 +23,8 @@ from homeassistant.const import (
     UnitOfPressure,
     UnitOfTime,
     PERCENTAGE,
-    CONCENTRATION_PARTS_PER_MILLION,
     REVOLUTIONS_PER_MINUTE,
+    CONCENTRATION_PARTS_PER_MILLION,
 )
 
 
@@ -34,14 +32,14 @@ from homeassistant.const import (
 class DucoboxSensorEntityDescription(SensorEntityDescription):
     """Describes a Ducobox sensor entity."""
 
-    value_fn: Callable[[dict], float | None]
+    value_fn: Callable[[DucoboxSnapshot], float | None]
 
 
 @dataclass(frozen=True, kw_only=True)
 class DucoboxNodeSensorEntityDescription(SensorEntityDescription):
     """Describes a Ducobox node sensor entity."""
 
-    value_fn: Callable[[dict], float | None]
+    value_fn: Callable[[DucoboxNodeSnapshot], float | str | None]
     sensor_key: str
     node_type: str
 
@@ -57,7 +55,7 @@ SENSORS: tuple[DucoboxSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         device_class=SensorDeviceClass.TEMPERATURE,
         value_fn=lambda data: process_temperature(
-            safe_get(data, 'info', 'Ventilation', 'Sensor', 'TempOda', 'Val')
+            data.box_value('TempOda')
         ),
     ),
     # Sup = box -> house
@@ -68,7 +66,7 @@ SENSORS: tuple[DucoboxSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         device_class=SensorDeviceClass.TEMPERATURE,
         value_fn=lambda data: process_temperature(
-            safe_get(data, 'info', 'Ventilation', 'Sensor', 'TempSup', 'Val')
+            data.box_value('TempSup')
         ),
     ),
     # Eta = house -> box
@@ -79,7 +77,7 @@ SENSORS: tuple[DucoboxSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         device_class=SensorDeviceClass.TEMPERATURE,
         value_fn=lambda data: process_temperature(
-            safe_get(data, 'info', 'Ventilation', 'Sensor', 'TempEta', 'Val')
+            data.box_value('TempEta')
         ),
     ),
     # Eha = box -> outdoor
@@ -90,7 +88,7 @@ SENSORS: tuple[DucoboxSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         device_class=SensorDeviceClass.TEMPERATURE,
         value_fn=lambda data: process_temperature(
-            safe_get(data, 'info', 'Ventilation', 'Sensor', 'TempEha', 'Val')
+            data.box_value('TempEha')
         ),
     ),
     # Fan speed sensors
@@ -100,7 +98,7 @@ SENSORS: tuple[DucoboxSensorEntityDescription, ...] = (
         native_unit_of_measurement=REVOLUTIONS_PER_MINUTE,
         state_class=SensorStateClass.MEASUREMENT,
         value_fn=lambda data: process_speed(
-            safe_get(data, 'info', 'Ventilation', 'Fan', 'SpeedSup', 'Val')
+            data.box_value('SpeedSup')
         ),
     ),
     DucoboxSensorEntityDescription(
@@ -109,7 +107,7 @@ SENSORS: tuple[DucoboxSensorEntityDescription, ...] = (
         native_unit_of_measurement=REVOLUTIONS_PER_MINUTE,
         state_class=SensorStateClass.MEASUREMENT,
         value_fn=lambda data: process_speed(
-            safe_get(data, 'info', 'Ventilation', 'Fan', 'SpeedEha', 'Val')
+            data.box_value('SpeedEha')
         ),
     ),
     # Pressure sensors
@@ -120,7 +118,7 @@ SENSORS: tuple[DucoboxSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         device_class=SensorDeviceClass.PRESSURE,
         value_fn=lambda data: process_pressure(
-            safe_get(data, 'info', 'Ventilation', 'Fan', 'PressSup', 'Val')
+            data.box_value('PressSup')
         ),
     ),
     DucoboxSensorEntityDescription(
@@ -130,7 +128,7 @@ SENSORS: tuple[DucoboxSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         device_class=SensorDeviceClass.PRESSURE,
         value_fn=lambda data: process_pressure(
-            safe_get(data, 'info', 'Ventilation', 'Fan', 'PressEha', 'Val')
+            data.box_value('PressEha')
         ),
     ),
     # Wi-Fi signal strength
@@ -141,7 +139,7 @@ SENSORS: tuple[DucoboxSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         device_class=SensorDeviceClass.SIGNAL_STRENGTH,
         value_fn=lambda data: process_rssi(
-            safe_get(data, 'info', 'General', 'Lan', 'RssiWifi', 'Val')
+            data.box_value('RssiWifi')
         ),
     ),
     # Device uptime
@@ -152,7 +150,7 @@ SENSORS: tuple[DucoboxSensorEntityDescription, ...] = (
         state_class=SensorStateClass.TOTAL_INCREASING,
         device_class=SensorDeviceClass.DURATION,
         value_fn=lambda data: process_uptime(
-            safe_get(data, 'info', 'General', 'Board', 'UpTime', 'Val')
+            data.box_value('UpTime')
         ),
     ),
     # Filter time remaining
@@ -163,7 +161,7 @@ SENSORS: tuple[DucoboxSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         device_class=SensorDeviceClass.DURATION,
         value_fn=lambda data: process_timefilterremain(
-            safe_get(data, 'info', 'HeatRecovery', 'General', 'TimeFilterRemain', 'Val')
+            data.box_value('TimeFilterRemain')
         ),
     ),
     # Bypass position
@@ -173,537 +171,159 @@ SENSORS: tuple[DucoboxSensorEntityDescription, ...] = (
         native_unit_of_measurement=PERCENTAGE,
         state_class=SensorStateClass.MEASUREMENT,
         value_fn=lambda data: process_bypass_position(
-            safe_get(data, 'info', 'HeatRecovery', 'Bypass', 'Pos', 'Val')
+            data.box_value('BypassPos')
         ),
     ),
     # Add additional sensors here if needed
 )
 
-# Define sensors for nodes based on their type
-NODE_SENSORS: dict[str, list[DucoboxNodeSensorEntityDescription]] = {
-    'BOX': [
-        DucoboxNodeSensorEntityDescription(
-            key='Mode',
-            name='Ventilation Mode',
-            value_fn=lambda node: safe_get(node, 'Ventilation', 'Mode'),
-            sensor_key='Mode',
-            node_type='BOX',
-        ),
-        DucoboxNodeSensorEntityDescription(
-            key='State',
-            name='Ventilation State',
-            value_fn=lambda node: safe_get(node, 'Ventilation', 'State'),
-            sensor_key='State',
-            node_type='BOX',
-        ),
-        DucoboxNodeSensorEntityDescription(
-            key='FlowLvlTgt',
-            name='Flow Level Target',
-            native_unit_of_measurement=PERCENTAGE,
-            value_fn=lambda node: safe_get(node, 'Ventilation', 'FlowLvlTgt'),
-            sensor_key='FlowLvlTgt',
-            node_type='BOX',
-        ),
-        DucoboxNodeSensorEntityDescription(
-            key='TimeStateRemain',
-            name='Time State Remaining',
-            native_unit_of_measurement=UnitOfTime.SECONDS,
-            value_fn=lambda node: safe_get(node, 'Ventilation', 'TimeStateRemain'),
-            sensor_key='TimeStateRemain',
-            node_type='BOX',
-        ),
-        DucoboxNodeSensorEntityDescription(
-            key='TimeStateEnd',
-            name='Time State End',
-            native_unit_of_measurement=UnitOfTime.SECONDS,
-            value_fn=lambda node: safe_get(node, 'Ventilation', 'TimeStateEnd'),
-            sensor_key='TimeStateEnd',
-            node_type='BOX',
-        ),
-        DucoboxNodeSensorEntityDescription(
-            key='Temp',
-            name='Temperature',
-            native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-            device_class=SensorDeviceClass.TEMPERATURE,
-            value_fn=lambda node: process_node_temperature(
-                safe_get(node, 'Sensor', 'data', 'Temp')
-            ),
-            sensor_key='Temp',
-            node_type='BOX',
-        ),
-        DucoboxNodeSensorEntityDescription(
-            key='Rh',
-            name='Relative Humidity',
-            native_unit_of_measurement=PERCENTAGE,
-            device_class=SensorDeviceClass.HUMIDITY,
-            value_fn=lambda node: process_node_humidity(
-                safe_get(node, 'Sensor', 'data', 'Rh')
-            ),
-            sensor_key='Rh',
-            node_type='BOX',
-        ),
-        DucoboxNodeSensorEntityDescription(
-            key='IaqRh',
-            name='Humidity Air Quality',
-            native_unit_of_measurement=PERCENTAGE,
-            value_fn=lambda node: process_node_iaq(
-                safe_get(node, 'Sensor', 'data', 'IaqRh')
-            ),
-            sensor_key='IaqRh',
-            node_type='BOX',
-        ),
-    ],
-    'UCCO2': [
-        DucoboxNodeSensorEntityDescription(
-            key='Temp',
-            name='Temperature',
-            native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-            device_class=SensorDeviceClass.TEMPERATURE,
-            value_fn=lambda node: process_node_temperature(
-                safe_get(node, 'Sensor', 'data', 'Temp')
-            ),
-            sensor_key='Temp',
-            node_type='UCCO2',
-        ),
-        DucoboxNodeSensorEntityDescription(
-            key='Co2',
-            name='CO₂',
-            native_unit_of_measurement=CONCENTRATION_PARTS_PER_MILLION,
-            device_class=SensorDeviceClass.CO2,
-            value_fn=lambda node: process_node_co2(
-                safe_get(node, 'Sensor', 'data', 'Co2')
-            ),
-            sensor_key='Co2',
-            node_type='UCCO2',
-        ),
-        DucoboxNodeSensorEntityDescription(
-            key='IaqCo2',
-            name='CO₂ Air Quality',
-            native_unit_of_measurement=PERCENTAGE,
-            value_fn=lambda node: process_node_iaq(
-                safe_get(node, 'Sensor', 'data', 'IaqCo2')
-            ),
-            sensor_key='IaqCo2',
-            node_type='UCCO2',
-        ),
-    ],
-    'BSRH': [
-        DucoboxNodeSensorEntityDescription(
-            key='Temp',
-            name='Temperature',
-            native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-            device_class=SensorDeviceClass.TEMPERATURE,
-            value_fn=lambda node: process_node_temperature(
-                safe_get(node, 'Sensor', 'data', 'Temp')
-            ),
-            sensor_key='Temp',
-            node_type='BSRH',
-        ),
-        DucoboxNodeSensorEntityDescription(
-            key='Rh',
-            name='Relative Humidity',
-            native_unit_of_measurement=PERCENTAGE,
-            device_class=SensorDeviceClass.HUMIDITY,
-            value_fn=lambda node: process_node_humidity(
-                safe_get(node, 'Sensor', 'data', 'Rh')
-            ),
-            sensor_key='Rh',
-            node_type='BSRH',
-        ),
-        DucoboxNodeSensorEntityDescription(
-            key='IaqRh',
-            name='Humidity Air Quality',
-            native_unit_of_measurement=PERCENTAGE,
-            value_fn=lambda node: process_node_iaq(
-                safe_get(node, 'Sensor', 'data', 'IaqRh')
-            ),
-            sensor_key='IaqRh',
-            node_type='BSRH',
-        ),
-    ],
-    'VLVRH': [
-        DucoboxNodeSensorEntityDescription(
-            key='State',
-            name='Ventilation State',
-            value_fn=lambda node: safe_get(node, 'Ventilation', 'State'),
-            sensor_key='State',
-            node_type='VLVRH',
-        ),
-        DucoboxNodeSensorEntityDescription(
-            key='TimeStateRemain',
-            name='Time State Remaining',
-            native_unit_of_measurement=UnitOfTime.SECONDS,
-            value_fn=lambda node: safe_get(node, 'Ventilation', 'TimeStateRemain'),
-            sensor_key='TimeStateRemain',
-            node_type='VLVRH',
-        ),
-        DucoboxNodeSensorEntityDescription(
-            key='TimeStateEnd',
-            name='Time State End',
-            native_unit_of_measurement=UnitOfTime.SECONDS,
-            value_fn=lambda node: safe_get(node, 'Ventilation', 'TimeStateEnd'),
-            sensor_key='TimeStateEnd',
-            node_type='VLVRH',
-        ),
-        DucoboxNodeSensorEntityDescription(
-            key='Mode',
-            name='Ventilation Mode',
-            value_fn=lambda node: safe_get(node, 'Ventilation', 'Mode'),
-            sensor_key='Mode',
-            node_type='VLVRH',
-        ),
-        DucoboxNodeSensorEntityDescription(
-            key='FlowLvlTgt',
-            name='Flow Level Target',
-            native_unit_of_measurement=PERCENTAGE,
-            value_fn=lambda node: safe_get(node, 'Ventilation', 'FlowLvlTgt'),
-            sensor_key='FlowLvlTgt',
-            node_type='VLVRH',
-        ),
-        DucoboxNodeSensorEntityDescription(
-            key='IaqRh',
-            name='Humidity Air Quality',
-            native_unit_of_measurement=PERCENTAGE,
-            value_fn=lambda node: process_node_iaq(
-                safe_get(node, 'Sensor', 'data', 'IaqRh')
-            ),
-            sensor_key='IaqRh',
-            node_type='VLVRH',
-        ),
-        DucoboxNodeSensorEntityDescription(
-            key='Rh',
-            name='Relative Humidity',
-            native_unit_of_measurement=PERCENTAGE,
-            device_class=SensorDeviceClass.HUMIDITY,
-            value_fn=lambda node: process_node_iaq(
-                safe_get(node, 'Sensor', 'data', 'Rh')
-            ),
-            sensor_key='Rh',
-            node_type='VLVRH',
-        ),
-        DucoboxNodeSensorEntityDescription(
-            key='Temp',
-            name='Temperature',
-            native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-            device_class=SensorDeviceClass.TEMPERATURE,
-            value_fn=lambda node: process_node_temperature(
-                safe_get(node, 'Sensor', 'data', 'Temp')
-            ),
-            sensor_key='Temp',
-            node_type='VLVRH',
-        ),
-    ],
-    'VLVCO2': [
-        DucoboxNodeSensorEntityDescription(
-            key='State',
-            name='Ventilation State',
-            value_fn=lambda node: safe_get(node, 'Ventilation', 'State'),
-            sensor_key='State',
-            node_type='VLVCO2',
-        ),
-        DucoboxNodeSensorEntityDescription(
-            key='TimeStateRemain',
-            name='Time State Remaining',
-            native_unit_of_measurement=UnitOfTime.SECONDS,
-            value_fn=lambda node: safe_get(node, 'Ventilation', 'TimeStateRemain'),
-            sensor_key='TimeStateRemain',
-            node_type='VLVCO2',
-        ),
-        DucoboxNodeSensorEntityDescription(
-            key='TimeStateEnd',
-            name='Time State End',
-            native_unit_of_measurement=UnitOfTime.SECONDS,
-            value_fn=lambda node: safe_get(node, 'Ventilation', 'TimeStateEnd'),
-            sensor_key='TimeStateEnd',
-            node_type='VLVCO2',
-        ),
-        DucoboxNodeSensorEntityDescription(
-            key='Mode',
-            name='Ventilation Mode',
-            value_fn=lambda node: safe_get(node, 'Ventilation', 'Mode'),
-            sensor_key='Mode',
-            node_type='VLVCO2',
-        ),
-        DucoboxNodeSensorEntityDescription(
-            key='FlowLvlTgt',
-            name='Flow Level Target',
-            native_unit_of_measurement=PERCENTAGE,
-            value_fn=lambda node: safe_get(node, 'Ventilation', 'FlowLvlTgt'),
-            sensor_key='FlowLvlTgt',
-            node_type='VLVCO2',
-        ),
-        DucoboxNodeSensorEntityDescription(
-            key='Co2',
-            name='CO₂',
-            native_unit_of_measurement=CONCENTRATION_PARTS_PER_MILLION,
-            device_class=SensorDeviceClass.CO2,
-            value_fn=lambda node: process_node_co2(
-                safe_get(node, 'Sensor', 'data', 'Co2')
-            ),
-            sensor_key='Co2',
-            node_type='VLVCO2',
-        ),
-        DucoboxNodeSensorEntityDescription(
-            key='IaqCo2',
-            name='CO₂ Air Quality',
-            native_unit_of_measurement=PERCENTAGE,
-            value_fn=lambda node: process_node_iaq(
-                safe_get(node, 'Sensor', 'data', 'IaqCo2')
-            ),
-            sensor_key='IaqCo2',
-            node_type='VLVCO2',
-        ),
-        DucoboxNodeSensorEntityDescription(
-            key='Temp',
-            name='Temperature',
-            native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-            device_class=SensorDeviceClass.TEMPERATURE,
-            value_fn=lambda node: process_node_temperature(
-                safe_get(node, 'Sensor', 'data', 'Temp')
-            ),
-            sensor_key='Temp',
-            node_type='VLVCO2',
-        ),
-    ],
-    'VLVCO2RH': [
-        DucoboxNodeSensorEntityDescription(
-            key='State',
-            name='Ventilation State',
-            value_fn=lambda node: safe_get(node, 'Ventilation', 'State'),
-            sensor_key='State',
-            node_type='VLVCO2RH',
-        ),
-        DucoboxNodeSensorEntityDescription(
-            key='TimeStateRemain',
-            name='Time State Remaining',
-            native_unit_of_measurement=UnitOfTime.SECONDS,
-            value_fn=lambda node: safe_get(node, 'Ventilation', 'TimeStateRemain'),
-            sensor_key='TimeStateRemain',
-            node_type='VLVCO2RH',
-        ),
-        DucoboxNodeSensorEntityDescription(
-            key='TimeStateEnd',
-            name='Time State End',
-            native_unit_of_measurement=UnitOfTime.SECONDS,
-            value_fn=lambda node: safe_get(node, 'Ventilation', 'TimeStateEnd'),
-            sensor_key='TimeStateEnd',
-            node_type='VLVCO2RH',
-        ),
-        DucoboxNodeSensorEntityDescription(
-            key='Mode',
-            name='Ventilation Mode',
-            value_fn=lambda node: safe_get(node, 'Ventilation', 'Mode'),
-            sensor_key='Mode',
-            node_type='VLVCO2RH',
-        ),
-        DucoboxNodeSensorEntityDescription(
-            key='FlowLvlTgt',
-            name='Flow Level Target',
-            native_unit_of_measurement=PERCENTAGE,
-            value_fn=lambda node: safe_get(node, 'Ventilation', 'FlowLvlTgt'),
-            sensor_key='FlowLvlTgt',
-            node_type='VLVCO2RH',
-        ),
-        DucoboxNodeSensorEntityDescription(
-            key='Co2',
-            name='CO₂',
-            native_unit_of_measurement=CONCENTRATION_PARTS_PER_MILLION,
-            device_class=SensorDeviceClass.CO2,
-            value_fn=lambda node: process_node_co2(
-                safe_get(node, 'Sensor', 'data', 'Co2')
-            ),
-            sensor_key='Co2',
-            node_type='VLVCO2RH',
-        ),
-        DucoboxNodeSensorEntityDescription(
-            key='IaqCo2',
-            name='CO₂ Air Quality',
-            native_unit_of_measurement=PERCENTAGE,
-            value_fn=lambda node: process_node_iaq(
-                safe_get(node, 'Sensor', 'data', 'IaqCo2')
-            ),
-            sensor_key='IaqCo2',
-            node_type='VLVCO2RH',
-        ),
-        DucoboxNodeSensorEntityDescription(
-            key='Rh',
-            name='Relative Humidity',
-            native_unit_of_measurement=PERCENTAGE,
-            device_class=SensorDeviceClass.HUMIDITY,
-            value_fn=lambda node: process_node_iaq(
-                safe_get(node, 'Sensor', 'data', 'Rh')
-            ),
-            sensor_key='Rh',
-            node_type='VLVCO2RH',
-        ),
-        DucoboxNodeSensorEntityDescription(
-            key='IaqRh',
-            name='Humidity Air Quality',
-            native_unit_of_measurement=PERCENTAGE,
-            value_fn=lambda node: process_node_iaq(
-                safe_get(node, 'Sensor', 'data', 'IaqRh')
-            ),
-            sensor_key='IaqRh',
-            node_type='VLVCO2RH',
-        ),
-        DucoboxNodeSensorEntityDescription(
-            key='Temp',
-            name='Temperature',
-            native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-            device_class=SensorDeviceClass.TEMPERATURE,
-            value_fn=lambda node: process_node_temperature(
-                safe_get(node, 'Sensor', 'data', 'Temp')
-            ),
-            sensor_key='Temp',
-            node_type='VLVCO2RH',
-        ),
-    ],
-    'VLV': [
-        DucoboxNodeSensorEntityDescription(
-            key='State',
-            name='Ventilation State',
-            value_fn=lambda node: safe_get(node, 'Ventilation', 'State'),
-            sensor_key='State',
-            node_type='VLV',
-        ),
+# Metrics derived from the /info snapshot by the coordinator (see derived.py)
+DERIVED_SENSORS: tuple[DucoboxSensorEntityDescription, ...] = (
+    # Share of the indoor/outdoor temperature difference recovered into the supply air
+    DucoboxSensorEntityDescription(
+        key="SupplyEfficiency",
+        name="Supply Heat Recovery Efficiency",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda data: data.derived_value('SupplyEfficiency'),
+    ),
+    # Share of the indoor/outdoor temperature difference extracted from the exhaust air
+    DucoboxSensorEntityDescription(
+        key="ExtractEfficiency",
+        name="Extract Heat Recovery Efficiency",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda data: data.derived_value('ExtractEfficiency'),
+    ),
+    # TempSup - TempOda
+    DucoboxSensorEntityDescription(
+        key="TempGain",
+        name="Supply Temperature Gain",
+        native_unit_of_measurement=UnitOfTemperature.KELVIN,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda data: data.derived_value('TempGain'),
+    ),
+    # SpeedSup / SpeedEha
+    DucoboxSensorEntityDescription(
+        key="FanSpeedRatio",
+        name="Fan Speed Ratio",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda data: data.derived_value('FanSpeedRatio'),
+    ),
+    # sqrt(PressSup), proportional to the supply airflow
+    DucoboxSensorEntityDescription(
+        key="FlowSupRel",
+        name="Supply Flow Index",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda data: data.derived_value('FlowSupRel'),
+    ),
+    # sqrt(PressEha), proportional to the exhaust airflow
+    DucoboxSensorEntityDescription(
+        key="FlowEhaRel",
+        name="Exhaust Flow Index",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda data: data.derived_value('FlowEhaRel'),
+    ),
+    # Supply flow index as a percentage of the exhaust flow index
+    DucoboxSensorEntityDescription(
+        key="FlowBalance",
+        name="Flow Balance",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda data: data.derived_value('FlowBalance'),
+    ),
+)
 
-        DucoboxNodeSensorEntityDescription(
-            key='Mode',
-            name='Ventilation Mode',
-            value_fn=lambda node: safe_get(node, 'Ventilation', 'Mode'),
-            sensor_key='Mode',
-            node_type='VLV',
-        ),
-        DucoboxNodeSensorEntityDescription(
-            key='FlowLvlTgt',
-            name='Flow Level Target',
-            native_unit_of_measurement=PERCENTAGE,
-            value_fn=lambda node: safe_get(node, 'Ventilation', 'FlowLvlTgt'),
-            sensor_key='FlowLvlTgt',
-            node_type='VLV',
-        ),
-    ],
-    'SWITCH': [
-        DucoboxNodeSensorEntityDescription(
-            key='State',
-            name='Ventilation State',
-            value_fn=lambda node: safe_get(node, 'Ventilation', 'State'),
-            sensor_key='State',
-            node_type='SWITCH',
-        ),
 
-        DucoboxNodeSensorEntityDescription(
-            key='Mode',
-            name='Ventilation Mode',
-            value_fn=lambda node: safe_get(node, 'Ventilation', 'Mode'),
-            sensor_key='Mode',
-            node_type='SWITCH',
-        ), 
-    ],
-    'UCBAT': [
-        DucoboxNodeSensorEntityDescription(
-            key='State',
-            name='Ventilation State',
-            value_fn=lambda node: safe_get(node, 'Ventilation', 'State'),
-            sensor_key='State',
-            node_type='UCBAT',
-        ),
-        DucoboxNodeSensorEntityDescription(
-            key='TimeStateRemain',
-            name='Time State Remaining',
-            native_unit_of_measurement=UnitOfTime.SECONDS,
-            value_fn=lambda node: safe_get(node, 'Ventilation', 'TimeStateRemain'),
-            sensor_key='TimeStateRemain',
-            node_type='UCBAT',
-        ),
-        DucoboxNodeSensorEntityDescription(
-            key='TimeStateEnd',
-            name='Time State End',
-            native_unit_of_measurement=UnitOfTime.SECONDS,
-            value_fn=lambda node: safe_get(node, 'Ventilation', 'TimeStateEnd'),
-            sensor_key='TimeStateEnd',
-            node_type='UCBAT',
-        ),
-        DucoboxNodeSensorEntityDescription(
-            key='Mode',
-            name='Ventilation Mode',
-            value_fn=lambda node: safe_get(node, 'Ventilation', 'Mode'),
-            sensor_key='Mode',
-            node_type='UCBAT',
-        ),
-    ],
-    'UCRH': [
-        DucoboxNodeSensorEntityDescription(
-            key='State',
-            name='Ventilation State',
-            value_fn=lambda node: safe_get(node, 'Ventilation', 'State'),
-            sensor_key='State',
-            node_type='UCRH',
-        ),
-        DucoboxNodeSensorEntityDescription(
-            key='TimeStateRemain',
-            name='Time State Remaining',
-            native_unit_of_measurement=UnitOfTime.SECONDS,
-            value_fn=lambda node: safe_get(node, 'Ventilation', 'TimeStateRemain'),
-            sensor_key='TimeStateRemain',
-            node_type='UCRH',
-        ),
-        DucoboxNodeSensorEntityDescription(
-            key='TimeStateEnd',
-            name='Time State End',
-            native_unit_of_measurement=UnitOfTime.SECONDS,
-            value_fn=lambda node: safe_get(node, 'Ventilation', 'TimeStateEnd'),
-            sensor_key='TimeStateEnd',
-            node_type='UCRH',
-        ),
-        DucoboxNodeSensorEntityDescription(
-            key='Mode',
-            name='Ventilation Mode',
-            value_fn=lambda node: safe_get(node, 'Ventilation', 'Mode'),
-            sensor_key='Mode',
-            node_type='ICRH',
-        ),
-        DucoboxNodeSensorEntityDescription(
-            key='FlowLvlTgt',
-            name='Flow Level Target',
-            native_unit_of_measurement=PERCENTAGE,
-            value_fn=lambda node: safe_get(node, 'Ventilation', 'FlowLvlTgt'),
-            sensor_key='FlowLvlTgt',
-            node_type='UCRH',
-        ),
-        DucoboxNodeSensorEntityDescription(
-            key='IaqRh',
-            name='Humidity Air Quality',
-            native_unit_of_measurement=PERCENTAGE,
-            value_fn=lambda node: process_node_iaq(
-                safe_get(node, 'Sensor', 'data', 'IaqRh')
-            ),
-            sensor_key='IaqRh',
-            node_type='UCRH',
-        ),
-        DucoboxNodeSensorEntityDescription(
-            key='Rh',
-            name='Relative Humidity',
-            native_unit_of_measurement=PERCENTAGE,
-            device_class=SensorDeviceClass.HUMIDITY,
-            value_fn=lambda node: process_node_iaq(
-                safe_get(node, 'Sensor', 'data', 'Rh')
-            ),
-            sensor_key='Rh',
-            node_type='UCRH',
-        ),
-        DucoboxNodeSensorEntityDescription(
-            key='Temp',
-            name='Temperature',
-            native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-            device_class=SensorDeviceClass.TEMPERATURE,
-            value_fn=lambda node: process_node_temperature(
-                safe_get(node, 'Sensor', 'data', 'Temp')
-            ),
-            sensor_key='Temp',
-            node_type='UCRH',
-        ),
-        
-    ],
-    # Add other node types and their sensors if needed
-}
+
+def node_sensor_descriptions(node_type: str, fields: list[dict]) -> list[DucoboxNodeSensorEntityDescription]:
+    """Create the sensor descriptions of a node type from its compiled schema fields."""
+    return [
+        DucoboxNodeSensorEntityDescription(
+            key=field['key'],
+            name=field['name'],
+            native_unit_of_measurement=field['unit'],
+            device_class=SensorDeviceClass(field['device_class']) if field['device_class'] else None,
+            state_class=SensorStateClass(field['state_class']) if field.get('state_class') else None,
+            value_fn=methodcaller('get', field['key']),
+            sensor_key=field['key'],
+            node_type=node_type,
+        )
+        for field in fields
+    ]
+
+DERIVED_SENSOR_KEYS = frozenset(description.key for description in DERIVED_SENSORS)
+
+
+def _timestamp(value: float | None) -> datetime | None:
+    if value is None:
+        return None
+    return datetime.fromtimestamp(value, tz=timezone.utc)
+
+
+# Metrics of the optional trend analysis (see trends.py)
+TREND_SENSORS: tuple[DucoboxSensorEntityDescription, ...] = (
+    # Shift of the fan pressure at the current speed from the clean-filter baseline
+    DucoboxSensorEntityDescription(
+        key="FilterDegradation",
+        name="Filter Degradation",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda data: data.derived_value('FilterDegradation'),
+    ),
+    # Time at which TimeFilterRemain reaches zero at its observed countdown rate
+    DucoboxSensorEntityDescription(
+        key="FilterChangeTime",
+        name="Predicted Filter Change",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        value_fn=lambda data: _timestamp(data.derived_value('FilterChangeTime')),
+    ),
+)
+
+TREND_SENSOR_KEYS = frozenset(description.key for description in TREND_SENSORS)
+
+# Aggregates over the nodes of each configured zone (see zones.py)
+ZONE_SENSORS: tuple[SensorEntityDescription, ...] = (
+    SensorEntityDescription(
+        key="Co2Max",
+        name="Maximum CO₂",
+        native_unit_of_measurement=CONCENTRATION_PARTS_PER_MILLION,
+        device_class=SensorDeviceClass.CO2,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorEntityDescription(
+        key="RhMean",
+        name="Mean Relative Humidity",
+        native_unit_of_measurement=PERCENTAGE,
+        device_class=SensorDeviceClass.HUMIDITY,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorEntityDescription(
+        key="TempMean",
+        name="Mean Temperature",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=SensorDeviceClass.TEMPERATURE,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SensorEntityDescription(
+        key="FlowLvlTgtMax",
+        name="Highest Flow Level Target",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+)
+
+# Numeric sensors for which the coordinator keeps a ring buffer of recent values
+ROLLING_STATISTICS_KEYS = frozenset({
+    'TempOda', 'TempSup', 'TempEta', 'TempEha',
+    'SpeedSup', 'SpeedEha', 'PressSup', 'PressEha',
+    'RssiWifi', 'Temp', 'Rh', 'Co2', 'IaqRh', 'IaqCo2', 'FlowLvlTgt',
+})
+
+# (statistic, name suffix) of the optional rolling statistic sensors
+ROLLING_STATISTICS = (
+    ('mean', 'Mean'),
+    ('min', 'Minimum'),
+    ('max', 'Maximum'),
+    ('rate', 'Rate of Change'),
+)
@@ -0,0 +1,236 @@
+from collections.abc import Iterator
+from datetime import datetime, timedelta, timezone
+import gzip
+import json
+import logging
+import os
+import shutil
+
+_LOGGER = logging.getLogger(__name__)
+
+EXPORT_MODE_SNAPSHOT = 'snapshot'
+EXPORT_MODE_DIFF = 'diff'
+EXPORT_MODES = [EXPORT_MODE_SNAPSHOT, EXPORT_MODE_DIFF]
+
+# A file is closed when it reaches this compressed size or age, or the UTC day ends
+ROTATE_BYTES = 16 * 1024 * 1024
+ROTATE_AGE = 3600
+
+# Buffered records are written once there are this many, or the oldest is this old
+FLUSH_RECORDS = 30
+FLUSH_AGE = 300
+
+FILE_SUFFIX = '.ndjson.gz'
+
+# Key of a diff listing the keys removed from a dict
+REMOVED = '-'
+
+_SAME = object()
+
+
+def _day(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).strftime('%Y-%m-%d')
+
+
+def export_payload(data: dict) -> dict:
+    """Return the exported form of a poll: nodes keyed by their id, so they can be diffed."""
+    return {
+        'info': data.get('info'),
+        'nodes': {str(node.get('Node')): node for node in data.get('nodes') or []},
+        'config_nodes': data.get('config_nodes'),
+    }
+
+
+def diff_payload(old, new):
+    """Return the changes that turn `old` into `new`, or _SAME.
+
+    Dicts are diffed recursively and carry the keys they lost under REMOVED;
+    any other changed value is replaced as a whole.
+    """
+    if isinstance(old, dict) and isinstance(new, dict):
+        diff = {}
+        for key, value in new.items():
+            if key not in old:
+                diff[key] = value
+                continue
+            changed = diff_payload(old[key], value)
+            if changed is not _SAME:
+                diff[key] = changed
+        removed = [key for key in old if key not in new]
+        if removed:
+            diff[REMOVED] = removed
+        return diff if diff else _SAME
+    return _SAME if old == new else new
+
+
+def apply_diff(old, diff):
+    """Return `old` with a diff from `diff_payload` applied; `old` is updated in place."""
+    if not isinstance(old, dict) or not isinstance(diff, dict):
+        return diff
+    for key in diff.get(REMOVED, ()):
+        old.pop(key, None)
+    for key, value in diff.items():
+        if key != REMOVED:
+            old[key] = apply_diff(old[key], value) if key in old else value
+    return old
+
+
+class DucoboxExporter:
+    """Append the payloads of every poll to compressed NDJSON files.
+
+    Records are buffered by `add`, which only keeps references, taken off
+    the buffer by `take` on the same thread, and written by `write`, which
+    runs in the executor: the diffing, JSON encoding and compression never
+    happen on the event loop. Each flush appends one gzip
+    member to the current file. Files live in `<directory>/<board>/<UTC
+    day>/` and are rotated by size, age and day; day directories older than
+    `retention_days` are deleted on rotation.
+
+    In diff mode the first record of each file holds the full payloads and
+    the others only the changes since the previous record, so every file can
+    be read on its own.
+    """
+
+    def __init__(self, directory: str, mode: str = EXPORT_MODE_DIFF, retention_days: int = 7):
+        self.directory = directory
+        self.mode = mode
+        self.retention_days = retention_days
+        self._pending: list[tuple[float, str, dict]] = []
+        self._previous: dict | None = None
+        self._path: str | None = None
+        self._opened_at = 0.0
+        self._day: str | None = None
+        self.counters = {'records': 0, 'bytes': 0, 'files': 0, 'removed_days': 0, 'errors': 0}
+
+    def add(self, timestamp: float, board_id: str, data: dict) -> None:
+        self._pending.append((timestamp, board_id, export_payload(data)))
+
+    def should_flush(self, now: float) -> bool:
+        return bool(self._pending) and (
+            len(self._pending) >= FLUSH_RECORDS or now - self._pending[0][0] >= FLUSH_AGE
+        )
+
+    def take(self) -> list[tuple[float, str, dict]]:
+        """Return and clear the buffered records; call it on the thread that calls `add`."""
+        records, self._pending = self._pending, []
+        return records
+
+    def write(self, records: list[tuple[float, str, dict]]) -> None:
+        """Write records returned by `take`; blocking, run it in the executor."""
+        if not records:
+            return
+
+        try:
+            lines = []
+            for timestamp, board_id, payload in records:
+                if self._rotate_due(timestamp, board_id):
+                    self._write(lines)
+                    lines = []
+                    self._open(timestamp, board_id)
+                lines.append(self._encode(timestamp, payload))
+            self._write(lines)
+        except OSError as e:
+            self.counters['errors'] += 1
+            _LOGGER.error(f"Failed to export {len(records)} records to {self.directory}: {e}")
+            # Start over with a fresh, self-contained file
+            self._path = None
+
+    def _rotate_due(self, timestamp: float, board_id: str) -> bool:
+        if self._path is None or _day(timestamp) != self._day:
+            return True
+        if not self._path.startswith(os.path.join(self.directory, board_id, '')):
+            return True
+        if timestamp - self._opened_at >= ROTATE_AGE:
+            return True
+        return os.path.exists(self._path) and os.path.getsize(self._path) >= ROTATE_BYTES
+
+    def _open(self, timestamp: float, board_id: str) -> None:
+        self._day = _day(timestamp)
+        day_directory = os.path.join(self.directory, board_id, self._day)
+        os.makedirs(day_directory, exist_ok=True)
+        name = datetime.fromtimestamp(timestamp, tz=timezone.utc).strftime('%H%M%S')
+        self._path = os.path.join(day_directory, f'{board_id}-{self._day}T{name}{FILE_SUFFIX}')
+        self._opened_at = timestamp
+        self._previous = None
+        self.counters['files'] += 1
+        self._remove_expired(board_id, timestamp)
+
+    def _encode(self, timestamp: float, payload: dict) -> str:
+        if self.mode == EXPORT_MODE_DIFF and self._previous is not None:
+            diff = diff_payload(self._previous, payload)
+            record = {'t': timestamp, 'diff': {} if diff is _SAME else diff}
+        else:
+            record = {'t': timestamp, 'full': payload}
+        self._previous = payload
+        return json.dumps(record, separators=(',', ':'))
+
+    def _write(self, lines: list[str]) -> None:
+        if not lines:
+            return
+        data = gzip.compress(('\n'.join(lines) + '\n').encode())
+        with open(self._path, 'ab') as file:
+            file.write(data)
+        self.counters['records'] += len(lines)
+        self.counters['bytes'] += len(data)
+
+    def _remove_expired(self, board_id: str, now: float) -> None:
+        if not self.retention_days:
+            return
+        oldest = _day(now - timedelta(days=self.retention_days).total_seconds())
+        board_directory = os.path.join(self.directory, board_id)
+        for day in os.listdir(board_directory):
+            if day < oldest:
+                shutil.rmtree(os.path.join(board_directory, day), ignore_errors=True)
+                self.counters['removed_days'] += 1
+
+    def stats(self) -> dict:
+        return {
+            'directory': self.directory,
+            'mode': self.mode,
+            'retention_days': self.retention_days,
+            'pending': len(self._pending),
+            'current_file': self._path,
+            **self.counters,
+        }
+
+
+def iter_file(path: str) -> Iterator[dict]:
+    """Yield {'time', 'info', 'nodes', 'config_nodes'} per record of one export file.
+
+    Diff records are applied in place to the payloads of the previous
+    record, so copy a yielded record to keep it beyond the next one.
+    """
+    current = None
+    with gzip.open(path, 'rt') as file:
+        for line in file:
+            record = json.loads(line)
+            if 'full' in record:
+                current = record['full']
+            elif current is not None:
+                current = apply_diff(current, record['diff'])
+            else:
+                continue
+            yield {
+                'time': record['t'],
+                'info': current['info'],
+                'nodes': list(current['nodes'].values()),
+                'config_nodes': current['config_nodes'],
+            }
+
+
+def day_files(directory: str, board_id: str, day: str) -> list[str]:
+    """Return the export files of one board and UTC day (YYYY-MM-DD), oldest first."""
+    day_directory = os.path.join(directory, board_id, day)
+    if not os.path.isdir(day_directory):
+        return []
+    return [
+        os.path.join(day_directory, name)
+        for name in sorted(os.listdir(day_directory))
+        if name.endswith(FILE_SUFFIX)
+    ]
+
+
+def read_day(directory: str, board_id: str, day: str) -> Iterator[dict]:
+    """Yield the records of one board and UTC day in time order."""
+    for path in day_files(directory, board_id, day):
+        yield from iter_file(path)
@@ -0,0 +1,103 @@
+from collections.abc import Callable
+
+from .utils import safe_get
+
+# Refresh interval of node types without sensor values (ventilation state only)
+IDLE_NODE_INTERVAL = 300
+
+# The whole /info/nodes list is fetched at least this often to pick up added
+# or removed nodes
+FULL_REFRESH_INTERVAL = 3600
+
+# When more than this fraction of the nodes is due, one /info/nodes request is
+# cheaper than the per-node requests
+FULL_REFRESH_FRACTION = 0.5
+
+
+def parse_node_intervals(value: str) -> dict[str, int]:
+    """Parse 'UCBAT=900, SWITCH=900' into {'UCBAT': 900, 'SWITCH': 900}."""
+    intervals = {}
+    for part in value.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        node_type, separator, seconds = part.partition('=')
+        if not separator or not node_type.strip():
+            raise ValueError(f"expected <node type>=<seconds>, got {part}")
+        intervals[node_type.strip()] = int(seconds)
+    return intervals
+
+
+class DucoboxNodeScheduler:
+    """Decide which nodes are refreshed through /info/nodes/<id> on a poll.
+
+    Node types with sensor values are refreshed every `base_interval`, node
+    types without them every IDLE_NODE_INTERVAL, unless `intervals` overrides
+    the interval of a type. The latest payload of every node is kept, so each
+    poll still sees the full node list.
+    """
+
+    def __init__(self, base_interval: float, intervals: dict[str, int], has_sensors: Callable[[str], bool]):
+        self.base_interval = base_interval
+        self.intervals = intervals
+        self._has_sensors = has_sensors
+        self._nodes: dict[int, dict] = {}
+        self._fetched_at: dict[int, float] = {}
+        self._full_refresh_at = float('-inf')
+        self.counters = {'full_refreshes': 0, 'node_requests': 0, 'node_failures': 0, 'nodes_skipped': 0}
+
+    def interval(self, node_type: str) -> float:
+        if node_type in self.intervals:
+            return self.intervals[node_type]
+        return self.base_interval if self._has_sensors(node_type) else IDLE_NODE_INTERVAL
+
+    def due(self, now: float) -> list[int] | None:
+        """Return the node ids to refresh, or None if the full list should be fetched."""
+        if now - self._full_refresh_at >= FULL_REFRESH_INTERVAL or not self._nodes:
+            return None
+
+        # Allow some jitter so a node is not skipped for a whole interval
+        slack = self.base_interval / 2
+        due = [
+            node_id for node_id, node in self._nodes.items()
+            if now - self._fetched_at[node_id] + slack >= self.interval(_node_type(node))
+        ]
+        if len(due) > len(self._nodes) * FULL_REFRESH_FRACTION:
+            return None
+
+        self.counters['nodes_skipped'] += len(self._nodes) - len(due)
+        return due
+
+    def full_refresh(self, nodes: list[dict], now: float) -> None:
+        self.counters['full_refreshes'] += 1
+        self._full_refresh_at = now
+        self._nodes = {node.get('Node'): node for node in nodes}
+        self._fetched_at = {node_id: now for node_id in self._nodes}
+
+    def update(self, node: dict, now: float) -> None:
+        self.counters['node_requests'] += 1
+        node_id = node.get('Node')
+        if node_id in self._nodes:
+            self._nodes[node_id] = node
+            self._fetched_at[node_id] = now
+
+    def fetched_at(self, node_id: int) -> float | None:
+        """Return when the kept payload of a node was fetched."""
+        return self._fetched_at.get(node_id)
+
+    def failed(self) -> None:
+        self.counters['node_failures'] += 1
+
+    def nodes(self) -> list[dict]:
+        return list(self._nodes.values())
+
+    def stats(self) -> dict:
+        node_types = {_node_type(node) for node in self._nodes.values()}
+        return {
+            'intervals': {node_type: self.interval(node_type) for node_type in sorted(node_types)},
+            'counters': self.counters,
+        }
+
+
+def _node_type(node: dict) -> str:
+    return safe_get(node, 'General', 'Type', 'Val') or 'Unknown'
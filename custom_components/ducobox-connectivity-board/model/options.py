@@ -0,0 +1,202 @@
+from datetime import timedelta
+import logging
+
+from ..const import (
+    CONF_SCAN_INTERVAL,
+    CONF_REQUEST_TIMEOUT,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_REQUEST_TIMEOUT,
+    CONF_REQUESTS_PER_SECOND,
+    CONF_MAX_IN_FLIGHT,
+    DEFAULT_REQUESTS_PER_SECOND,
+    DEFAULT_MAX_IN_FLIGHT,
+    CONF_ROLLING_WINDOW,
+    DEFAULT_ROLLING_WINDOW,
+    CONF_ADVANCED_PARAMETERS,
+    DEFAULT_ADVANCED_PARAMETERS,
+    CONF_SAMPLE_INTERVAL,
+    CONF_SAMPLE_AGGREGATE,
+    DEFAULT_SAMPLE_INTERVAL,
+    DEFAULT_SAMPLE_AGGREGATE,
+    CONF_COUNTDOWN_INTERVAL,
+    DEFAULT_COUNTDOWN_INTERVAL,
+    CONF_EXTERNAL_STATISTICS,
+    DEFAULT_EXTERNAL_STATISTICS,
+    CONF_SNAPSHOT_EVENT,
+    DEFAULT_SNAPSHOT_EVENT,
+    CONF_CONTROL,
+    DEFAULT_CONTROL,
+    CONF_AVAILABILITY_GRACE,
+    DEFAULT_AVAILABILITY_GRACE,
+    CONF_PROJECTED_REQUESTS,
+    DEFAULT_PROJECTED_REQUESTS,
+    CONF_ZONES,
+    DEFAULT_ZONES,
+    CONF_EXPORT,
+    CONF_EXPORT_MODE,
+    CONF_EXPORT_RETENTION,
+    DEFAULT_EXPORT,
+    DEFAULT_EXPORT_MODE,
+    DEFAULT_EXPORT_RETENTION,
+    EXPORT_DIRECTORY,
+    CONF_NODE_SCHEDULING,
+    CONF_NODE_INTERVALS,
+    DEFAULT_NODE_SCHEDULING,
+    DEFAULT_NODE_INTERVALS,
+    RELOAD_OPTIONS,
+)
+
+from .config_index import DucoboxConfigIndex
+from .control import DucoboxControlEngine
+from .deadband import DucoboxDeadbandFilter
+from .exporter import DucoboxExporter
+from .node_schedule import DucoboxNodeScheduler, parse_node_intervals
+from .scheduler import DucoboxRequestScheduler
+from .zones import compute_zone_aggregates, parse_zones
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def scan_interval(options: dict) -> timedelta:
+    """Return the poll interval set in the options."""
+    return timedelta(seconds=options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL))
+
+
+class DucoboxOptionsMixin:
+    """Option handling of the coordinator: reads the options into its components and applies changes live."""
+
+    def _init_options(self, options: dict) -> None:
+        """Set up the components and settings that follow the options."""
+        self.options = dict(options)
+        self.scheduler = DucoboxRequestScheduler(
+            requests_per_second=options.get(CONF_REQUESTS_PER_SECOND, DEFAULT_REQUESTS_PER_SECOND),
+            max_in_flight=options.get(CONF_MAX_IN_FLIGHT, DEFAULT_MAX_IN_FLIGHT),
+        )
+        self.config_index = DucoboxConfigIndex(
+            track_all=options.get(CONF_ADVANCED_PARAMETERS, DEFAULT_ADVANCED_PARAMETERS)
+        )
+        self.deadband = DucoboxDeadbandFilter.from_options(options)
+        self._history_size = options.get(CONF_ROLLING_WINDOW, DEFAULT_ROLLING_WINDOW)
+        self._sample_interval = options.get(CONF_SAMPLE_INTERVAL, DEFAULT_SAMPLE_INTERVAL)
+        self._sample_aggregate = options.get(CONF_SAMPLE_AGGREGATE, DEFAULT_SAMPLE_AGGREGATE)
+        self.countdown_interval = options.get(CONF_COUNTDOWN_INTERVAL, DEFAULT_COUNTDOWN_INTERVAL)
+        self._external_statistics = options.get(CONF_EXTERNAL_STATISTICS, DEFAULT_EXTERNAL_STATISTICS)
+        self._snapshot_event = options.get(CONF_SNAPSHOT_EVENT, DEFAULT_SNAPSHOT_EVENT)
+        self.control = self._build_control(options)
+        self._availability_grace = options.get(CONF_AVAILABILITY_GRACE, DEFAULT_AVAILABILITY_GRACE)
+        self.zones = parse_zones(options.get(CONF_ZONES, DEFAULT_ZONES))
+        self.exporter = self._build_exporter(options)
+        self.projected_requests = options.get(CONF_PROJECTED_REQUESTS, DEFAULT_PROJECTED_REQUESTS)
+        self.node_scheduler = self._build_node_scheduler(options)
+
+    @staticmethod
+    def _build_control(options: dict) -> DucoboxControlEngine | None:
+        if not options.get(CONF_CONTROL, DEFAULT_CONTROL):
+            return None
+        return DucoboxControlEngine.from_options(options)
+
+    def _build_exporter(self, options: dict) -> DucoboxExporter | None:
+        if not options.get(CONF_EXPORT, DEFAULT_EXPORT):
+            return None
+        return DucoboxExporter(
+            self.hass.config.path(EXPORT_DIRECTORY),
+            options.get(CONF_EXPORT_MODE, DEFAULT_EXPORT_MODE),
+            options.get(CONF_EXPORT_RETENTION, DEFAULT_EXPORT_RETENTION),
+        )
+
+    def _build_node_scheduler(self, options: dict) -> DucoboxNodeScheduler | None:
+        if not options.get(CONF_NODE_SCHEDULING, DEFAULT_NODE_SCHEDULING):
+            return None
+        return DucoboxNodeScheduler(
+            options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
+            parse_node_intervals(options.get(CONF_NODE_INTERVALS, DEFAULT_NODE_INTERVALS)),
+            self._node_type_has_sensors,
+        )
+
+    async def async_apply_options(self, options: dict) -> bool:
+        """Apply changed options to the running coordinator.
+
+        Only the components whose options changed are reconfigured; the
+        client, the entities and the polled data stay in place. Returns False
+        when an option adds or removes entities or stores, which needs a
+        reload of the config entry.
+        """
+        options = dict(options)
+        changed = {
+            key for key in self.options.keys() | options.keys() if self.options.get(key) != options.get(key)
+        }
+        if not changed:
+            return True
+
+        zones = parse_zones(options.get(CONF_ZONES, DEFAULT_ZONES))
+        if changed & RELOAD_OPTIONS or zones.keys() != self.zones.keys():
+            return False
+
+        def any_changed(*keys) -> bool:
+            return any(key in changed for key in keys)
+
+        if CONF_SCAN_INTERVAL in changed:
+            self.update_interval = scan_interval(options)
+            # Refresh now, so the next poll is scheduled at the new interval instead of the old one
+            await self.async_request_refresh()
+
+        if CONF_REQUEST_TIMEOUT in changed and self.transport is not None:
+            # The adapters of every client read the shared settings on each request
+            self.transport.timeout = options.get(CONF_REQUEST_TIMEOUT, DEFAULT_REQUEST_TIMEOUT)
+
+        if any_changed(CONF_REQUESTS_PER_SECOND, CONF_MAX_IN_FLIGHT):
+            # Every request in flight has a client of its own, so the client pool follows by itself
+            self.scheduler.configure(
+                options.get(CONF_REQUESTS_PER_SECOND, DEFAULT_REQUESTS_PER_SECOND),
+                options.get(CONF_MAX_IN_FLIGHT, DEFAULT_MAX_IN_FLIGHT),
+            )
+
+        if any(key.startswith('deadband_') for key in changed):
+            self.deadband.configure(options)
+
+        if CONF_ROLLING_WINDOW in changed:
+            # The ring buffers are allocated at their size; start them over
+            self._history_size = options.get(CONF_ROLLING_WINDOW, DEFAULT_ROLLING_WINDOW)
+            self.history = {}
+
+        self._sample_aggregate = options.get(CONF_SAMPLE_AGGREGATE, DEFAULT_SAMPLE_AGGREGATE)
+        if CONF_SAMPLE_INTERVAL in changed:
+            self._sample_interval = options.get(CONF_SAMPLE_INTERVAL, DEFAULT_SAMPLE_INTERVAL)
+            self.statistics.sampling = bool(self._sample_interval)
+            if self._sample_unsub is not None or self._sample_interval:
+                self._async_restart_sampling()
+
+        if CONF_COUNTDOWN_INTERVAL in changed:
+            self.countdown_interval = options.get(CONF_COUNTDOWN_INTERVAL, DEFAULT_COUNTDOWN_INTERVAL)
+            if self._countdown_unsub is not None or self.countdown_interval:
+                self._async_restart_countdowns()
+
+        self._external_statistics = options.get(CONF_EXTERNAL_STATISTICS, DEFAULT_EXTERNAL_STATISTICS)
+        self._snapshot_event = options.get(CONF_SNAPSHOT_EVENT, DEFAULT_SNAPSHOT_EVENT)
+        self._availability_grace = options.get(CONF_AVAILABILITY_GRACE, DEFAULT_AVAILABILITY_GRACE)
+        self.projected_requests = options.get(CONF_PROJECTED_REQUESTS, DEFAULT_PROJECTED_REQUESTS)
+
+        if any(key.startswith(CONF_CONTROL) for key in changed):
+            self.control = self._build_control(options)
+            self._controllable = None
+
+        if any_changed(CONF_NODE_SCHEDULING, CONF_NODE_INTERVALS, CONF_SCAN_INTERVAL):
+            self.node_scheduler = self._build_node_scheduler(options)
+
+        if CONF_EXPORT in changed:
+            await self.async_flush_export()
+            self.exporter = self._build_exporter(options)
+        elif self.exporter is not None:
+            self.exporter.mode = options.get(CONF_EXPORT_MODE, DEFAULT_EXPORT_MODE)
+            self.exporter.retention_days = options.get(CONF_EXPORT_RETENTION, DEFAULT_EXPORT_RETENTION)
+
+        if CONF_ZONES in changed:
+            self.zones = zones
+            if self.data is not None:
+                self.zone_values = compute_zone_aggregates(self.data, self.zones)
+
+        self.options = options
+        _LOGGER.info(f"Applied changed options {sorted(changed)} without reloading")
+        # Availability, deadbands and zones may have changed for the current data
+        self.async_update_listeners()
+        return True
@@ -0,0 +1,48 @@
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from ..const import DOMAIN
+from .presets import PresetValues
+
+STORAGE_VERSION = 1
+STORAGE_KEY = f"{DOMAIN}.presets"
+
+
+class DucoboxPresetStore:
+    """Named sets of /config/nodes values, stored per config entry."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str):
+        self._store = Store(hass, STORAGE_VERSION, f"{STORAGE_KEY}.{entry_id}")
+        self._presets: dict[str, PresetValues] = {}
+
+    async def async_load(self) -> None:
+        data = await self._store.async_load() or {}
+        # JSON object keys are strings; node ids are ints everywhere else
+        self._presets = {
+            name: {int(node_id): node_values for node_id, node_values in preset.items()}
+            for name, preset in data.get('presets', {}).items()
+        }
+
+    async def _async_save(self) -> None:
+        await self._store.async_save({
+            'presets': {
+                name: {str(node_id): node_values for node_id, node_values in preset.items()}
+                for name, preset in self._presets.items()
+            }
+        })
+
+    def get(self, name: str) -> PresetValues | None:
+        return self._presets.get(name)
+
+    def names(self) -> list[str]:
+        return sorted(self._presets)
+
+    async def async_set(self, name: str, values: PresetValues) -> None:
+        self._presets[name] = values
+        await self._async_save()
+
+    async def async_remove(self, name: str) -> bool:
+        if self._presets.pop(name, None) is None:
+            return False
+        await self._async_save()
+        return True
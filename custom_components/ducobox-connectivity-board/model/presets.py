@@ -0,0 +1,33 @@
+from .config_index import DucoboxConfigIndex
+
+# {node_id: {key: value}}
+PresetValues = dict[int, dict[str, float]]
+
+
+def diff_preset(config_index: DucoboxConfigIndex, values: PresetValues) -> tuple[PresetValues, PresetValues, list[str]]:
+    """Compare preset values with the config index.
+
+    Returns (changes, original, errors): the keys whose value differs per
+    node, the current values of those keys, and why any value cannot be
+    written. Values are validated against the range and step of their
+    parameter, so a preset the board would reject fails before any write.
+    """
+    changes: PresetValues = {}
+    original: PresetValues = {}
+    errors = []
+
+    for node_id, node_values in values.items():
+        for key, value in node_values.items():
+            error = config_index.validate(node_id, key, value)
+            if error is not None:
+                errors.append(error)
+                continue
+
+            current = config_index.get(node_id, key)[0]
+            if current == value:
+                continue
+            changes.setdefault(node_id, {})[key] = value
+            original.setdefault(node_id, {})[key] = current
+
+    return changes, original, errors
+
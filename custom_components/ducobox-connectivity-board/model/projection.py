@@ -0,0 +1,140 @@
+from collections.abc import Callable
+import json
+
+# /info sections needed for the board and device identification
+BOARD_SOURCES = (
+    ('General', 'Board'),
+    ('General', 'Lan'),
+)
+
+# More projections than this cost more in round trips than the bytes they save
+MAX_PROJECTIONS = 3
+
+Source = tuple[str, str]
+
+# Required by entities whose /info inputs are unknown; forces the full /info
+FULL_INFO: Source = ('*', '*')
+
+
+def payload_size(payload) -> int:
+    """Approximate the transferred size of a JSON payload."""
+    return len(json.dumps(payload, separators=(',', ':')))
+
+
+def merge_info(parts: list[dict]) -> dict:
+    """Deep-merge the responses of several projected /info requests."""
+    merged: dict = {}
+    for part in parts:
+        _merge(merged, part or {})
+    return merged
+
+
+def _merge(target: dict, source: dict) -> None:
+    for key, value in source.items():
+        if isinstance(value, dict) and isinstance(target.get(key), dict):
+            _merge(target[key], value)
+        else:
+            target[key] = value
+
+
+def plan_projections(sources: set[Source], max_projections: int = MAX_PROJECTIONS) -> list[tuple[str, ...]] | None:
+    """Return the /info (module[, submodule]) requests covering `sources`.
+
+    A module with one needed submodule is requested as (module, submodule),
+    one with several as (module,). Returns None when the full /info is the
+    better request.
+    """
+    if not sources or FULL_INFO in sources:
+        return None
+
+    modules: dict[str, set[str]] = {}
+    for module, submodule in sources | set(BOARD_SOURCES):
+        modules.setdefault(module, set()).add(submodule)
+
+    plan = [
+        (module, next(iter(submodules))) if len(submodules) == 1 else (module,)
+        for module, submodules in sorted(modules.items())
+    ]
+    return plan if len(plan) <= max_projections else None
+
+
+class DucoboxInfoProjection:
+    """Track the /info sections that enabled entities read, and the bytes saved.
+
+    Entities register the sections they need while they are added to Home
+    Assistant and release them when they are removed (which includes being
+    disabled), so the plan follows the entity registry.
+    """
+
+    def __init__(self, max_projections: int = MAX_PROJECTIONS):
+        self._max_projections = max_projections
+        self._required: dict[Source, int] = {}
+        self._plan: list[tuple[str, ...]] | None = None
+        self._dirty = False
+        self.full_bytes: int | None = None
+        self.last_bytes: int | None = None
+        self.saved_bytes_total = 0
+        self.projected_polls = 0
+        self.apikey_polls = 0
+        # Why projection cannot save anything with the current settings, if it cannot
+        self.inactive_reason: str | None = None
+
+    def require(self, sources) -> Callable[[], None]:
+        """Register the sources of one entity; returns the function that releases them."""
+        sources = tuple(sources)
+        for source in sources:
+            self._required[source] = self._required.get(source, 0) + 1
+        self._dirty = True
+
+        def release() -> None:
+            for source in sources:
+                count = self._required.get(source, 0) - 1
+                if count > 0:
+                    self._required[source] = count
+                else:
+                    self._required.pop(source, None)
+            self._dirty = True
+
+        return release
+
+    def plan(self) -> list[tuple[str, ...]] | None:
+        if self._dirty:
+            self._plan = plan_projections(set(self._required), self._max_projections)
+            self._dirty = False
+        return self._plan
+
+    def record_full(self, size: int) -> None:
+        self.full_bytes = size
+        self.last_bytes = size
+
+    def record_projected(self, size: int, apikey_size: int = 0) -> None:
+        """Record a projected poll; `apikey_size` is a full /info fetched for an API key meanwhile."""
+        self.last_bytes = size + apikey_size
+        self.projected_polls += 1
+        if apikey_size:
+            self.apikey_polls += 1
+        if self.full_bytes is not None:
+            self.saved_bytes_total += max(self.full_bytes - self.last_bytes, 0)
+
+    def record_apikey(self, size: int) -> None:
+        """Record a poll served by the full /info that refreshed the API key; it saves nothing."""
+        self.full_bytes = size
+        self.last_bytes = size
+        self.apikey_polls += 1
+
+    def stats(self) -> dict:
+        return {
+            'active': self.inactive_reason is None,
+            'inactive_reason': self.inactive_reason,
+            'plan': [list(projection) for projection in self._plan] if self._plan else None,
+            'required': sorted('/'.join(source) for source in self._required),
+            'full_bytes': self.full_bytes,
+            'last_bytes': self.last_bytes,
+            'saved_bytes_last_poll': (
+                self.full_bytes - self.last_bytes
+                if self.full_bytes is not None and self.last_bytes is not None else None
+            ),
+            'saved_bytes_total': self.saved_bytes_total,
+            'projected_polls': self.projected_polls,
+            'apikey_polls': self.apikey_polls,
+        }
@@ -0,0 +1,48 @@
+import time
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from ..const import DOMAIN
+
+STORAGE_VERSION = 1
+STORAGE_KEY = f"{DOMAIN}.last_data"
+
+# Minimum number of seconds between two saves of the last good payloads
+SAVE_INTERVAL = 600
+
+
+class DucoboxRestoreStore:
+    """The raw payloads of the last successful poll, kept on disk.
+
+    Saves are throttled to one per SAVE_INTERVAL; the payloads are replaced in
+    memory on every poll so a pending save always writes the newest ones.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str):
+        self._store = Store(hass, STORAGE_VERSION, f"{STORAGE_KEY}.{entry_id}")
+        self._data: dict | None = None
+        self._saved_at = float('-inf')
+
+    async def async_load(self) -> dict | None:
+        """Return {'time', 'info', 'nodes', 'config_nodes', 'action_nodes'} or None."""
+        data = await self._store.async_load()
+        if not data or 'info' not in data:
+            return None
+        return data
+
+    def save(self, timestamp: float, data: dict, action_nodes: dict | None) -> None:
+        self._data = {
+            'time': timestamp,
+            'info': data['info'],
+            'nodes': data['nodes'],
+            'config_nodes': data.get('config_nodes'),
+            'action_nodes': action_nodes,
+        }
+        now = time.monotonic()
+        if now - self._saved_at >= SAVE_INTERVAL:
+            self._saved_at = now
+            self._store.async_delay_save(self._data_to_save, 1)
+
+    def _data_to_save(self) -> dict | None:
+        return self._data
@@ -0,0 +1,99 @@
+from array import array
+
+
+class RingBuffer:
+    """Fixed-size ring buffer of (timestamp, value) samples.
+
+    Values and timestamps live in two preallocated `array('d')` buffers, so
+    the memory cost is 16 bytes per slot regardless of how long it runs.
+    Appending is O(1); statistics are computed over at most `size` samples.
+    """
+
+    __slots__ = ('_times', '_values', '_size', '_index', '_count', '_sum')
+
+    def __init__(self, size: int):
+        self._size = max(int(size), 2)
+        self._times = array('d', bytes(8 * self._size))
+        self._values = array('d', bytes(8 * self._size))
+        self._index = 0
+        self._count = 0
+        self._sum = 0.0
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the sample storage in bytes."""
+        return (len(self._times) + len(self._values)) * self._values.itemsize
+
+    def append(self, timestamp: float, value: float) -> None:
+        """Store a sample, overwriting the oldest one when full."""
+        index = self._index
+        if self._count == self._size:
+            self._sum -= self._values[index]
+        else:
+            self._count += 1
+
+        self._times[index] = timestamp
+        self._values[index] = value
+        self._sum += value
+
+        index += 1
+        if index == self._size:
+            index = 0
+            # Resync the running sum once per wrap to avoid float drift.
+            self._sum = sum(self._values[:self._count])
+        self._index = index
+
+    def _ordered(self, buffer: array) -> array:
+        if self._count < self._size:
+            return buffer[:self._count]
+        return buffer[self._index:] + buffer[:self._index]
+
+    def last(self) -> float | None:
+        if not self._count:
+            return None
+        return self._values[self._index - 1]
+
+    def mean(self) -> float | None:
+        if not self._count:
+            return None
+        return self._sum / self._count
+
+    def min(self) -> float | None:
+        if not self._count:
+            return None
+        return min(self._values[:self._count])
+
+    def max(self) -> float | None:
+        if not self._count:
+            return None
+        return max(self._values[:self._count])
+
+    def rate(self, per: float = 60.0) -> float | None:
+        """Least-squares slope of value over time, in units per `per` seconds."""
+        if self._count < 2:
+            return None
+
+        times = self._ordered(self._times)
+        values = self._ordered(self._values)
+        origin = times[0]
+        count = self._count
+
+        mean_t = (sum(times) - origin * count) / count
+        mean_v = self._sum / count
+        numerator = 0.0
+        denominator = 0.0
+        for t, v in zip(times, values):
+            dt = t - origin - mean_t
+            numerator += dt * (v - mean_v)
+            denominator += dt * dt
+
+        if denominator == 0.0:
+            return None
+        return numerator / denominator * per
+
+    def stat(self, kind: str) -> float | None:
+        """Return one of 'mean', 'min', 'max' or 'rate'."""
+        return getattr(self, kind)()
@@ -0,0 +1,114 @@
+from copy import deepcopy
+
+from .utils import safe_get
+
+# Only live measurements are aggregated; everything else keeps the latest value
+INFO_SAMPLED_PREFIXES = (
+    ('Ventilation', 'Sensor'),
+    ('Ventilation', 'Fan'),
+    ('General', 'Lan', 'RssiWifi'),
+)
+NODE_SAMPLED_PREFIXES = (
+    ('Sensor', 'data'),
+)
+
+AGGREGATES = ('last', 'mean', 'min', 'max')
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _walk(data, path: tuple):
+    """Yield (path, container, key) for every numeric leaf below `data`."""
+    if isinstance(data, dict):
+        for key, value in data.items():
+            if _is_number(value):
+                yield path + (key,), data, key
+            elif isinstance(value, dict):
+                yield from _walk(value, path + (key,))
+
+
+def _copy_prefixes(data, prefixes: tuple):
+    """Return a copy of `data` that shares nothing below the prefixes with the original."""
+    if not isinstance(data, dict):
+        return data
+
+    data = dict(data)
+    for prefix in prefixes:
+        container = data
+        for key in prefix[:-1]:
+            value = container.get(key)
+            if not isinstance(value, dict):
+                break
+            container[key] = container = dict(value)
+        else:
+            if isinstance(container.get(prefix[-1]), dict):
+                container[prefix[-1]] = deepcopy(container[prefix[-1]])
+    return data
+
+
+class SampleWindow:
+    """Aggregate numeric /info and /info/nodes values between publications.
+
+    Each sampled leaf keeps [count, sum, min, max, last], so a window costs
+    the same amount of memory no matter how many samples it holds.
+    """
+
+    def __init__(self):
+        self._leaves: dict[tuple, list] = {}
+        self.samples = 0
+
+    def reset(self) -> None:
+        self._leaves.clear()
+        self.samples = 0
+
+    def _leaves_of(self, data: dict):
+        for prefix in INFO_SAMPLED_PREFIXES:
+            yield from _walk(safe_get(data, 'info', *prefix), ('info',) + prefix)
+        for node in data.get('nodes') or []:
+            for prefix in NODE_SAMPLED_PREFIXES:
+                yield from _walk(safe_get(node, *prefix), ('nodes', node.get('Node')) + prefix)
+
+    def add(self, data: dict) -> None:
+        """Add one sample of live data to the window."""
+        self.samples += 1
+        for path, container, key in self._leaves_of(data):
+            value = container[key]
+            leaf = self._leaves.get(path)
+            if leaf is None:
+                self._leaves[path] = [1, value, value, value, value]
+                continue
+            leaf[0] += 1
+            leaf[1] += value
+            if value < leaf[2]:
+                leaf[2] = value
+            if value > leaf[3]:
+                leaf[3] = value
+            leaf[4] = value
+
+    def apply(self, data: dict, aggregate: str) -> dict:
+        """Return `data` with the sampled leaves replaced by their aggregate over the window.
+
+        The sampled sections are copied, so payloads kept elsewhere (such as
+        the node scheduler's) are not aggregated again on the next poll.
+        """
+        if aggregate == 'last' or not self._leaves:
+            return data
+
+        data = {
+            **data,
+            'info': _copy_prefixes(data.get('info'), INFO_SAMPLED_PREFIXES),
+            'nodes': [_copy_prefixes(node, NODE_SAMPLED_PREFIXES) for node in data.get('nodes') or []],
+        }
+        for path, container, key in self._leaves_of(data):
+            leaf = self._leaves.get(path)
+            if leaf is None:
+                continue
+            if aggregate == 'mean':
+                container[key] = leaf[1] / leaf[0]
+            elif aggregate == 'min':
+                container[key] = leaf[2]
+            elif aggregate == 'max':
+                container[key] = leaf[3]
+        return data
@@ -0,0 +1,137 @@
+import asyncio
+import heapq
+import itertools
+import time
+from contextlib import asynccontextmanager
+
+# Lower value = served first.
+PRIORITY_USER_WRITE = 0
+PRIORITY_READ_BACK = 1
+PRIORITY_LIVE_POLL = 2
+PRIORITY_CONFIG_POLL = 3
+
+PRIORITY_NAMES = {
+    PRIORITY_USER_WRITE: 'user_write',
+    PRIORITY_READ_BACK: 'read_back',
+    PRIORITY_LIVE_POLL: 'live_poll',
+    PRIORITY_CONFIG_POLL: 'config_poll',
+}
+
+
+class DucoboxRequestScheduler:
+    """Serialize requests to a single Connectivity Board.
+
+    Waiters are served strictly by priority class (FIFO within a class). A
+    request is only released when both a token is available in the bucket and
+    the number of requests in flight is below the configured maximum.
+    """
+
+    def __init__(self, requests_per_second: float, max_in_flight: int, burst: float | None = None):
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._seq = itertools.count()
+        self._in_flight = 0
+        self._timer: asyncio.TimerHandle | None = None
+        self._rate = 1.0
+        self._capacity = 1.0
+        self._tokens = 0.0
+        self._last_refill = time.monotonic()
+        self._wait_stats = {
+            priority: {'requests': 0, 'wait_total': 0.0, 'wait_max': 0.0, 'wait_last': 0.0}
+            for priority in PRIORITY_NAMES
+        }
+        self.configure(requests_per_second, max_in_flight, burst)
+        self._tokens = self._capacity
+
+    def configure(self, requests_per_second: float, max_in_flight: int, burst: float | None = None) -> None:
+        """Apply new limits; queued waiters are re-evaluated immediately."""
+        self._refill()
+        self._rate = max(float(requests_per_second), 0.01)
+        self._capacity = float(burst) if burst else max(1.0, self._rate)
+        self._tokens = min(self._tokens, self._capacity)
+        self._max_in_flight = max(int(max_in_flight), 1)
+        if self._waiters:
+            self._dispatch()
+
+    @asynccontextmanager
+    async def slot(self, priority: int):
+        """Hold one request slot for the duration of the block."""
+        await self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release()
+
+    async def acquire(self, priority: int) -> None:
+        """Wait until a request of the given priority may be sent."""
+        future = asyncio.get_running_loop().create_future()
+        enqueued = time.monotonic()
+        heapq.heappush(self._waiters, (priority, next(self._seq), future))
+        self._dispatch()
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The slot was granted right before we got cancelled.
+                self.release()
+            raise
+
+        waited = time.monotonic() - enqueued
+        stats = self._wait_stats[priority]
+        stats['requests'] += 1
+        stats['wait_total'] += waited
+        stats['wait_last'] = waited
+        stats['wait_max'] = max(stats['wait_max'], waited)
+
+    def release(self) -> None:
+        """Return a slot obtained through `acquire`."""
+        self._in_flight -= 1
+        self._dispatch()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self._capacity, self._tokens + (now - self._last_refill) * self._rate)
+        self._last_refill = now
+
+    def _dispatch(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        self._refill()
+        while self._waiters and self._in_flight < self._max_in_flight:
+            _, _, future = self._waiters[0]
+            if future.done():
+                # Cancelled while queued.
+                heapq.heappop(self._waiters)
+                continue
+
+            if self._tokens < 1.0:
+                delay = (1.0 - self._tokens) / self._rate
+                self._timer = asyncio.get_running_loop().call_later(delay, self._dispatch)
+                return
+
+            heapq.heappop(self._waiters)
+            self._tokens -= 1.0
+            self._in_flight += 1
+            future.set_result(None)
+
+    def stats(self) -> dict:
+        """Return queue-wait metrics per priority class."""
+        classes = {}
+        for priority, stats in self._wait_stats.items():
+            requests = stats['requests']
+            classes[PRIORITY_NAMES[priority]] = {
+                'requests': requests,
+                'wait_mean': stats['wait_total'] / requests if requests else 0.0,
+                'wait_max': stats['wait_max'],
+                'wait_last': stats['wait_last'],
+            }
+
+        return {
+            'requests_per_second': self._rate,
+            'max_in_flight': self._max_in_flight,
+            'in_flight': self._in_flight,
+            'queue_depth': sum(1 for _, _, future in self._waiters if not future.done()),
+            'classes': classes,
+        }
@@ -0,0 +1,133 @@
+import re
+
+from .snapshot import NODE_TEXT_FIELDS
+from .utils import safe_get
+
+# Bump when the compiled field format or the mappings below change, so cached
+# schemas compiled by an older version are discarded
+SCHEMA_VERSION = 2
+
+# Sections of an /info/nodes entry that are introspected for fields
+NODE_SECTIONS = (
+    ('Sensor', 'data'),
+    ('Ventilation',),
+)
+
+# Parameters that are known to carry no useful sensor value
+IGNORED_NODE_PARAMETERS = frozenset({'FlowLvlOvrl'})
+
+# Name, unit, device class and state class of the known /info/nodes
+# parameters; they are the string values of the Home Assistant constants
+KNOWN_NODE_PARAMETERS = {
+    'State': {'name': 'Ventilation State'},
+    'Mode': {'name': 'Ventilation Mode'},
+    'FlowLvlTgt': {'name': 'Flow Level Target', 'unit': '%', 'state_class': 'measurement'},
+    'TimeStateRemain': {'name': 'Time State Remaining', 'unit': 's'},
+    'TimeStateEnd': {'name': 'Time State End', 'unit': 's'},
+    'Temp': {'name': 'Temperature', 'unit': '°C', 'device_class': 'temperature', 'state_class': 'measurement'},
+    'Rh': {'name': 'Relative Humidity', 'unit': '%', 'device_class': 'humidity', 'state_class': 'measurement'},
+    'Co2': {'name': 'CO₂', 'unit': 'ppm', 'device_class': 'carbon_dioxide', 'state_class': 'measurement'},
+    'IaqRh': {'name': 'Humidity Air Quality', 'unit': '%', 'state_class': 'measurement'},
+    'IaqCo2': {'name': 'CO₂ Air Quality', 'unit': '%', 'state_class': 'measurement'},
+}
+
+# The known parameters each node type has sensors for. DucoPy reports every
+# Ventilation parameter of every node, with None for the ones a node does not
+# have, so presence alone does not tell them apart
+NODE_TYPE_PARAMETERS = {
+    'BOX': frozenset({'Mode', 'State', 'FlowLvlTgt', 'TimeStateRemain', 'TimeStateEnd', 'Temp', 'Rh', 'IaqRh'}),
+    'UCCO2': frozenset({'Temp', 'Co2', 'IaqCo2'}),
+    'BSRH': frozenset({'Temp', 'Rh', 'IaqRh'}),
+    'VLVRH': frozenset({'State', 'TimeStateRemain', 'TimeStateEnd', 'Mode', 'FlowLvlTgt', 'IaqRh', 'Rh', 'Temp'}),
+    'VLVCO2': frozenset({'State', 'TimeStateRemain', 'TimeStateEnd', 'Mode', 'FlowLvlTgt', 'Co2', 'IaqCo2', 'Temp'}),
+    'VLVCO2RH': frozenset({
+        'State', 'TimeStateRemain', 'TimeStateEnd', 'Mode', 'FlowLvlTgt', 'Co2', 'IaqCo2', 'Rh', 'IaqRh', 'Temp',
+    }),
+    'VLV': frozenset({'State', 'Mode', 'FlowLvlTgt'}),
+    'SWITCH': frozenset({'State', 'Mode'}),
+    'UCBAT': frozenset({'State', 'TimeStateRemain', 'TimeStateEnd', 'Mode'}),
+    'UCRH': frozenset({'State', 'TimeStateRemain', 'TimeStateEnd', 'Mode', 'FlowLvlTgt', 'IaqRh', 'Rh', 'Temp'}),
+}
+
+_TEXT_KEYS = frozenset(key for key, _ in NODE_TEXT_FIELDS)
+
+
+def _field_name(key: str) -> str:
+    """Turn an unknown parameter name such as 'PressOda' into 'Press Oda'."""
+    return re.sub(r'(?<=[a-z0-9])(?=[A-Z])', ' ', key)
+
+
+def _has_parameter(node_type: str, key: str, value) -> bool:
+    """Whether a parameter of an introspected section is a field of the node type.
+
+    Known parameters of known node types follow NODE_TYPE_PARAMETERS, even
+    while their value is None (the board reports some values, such as
+    TimeStateRemain, as None while they are 0). Any other parameter is a
+    field once a node reports a value for it.
+    """
+    parameters = NODE_TYPE_PARAMETERS.get(node_type)
+    if parameters is not None and key in KNOWN_NODE_PARAMETERS:
+        return key in parameters
+    return value is not None
+
+
+def introspect_node(node: dict, fields: dict[str, dict] | None = None) -> dict[str, dict]:
+    """Add the fields found in one /info/nodes entry to `fields`.
+
+    Unknown text values are skipped because the snapshot only stores the
+    known text fields. Unknown numeric parameters are measurements.
+    """
+    fields = {} if fields is None else fields
+    node_type = safe_get(node, 'General', 'Type', 'Val') or 'Unknown'
+
+    for section in NODE_SECTIONS:
+        values = safe_get(node, *section)
+        if not isinstance(values, dict):
+            continue
+
+        for key, value in values.items():
+            if key in fields or key in IGNORED_NODE_PARAMETERS or isinstance(value, (dict, list, bool)):
+                continue
+            if isinstance(value, str) and key not in _TEXT_KEYS:
+                continue
+            if not _has_parameter(node_type, key, value):
+                continue
+
+            known = KNOWN_NODE_PARAMETERS.get(key, {'state_class': 'measurement'})
+            fields[key] = {
+                'key': key,
+                'path': [*section, key],
+                'name': known.get('name', _field_name(key)),
+                'unit': known.get('unit'),
+                'device_class': known.get('device_class'),
+                'state_class': known.get('state_class'),
+                'text': key in _TEXT_KEYS,
+            }
+
+    return fields
+
+
+def compile_node_types(nodes: list[dict], node_types: set[str] | None = None) -> dict[str, list[dict]]:
+    """Compile the fields per node type from an /info/nodes payload.
+
+    Only the node types in `node_types` are compiled when it is given; the
+    fields of a type are the union over all its nodes.
+    """
+    compiled: dict[str, dict[str, dict]] = {}
+    for node in nodes:
+        node_type = safe_get(node, 'General', 'Type', 'Val') or 'Unknown'
+        if node_types is not None and node_type not in node_types:
+            continue
+        introspect_node(node, compiled.setdefault(node_type, {}))
+
+    return {node_type: list(fields.values()) for node_type, fields in compiled.items()}
+
+
+def layout_fields(node_types: dict[str, list[dict]]) -> list[tuple[str, tuple]]:
+    """Return the numeric (key, path) fields of all node types, for the snapshot layout."""
+    result = {}
+    for fields in node_types.values():
+        for field in fields:
+            if not field['text']:
+                result.setdefault(field['key'], tuple(field['path']))
+    return list(result.items())
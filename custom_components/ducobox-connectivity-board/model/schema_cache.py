@@ -0,0 +1,49 @@
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from ..const import DOMAIN
+from .schema import SCHEMA_VERSION
+
+STORAGE_VERSION = 1
+STORAGE_KEY = f"{DOMAIN}.schema"
+SAVE_DELAY = 10
+
+
+class DucoboxSchemaCache:
+    """Compiled node fields per node type, stored on disk per board firmware.
+
+    Only the schema of the firmware the board currently runs is kept; a
+    firmware update starts a new cache.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str):
+        self._store = Store(hass, STORAGE_VERSION, f"{STORAGE_KEY}.{entry_id}")
+        self._sw_version: str | None = None
+        self._node_types: dict[str, list[dict]] = {}
+
+    async def async_load(self) -> None:
+        data = await self._store.async_load() or {}
+        if data.get('schema_version') != SCHEMA_VERSION:
+            return
+        self._sw_version = data.get('sw_version')
+        self._node_types = data.get('node_types') or {}
+
+    def get(self, sw_version: str | None, node_type: str) -> list[dict] | None:
+        if sw_version != self._sw_version:
+            return None
+        return self._node_types.get(node_type)
+
+    def set(self, sw_version: str | None, node_types: dict[str, list[dict]]) -> None:
+        """Add compiled node types and schedule a save."""
+        if sw_version != self._sw_version:
+            self._sw_version = sw_version
+            self._node_types = {}
+        self._node_types.update(node_types)
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    def _data_to_save(self) -> dict:
+        return {
+            'schema_version': SCHEMA_VERSION,
+            'sw_version': self._sw_version,
+            'node_types': self._node_types,
+        }
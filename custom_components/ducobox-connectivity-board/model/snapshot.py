@@ -0,0 +1,268 @@
+from array import array
+from math import isnan
+import sys
+
+from .utils import safe_get
+
+# (key, path) of the numeric /info fields used by the integration
+BOX_FIELDS = (
+    ('TempOda', ('Ventilation', 'Sensor', 'TempOda', 'Val')),
+    ('TempSup', ('Ventilation', 'Sensor', 'TempSup', 'Val')),
+    ('TempEta', ('Ventilation', 'Sensor', 'TempEta', 'Val')),
+    ('TempEha', ('Ventilation', 'Sensor', 'TempEha', 'Val')),
+    ('SpeedSup', ('Ventilation', 'Fan', 'SpeedSup', 'Val')),
+    ('SpeedEha', ('Ventilation', 'Fan', 'SpeedEha', 'Val')),
+    ('PressSup', ('Ventilation', 'Fan', 'PressSup', 'Val')),
+    ('PressEha', ('Ventilation', 'Fan', 'PressEha', 'Val')),
+    ('RssiWifi', ('General', 'Lan', 'RssiWifi', 'Val')),
+    ('UpTime', ('General', 'Board', 'UpTime', 'Val')),
+    ('TimeFilterRemain', ('HeatRecovery', 'General', 'TimeFilterRemain', 'Val')),
+    ('BypassPos', ('HeatRecovery', 'Bypass', 'Pos', 'Val')),
+)
+
+# (key, path) of the numeric and text fields used per node of /info/nodes
+NODE_FIELDS = (
+    ('Temp', ('Sensor', 'data', 'Temp')),
+    ('Rh', ('Sensor', 'data', 'Rh')),
+    ('Co2', ('Sensor', 'data', 'Co2')),
+    ('IaqRh', ('Sensor', 'data', 'IaqRh')),
+    ('IaqCo2', ('Sensor', 'data', 'IaqCo2')),
+    ('FlowLvlTgt', ('Ventilation', 'FlowLvlTgt')),
+    ('TimeStateRemain', ('Ventilation', 'TimeStateRemain')),
+    ('TimeStateEnd', ('Ventilation', 'TimeStateEnd')),
+)
+NODE_TEXT_FIELDS = (
+    ('State', ('Ventilation', 'State')),
+    ('Mode', ('Ventilation', 'Mode')),
+)
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _pack(values) -> tuple[array, int]:
+    """Pack numbers into an `array('d')` plus a bitmask of the slots that held ints."""
+    packed = array('d')
+    ints = 0
+    for index, value in enumerate(values):
+        if not _is_number(value):
+            packed.append(float('nan'))
+            continue
+        packed.append(value)
+        if isinstance(value, int):
+            ints |= 1 << index
+    return packed, ints
+
+
+def _unpack(values: array, ints: int, index: int):
+    """Convert an array slot back to the value the board reported."""
+    value = values[index]
+    if isnan(value):
+        return None
+    return int(value) if ints >> index & 1 else value
+
+
+class SnapshotLayout:
+    """Maps field keys to slots of an `array('d')`; missing values are NaN."""
+
+    __slots__ = ('fields', 'index')
+
+    def __init__(self, fields):
+        self.fields = tuple(fields)
+        self.index = {key: i for i, (key, _) in enumerate(self.fields)}
+
+    def __len__(self) -> int:
+        return len(self.fields)
+
+    def extend(self, fields) -> 'SnapshotLayout':
+        """Return a layout with the given (key, path) fields appended."""
+        new_fields = [field for field in fields if field[0] not in self.index]
+        if not new_fields:
+            return self
+        return SnapshotLayout(self.fields + tuple(new_fields))
+
+    def pack(self, source) -> tuple[array, int]:
+        return _pack(safe_get(source, *path) for _, path in self.fields)
+
+    def value(self, values: array, ints: int, key: str):
+        index = self.index.get(key)
+        if index is None or index >= len(values):
+            return None
+        return _unpack(values, ints, index)
+
+
+BOX_LAYOUT = SnapshotLayout(BOX_FIELDS)
+NODE_LAYOUT = SnapshotLayout(NODE_FIELDS)
+
+
+class DucoboxBoardInfo:
+    """Static board identification, shared between snapshot generations."""
+
+    __slots__ = ('mac', 'box_name', 'box_subtype', 'sw_version')
+
+    def __init__(self, mac, box_name, box_subtype, sw_version):
+        self.mac = mac
+        self.box_name = box_name
+        self.box_subtype = box_subtype
+        self.sw_version = sw_version
+
+    @classmethod
+    def from_info(cls, info: dict, previous: 'DucoboxBoardInfo | None' = None) -> 'DucoboxBoardInfo':
+        board = cls(
+            safe_get(info, 'General', 'Lan', 'Mac', 'Val'),
+            safe_get(info, 'General', 'Board', 'BoxName', 'Val'),
+            safe_get(info, 'General', 'Board', 'BoxSubTypeName', 'Val'),
+            safe_get(info, 'General', 'Board', 'SwVersionBox', 'Val'),
+        )
+        if previous is not None and board == previous:
+            return previous
+        return board
+
+    def _key(self) -> tuple:
+        return (self.mac, self.box_name, self.box_subtype, self.sw_version)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, DucoboxBoardInfo):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self) -> int:
+        return hash(self._key())
+
+    @property
+    def device_id(self) -> str:
+        """Device id used in unique ids: the MAC address without separators."""
+        return (self.mac or 'unknown_mac').replace(':', '').lower()
+
+
+class DucoboxNodeSnapshot:
+    """Values of one node in one snapshot generation."""
+
+    __slots__ = ('node_id', 'node_type', 'layout', 'values', 'ints', 'texts')
+
+    def __init__(self, node_id: int, node_type: str, layout: SnapshotLayout, values: array, ints: int, texts: tuple):
+        self.node_id = node_id
+        self.node_type = node_type
+        self.layout = layout
+        self.values = values
+        self.ints = ints
+        self.texts = texts
+
+    @classmethod
+    def from_node(cls, node: dict, layout: SnapshotLayout = NODE_LAYOUT) -> 'DucoboxNodeSnapshot':
+        node_type = sys.intern(safe_get(node, 'General', 'Type', 'Val') or 'Unknown')
+        texts = tuple(safe_get(node, *path) for _, path in NODE_TEXT_FIELDS)
+        values, ints = layout.pack(node)
+        return cls(node.get('Node'), node_type, layout, values, ints, texts)
+
+    @property
+    def name(self) -> str:
+        return f"{self.node_id}:{self.node_type}"
+
+    def get(self, key: str):
+        """Return a field of this node, or None if it is unknown or missing."""
+        for index, (text_key, _) in enumerate(NODE_TEXT_FIELDS):
+            if text_key == key:
+                return self.texts[index]
+        return self.layout.value(self.values, self.ints, key)
+
+    def as_dict(self) -> dict:
+        """Return the fields of this node that have a value."""
+        values = {key: text for (key, _), text in zip(NODE_TEXT_FIELDS, self.texts) if text is not None}
+        for key, _ in self.layout.fields:
+            value = self.layout.value(self.values, self.ints, key)
+            if value is not None:
+                values[key] = value
+        return values
+
+
+class DucoboxSnapshot:
+    """Typed, compact replacement for the nested payload dicts of a poll.
+
+    Numeric box and node fields are stored in `array('d')` slots, with a
+    bitmask of the slots that held ints so values come back unchanged; board
+    identification, derived-metric layout and the static /action/nodes
+    payload are shared by reference between generations.
+    """
+
+    __slots__ = ('board', 'box', 'box_ints', 'derived_keys', 'derived', 'derived_ints', 'nodes', 'action_nodes')
+
+    def __init__(self, board, box, box_ints, derived_keys, derived, derived_ints, nodes, action_nodes):
+        self.board = board
+        self.box = box
+        self.box_ints = box_ints
+        self.derived_keys = derived_keys
+        self.derived = derived
+        self.derived_ints = derived_ints
+        self.nodes = nodes
+        self.action_nodes = action_nodes
+
+    @classmethod
+    def build(
+        cls,
+        info: dict,
+        nodes: list[dict],
+        derived: dict | None = None,
+        action_nodes: dict | None = None,
+        previous: 'DucoboxSnapshot | None' = None,
+        node_layout: SnapshotLayout = NODE_LAYOUT,
+    ) -> 'DucoboxSnapshot':
+        """Build a snapshot from raw /info and /info/nodes payloads."""
+        derived = derived or {}
+        derived_keys = tuple(derived)
+        if previous is not None:
+            if previous.derived_keys == derived_keys:
+                derived_keys = previous.derived_keys
+            if action_nodes is None:
+                action_nodes = previous.action_nodes
+
+        return cls(
+            DucoboxBoardInfo.from_info(info, previous.board if previous else None),
+            *BOX_LAYOUT.pack(info),
+            derived_keys,
+            *_pack(derived.values()),
+            {node.get('Node'): DucoboxNodeSnapshot.from_node(node, node_layout) for node in nodes},
+            action_nodes,
+        )
+
+    def box_value(self, key: str):
+        """Return a numeric /info field by key (see BOX_FIELDS)."""
+        return BOX_LAYOUT.value(self.box, self.box_ints, key)
+
+    def derived_value(self, key: str):
+        """Return a derived metric by key."""
+        try:
+            return _unpack(self.derived, self.derived_ints, self.derived_keys.index(key))
+        except ValueError:
+            return None
+
+    def as_dict(self) -> dict:
+        """Return board, box, derived and node values as plain dicts and lists."""
+        box = {key: BOX_LAYOUT.value(self.box, self.box_ints, key) for key, _ in BOX_LAYOUT.fields}
+        derived = {key: _unpack(self.derived, self.derived_ints, index) for index, key in enumerate(self.derived_keys)}
+        return {
+            'board': {
+                'mac': self.board.mac,
+                'box_name': self.board.box_name,
+                'box_subtype': self.board.box_subtype,
+                'sw_version': self.board.sw_version,
+            },
+            'box': {key: value for key, value in box.items() if value is not None},
+            'derived': {key: value for key, value in derived.items() if value is not None},
+            'nodes': [
+                {'node': node.node_id, 'type': node.node_type, 'values': node.as_dict()}
+                for node in self.nodes.values()
+            ],
+        }
+
+    def node(self, node_id: int) -> DucoboxNodeSnapshot | None:
+        return self.nodes.get(node_id)
+
+    def node_type(self, node_id: int) -> str:
+        node = self.nodes.get(node_id)
+        return node.node_type if node is not None else 'Unknown'
+
+    def node_name(self, node_id: int) -> str:
+        node = self.nodes.get(node_id)
+        return node.name if node is not None else f"{node_id}:Unknown"
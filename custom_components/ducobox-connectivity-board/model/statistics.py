@@ -0,0 +1,87 @@
+SHORT_TERM_PERIOD = 300
+LONG_TERM_PERIOD = 3600
+
+
+class _Bucket:
+    __slots__ = ('start', 'count', 'total', 'min', 'max')
+
+    def __init__(self, start: int):
+        self.start = start
+        self.count = 0
+        self.total = 0.0
+        self.min = float('inf')
+        self.max = float('-inf')
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def merge(self, other: '_Bucket') -> None:
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def row(self) -> tuple[int, float, float, float]:
+        return self.start, self.total / self.count, self.min, self.max
+
+
+class DucoboxStatisticsAccumulator:
+    """Accumulate 5-minute and hourly mean/min/max per sensor.
+
+    Samples are folded into the current 5-minute bucket; completed 5-minute
+    buckets are merged into the current hour, and completed hours are queued
+    until `pop_hours` hands them over for a batched import.
+
+    While `sampling` is set, raw samples are added with `add` and published
+    values are ignored: they aggregate the same samples and would count them
+    twice.
+    """
+
+    def __init__(self, short_term_keep: int = 12, sampling: bool = False):
+        self._short_term_keep = short_term_keep
+        self.sampling = sampling
+        self._current: dict[tuple, _Bucket] = {}
+        self._hour: dict[tuple, _Bucket] = {}
+        self.short_term: dict[tuple, list[tuple[int, float, float, float]]] = {}
+        self._pending: dict[tuple, list[tuple[int, float, float, float]]] = {}
+
+    def add(self, key: tuple, timestamp: float, value: float) -> None:
+        """Add a sample taken at `timestamp` (epoch seconds)."""
+        start = int(timestamp) // SHORT_TERM_PERIOD * SHORT_TERM_PERIOD
+        bucket = self._current.get(key)
+        if bucket is not None and bucket.start != start:
+            self._close_short_term(key, bucket)
+            bucket = None
+        if bucket is None:
+            bucket = self._current[key] = _Bucket(start)
+        bucket.add(value)
+
+    def add_published(self, key: tuple, timestamp: float, value: float) -> None:
+        """Add a published value, unless raw samples feed the accumulator."""
+        if not self.sampling:
+            self.add(key, timestamp, value)
+
+    def _close_short_term(self, key: tuple, bucket: _Bucket) -> None:
+        rows = self.short_term.setdefault(key, [])
+        rows.append(bucket.row())
+        del rows[:-self._short_term_keep]
+
+        hour_start = bucket.start // LONG_TERM_PERIOD * LONG_TERM_PERIOD
+        hour = self._hour.get(key)
+        if hour is not None and hour.start != hour_start:
+            self._pending.setdefault(key, []).append(hour.row())
+            hour = None
+        if hour is None:
+            hour = self._hour[key] = _Bucket(hour_start)
+        hour.merge(bucket)
+
+    def pop_hours(self) -> dict[tuple, list[tuple[int, float, float, float]]]:
+        """Return and clear the completed hourly rows per key."""
+        pending, self._pending = self._pending, {}
+        return pending
+
+    def pending_rows(self) -> int:
+        return sum(len(rows) for rows in self._pending.values())
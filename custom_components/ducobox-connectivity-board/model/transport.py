@@ -0,0 +1,258 @@
+import hashlib
+import logging
+import socket
+import ssl
+import sys
+import time
+from collections.abc import Callable
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .apikey import apikey_cache_duration, get_apikey, log_unsupported, set_apikey, supports_apikey
+
+_LOGGER = logging.getLogger(__name__)
+
+# SSLSocket._real_close is private CPython API, checked on 3.10 to 3.13. With
+# TLS 1.3 the session ticket arrives after the handshake, so the session is
+# stored again when the connection closes; on other versions it is only
+# stored after the handshake, which resumes TLS 1.2 sessions only.
+SESSION_ON_CLOSE = (3, 10) <= sys.version_info[:2] <= (3, 13) and callable(
+    getattr(ssl.SSLSocket, '_real_close', None)
+)
+
+# Errors that mean the board could not be reached; any other error drops a queued write
+RETRYABLE_WRITE_ERRORS = (requests.exceptions.ConnectionError, requests.exceptions.Timeout)
+
+# Connection errors that are not retried: a TLS failure may mean the host is not the board
+NON_RETRYABLE_WRITE_ERRORS = (requests.exceptions.SSLError,)
+
+
+def is_retryable_write_error(error: Exception) -> bool:
+    return isinstance(error, RETRYABLE_WRITE_ERRORS) and not isinstance(error, NON_RETRYABLE_WRITE_ERRORS)
+
+
+def certificate_fingerprint(der: bytes) -> str:
+    return hashlib.sha256(der).hexdigest()
+
+
+def fetch_certificate_fingerprint(base_url: str, timeout: float = 10.0) -> str | None:
+    """Return the SHA-256 fingerprint of the board certificate, or None for plain HTTP."""
+    url = urlsplit(base_url)
+    if url.scheme != 'https':
+        return None
+
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+    context.check_hostname = False
+    context.verify_mode = ssl.CERT_NONE
+    with socket.create_connection((url.hostname, url.port or 443), timeout=timeout) as sock:
+        with context.wrap_socket(sock, server_hostname=url.hostname) as tls_sock:
+            return certificate_fingerprint(tls_sock.getpeercert(binary_form=True))
+
+
+class DucoboxCertificateMismatch(Exception):
+    """The board presented a certificate other than the pinned one.
+
+    Deliberately not an OSError: requests, DucoPy and the write queue treat
+    those as connection problems and retry, against a host that may not be
+    the board.
+    """
+
+
+class _SessionSSLSocket(ssl.SSLSocket):
+    """Hands its TLS session back to the context before the socket closes (see SESSION_ON_CLOSE)."""
+
+    def _real_close(self, *args, **kwargs):
+        try:
+            if isinstance(self.context, DucoboxTLSContext):
+                self.context.store_session(self)
+        finally:
+            super()._real_close(*args, **kwargs)
+
+
+class DucoboxTLSContext(ssl.SSLContext):
+    """Client TLS context that resumes sessions and pins the board certificate.
+
+    The board presents a self-signed certificate, so instead of validating a
+    chain on every connection, the SHA-256 fingerprint seen at setup is
+    compared once per full handshake. Resumed handshakes skip the certificate
+    exchange and the comparison. Full and resumed handshakes are counted.
+    """
+
+    if SESSION_ON_CLOSE:
+        sslsocket_class = _SessionSSLSocket
+
+    def __new__(cls, fingerprint: str | None = None):
+        return super().__new__(cls, ssl.PROTOCOL_TLS_CLIENT)
+
+    def __init__(self, fingerprint: str | None = None):
+        self.check_hostname = False
+        self.verify_mode = ssl.CERT_NONE
+        self.fingerprint = fingerprint
+        self._session: ssl.SSLSession | None = None
+        self.counters = {'full': 0, 'resumed': 0, 'fingerprint_mismatches': 0}
+        self.handshake_time = {'full': 0.0, 'resumed': 0.0}
+
+    def store_session(self, sock: ssl.SSLSocket) -> None:
+        try:
+            session = sock.session
+        except (ValueError, OSError):
+            return
+        if session is not None:
+            self._session = session
+
+    def wrap_socket(self, sock, *args, **kwargs):
+        if self._session is not None:
+            kwargs.setdefault('session', self._session)
+
+        started = time.monotonic()
+        tls_sock = super().wrap_socket(sock, *args, **kwargs)
+        kind = 'resumed' if tls_sock.session_reused else 'full'
+        self.counters[kind] += 1
+        self.handshake_time[kind] += time.monotonic() - started
+
+        if kind == 'full' and self.fingerprint is not None:
+            fingerprint = certificate_fingerprint(tls_sock.getpeercert(binary_form=True))
+            if fingerprint != self.fingerprint:
+                self.counters['fingerprint_mismatches'] += 1
+                tls_sock.close()
+                raise DucoboxCertificateMismatch(
+                    f"Board certificate fingerprint {fingerprint} does not match the pinned {self.fingerprint}"
+                )
+
+        self.store_session(tls_sock)
+        return tls_sock
+
+    def stats(self) -> dict:
+        return {
+            'pinned_fingerprint': self.fingerprint,
+            'session_on_close': SESSION_ON_CLOSE,
+            'handshakes': self.counters,
+            'handshake_time_mean': {
+                kind: self.handshake_time[kind] / self.counters[kind] if self.counters[kind] else None
+                for kind in self.handshake_time
+            },
+        }
+
+
+class DucoboxTransportSettings:
+    """Settings shared by the adapters of every client; a change applies to the next request."""
+
+    def __init__(self, timeout: float | None = None):
+        self.timeout = timeout
+
+
+class DucoboxHTTPAdapter(HTTPAdapter):
+    """Requests adapter that applies the shared request timeout; DucoPy sets none itself."""
+
+    def __init__(self, settings: DucoboxTransportSettings, pool_maxsize: int):
+        self.settings = settings
+        super().__init__(pool_connections=1, pool_maxsize=pool_maxsize)
+
+    def send(self, request, stream=False, timeout=None, **kwargs):
+        if timeout is None:
+            timeout = self.settings.timeout
+        return super().send(request, stream=stream, timeout=timeout, **kwargs)
+
+
+class DucoboxTLSAdapter(DucoboxHTTPAdapter):
+    """Adapter that keeps up to `pool_maxsize` connections alive on a DucoboxTLSContext."""
+
+    def __init__(self, settings: DucoboxTransportSettings, tls_context: DucoboxTLSContext, pool_maxsize: int):
+        self.tls_context = tls_context
+        super().__init__(settings, pool_maxsize)
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['ssl_context'] = self.tls_context
+        return super().init_poolmanager(*args, **kwargs)
+
+
+def configure_transport(
+    duco_client,
+    fingerprint: str | None,
+    pool_maxsize: int,
+    settings: DucoboxTransportSettings,
+    tls_context: DucoboxTLSContext | None = None,
+) -> DucoboxTLSContext:
+    """Mount the session-resuming, pinned TLS adapter on a DucoPy client's session.
+
+    Passing the context of an earlier call shares its cached TLS session and
+    handshake counters between clients; `settings` is shared the same way.
+    """
+    if tls_context is None:
+        tls_context = DucoboxTLSContext(fingerprint)
+    session = duco_client.client.session
+    session.mount('https://', DucoboxTLSAdapter(settings, tls_context, pool_maxsize))
+    session.mount('http://', DucoboxHTTPAdapter(settings, pool_maxsize))
+    return tls_context
+
+
+class DucoboxClientPool:
+    """DucoPy clients for concurrent requests, one per request in flight.
+
+    requests.Session is not thread-safe, and DucoPy refreshes its API key on
+    the session, so every executor call checks out a client of its own.
+    Clients are created on demand by `factory`. Where the DucoPy version
+    allows it (see apikey.py), the newest API key is handed to a client on
+    checkout, so a key refreshed by one client is not fetched again by the
+    others. Checkout and checkin run on the event loop.
+    """
+
+    def __init__(self, primary, factory: Callable[[], object]):
+        self.primary = primary
+        self._factory = factory
+        self._idle = [primary]
+        self._created = 1
+        self._closed = False
+        self.share_api_key = supports_apikey(primary)
+        if not self.share_api_key:
+            log_unsupported()
+        self._api_key: str | None = None
+        self._api_key_timestamp = 0.0
+
+    def checkout(self):
+        if self._idle:
+            client = self._idle.pop()
+        else:
+            client = self._factory()
+            self._created += 1
+
+        if self.share_api_key and self._api_key is not None and get_apikey(client)[1] < self._api_key_timestamp:
+            set_apikey(client, self._api_key, self._api_key_timestamp)
+        return client
+
+    def checkin(self, client) -> None:
+        if self._closed:
+            # Returned by a request still in flight when the pool was closed
+            client.close()
+            return
+
+        if self.share_api_key:
+            api_key, timestamp = get_apikey(client)
+            if api_key is not None and timestamp > self._api_key_timestamp:
+                self._api_key = api_key
+                self._api_key_timestamp = timestamp
+        self._idle.append(client)
+
+    def apikey_cache_duration(self) -> float | None:
+        """Return how long DucoPy uses an API key, or None when the DucoPy version is not known."""
+        return apikey_cache_duration(self.primary) if self.share_api_key else None
+
+    def apikey_due(self) -> bool:
+        """Whether the next request refreshes the API key, which fetches the full /info."""
+        if not self.share_api_key:
+            return False
+        return time.time() - self._api_key_timestamp > apikey_cache_duration(self.primary)
+
+    def close(self) -> list:
+        """Stop handing out clients and return the idle ones for the caller to close.
+
+        Clients still checked out are closed on checkin.
+        """
+        self._closed = True
+        idle, self._idle = self._idle, []
+        return idle
+
+    def stats(self) -> dict:
+        return {'clients': self._created, 'idle': len(self._idle), 'share_api_key': self.share_api_key}
@@ -0,0 +1,33 @@
+import time
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from ..const import DOMAIN
+from .trends import DucoboxTrendAnalyzer
+
+STORAGE_VERSION = 1
+STORAGE_KEY = f"{DOMAIN}.trends"
+
+# Minimum number of seconds between two saves of the trend state
+SAVE_INTERVAL = 900
+
+
+class DucoboxTrendStore:
+    """The running fits and means of the trend analyzer, kept on disk across restarts."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str):
+        self._store = Store(hass, STORAGE_VERSION, f"{STORAGE_KEY}.{entry_id}")
+        self.analyzer: DucoboxTrendAnalyzer | None = None
+        self._saved_at = float('-inf')
+
+    async def async_load(self) -> DucoboxTrendAnalyzer:
+        """Load the saved state into `analyzer`; starts empty when there is none."""
+        self.analyzer = DucoboxTrendAnalyzer.from_dict(await self._store.async_load(), time.time())
+        return self.analyzer
+
+    def save(self) -> None:
+        now = time.monotonic()
+        if self.analyzer is not None and now - self._saved_at >= SAVE_INTERVAL:
+            self._saved_at = now
+            self._store.async_delay_save(self.analyzer.as_dict, 1)
@@ -0,0 +1,370 @@
+import logging
+from statistics import median
+
+from .snapshot import NODE_FIELDS
+from .utils import safe_get, process_pressure, process_speed
+
+_LOGGER = logging.getLogger(__name__)
+
+DAY = 86400.0
+
+# /info (module, submodule) sections the trend metrics are computed from
+TREND_SOURCES = (
+    ('Ventilation', 'Fan'),
+    ('HeatRecovery', 'General'),
+)
+
+# (side, speed key, pressure key) of the fans whose pressure/speed relation is tracked
+FAN_SIDES = (
+    ('supply', 'SpeedSup', 'PressSup'),
+    ('exhaust', 'SpeedEha', 'PressEha'),
+)
+
+# Seconds of samples after a filter change that form the clean-filter baseline
+FILTER_BASELINE_TIME = 3 * DAY
+# Half-life of the weight of samples in the current pressure/speed fit
+FILTER_RECENT_HALF_LIFE = 2 * DAY
+# Minimum (decayed) number of samples in each fit before degradation is reported
+FILTER_MIN_SAMPLES = 10
+# A rise of TimeFilterRemain by more than this many days means the filter was changed
+FILTER_RESET_JUMP = 7
+# Seconds of TimeFilterRemain history before its own countdown rate is used
+FILTER_PREDICTION_SPAN = 2 * DAY
+
+# Node parameters compared with their peers, and the drift (in their unit) that is flagged
+DRIFT_THRESHOLDS = {
+    'Temp': 1.5,
+    'Rh': 10.0,
+    'Co2': 200.0,
+}
+# Half-lives of the short- and long-term mean deviation from the peers
+DRIFT_SHORT_HALF_LIFE = DAY
+DRIFT_LONG_HALF_LIFE = 14 * DAY
+# Seconds a sensor must be followed before it can be flagged
+DRIFT_WARMUP = 3 * DAY
+# Minimum number of nodes reporting a parameter (including the node itself)
+DRIFT_MIN_PEERS = 3
+
+STATE_VERSION = 1
+
+_NODE_PATHS = dict(NODE_FIELDS)
+
+
+def _decay_factor(elapsed: float, half_life: float) -> float:
+    return 0.5 ** (max(elapsed, 0.0) / half_life)
+
+
+class OnlineRegression:
+    """Least-squares fit of y = intercept + slope * x, updated one point at a time.
+
+    Keeps weighted running means and co-moments (Welford), so memory is O(1)
+    however many points are added; `decay` down-weights everything added so
+    far, which turns the fit into an exponentially forgetting one.
+    """
+
+    __slots__ = ('weight', 'mean_x', 'mean_y', 'sxx', 'sxy')
+
+    def __init__(self, weight=0.0, mean_x=0.0, mean_y=0.0, sxx=0.0, sxy=0.0):
+        self.weight = weight
+        self.mean_x = mean_x
+        self.mean_y = mean_y
+        self.sxx = sxx
+        self.sxy = sxy
+
+    def add(self, x: float, y: float) -> None:
+        self.weight += 1.0
+        dx = x - self.mean_x
+        self.mean_x += dx / self.weight
+        self.mean_y += (y - self.mean_y) / self.weight
+        self.sxx += dx * (x - self.mean_x)
+        self.sxy += dx * (y - self.mean_y)
+
+    def decay(self, factor: float) -> None:
+        self.weight *= factor
+        self.sxx *= factor
+        self.sxy *= factor
+
+    @property
+    def slope(self) -> float | None:
+        if self.weight < 2 or self.sxx <= 1e-9 * self.weight:
+            return None
+        return self.sxy / self.sxx
+
+    def predict(self, x: float) -> float | None:
+        """Return the fitted y at x; the mean of y when x has not varied yet."""
+        if not self.weight:
+            return None
+        slope = self.slope
+        if slope is None:
+            return self.mean_y
+        return self.mean_y + slope * (x - self.mean_x)
+
+    def as_list(self) -> list[float]:
+        return [self.weight, self.mean_x, self.mean_y, self.sxx, self.sxy]
+
+
+class DecayingMean:
+    """Exponentially weighted running mean."""
+
+    __slots__ = ('weight', 'mean')
+
+    def __init__(self, weight=0.0, mean=0.0):
+        self.weight = weight
+        self.mean = mean
+
+    def add(self, value: float, factor: float) -> None:
+        self.weight = self.weight * factor + 1.0
+        self.mean += (value - self.mean) / self.weight
+
+    def as_list(self) -> list[float]:
+        return [self.weight, self.mean]
+
+
+class _FanModel:
+    """Clean-filter baseline and current fit of one fan's pressure against its speed."""
+
+    __slots__ = ('baseline', 'baseline_since', 'recent')
+
+    def __init__(self, baseline_since: float):
+        self.baseline = OnlineRegression()
+        self.baseline_since = baseline_since
+        self.recent = OnlineRegression()
+
+    def add(self, now: float, elapsed: float, speed: float, pressure: float) -> None:
+        if now - self.baseline_since < FILTER_BASELINE_TIME:
+            self.baseline.add(speed, pressure)
+        self.recent.decay(_decay_factor(elapsed, FILTER_RECENT_HALF_LIFE))
+        self.recent.add(speed, pressure)
+
+    def baseline_complete(self, now: float) -> bool:
+        return now - self.baseline_since >= FILTER_BASELINE_TIME and self.baseline.weight >= FILTER_MIN_SAMPLES
+
+    def degradation(self, now: float) -> float | None:
+        """Return how far (%) the pressure at the current fan speed has moved from the baseline."""
+        if not self.baseline_complete(now) or self.recent.weight < FILTER_MIN_SAMPLES:
+            return None
+        speed = self.recent.mean_x
+        baseline = self.baseline.predict(speed)
+        current = self.recent.predict(speed)
+        if not baseline or current is None:
+            return None
+        return round(abs(current - baseline) / abs(baseline) * 100.0, 1)
+
+
+class _DriftTracker:
+    """Short- and long-term mean deviation of one node parameter from its peers."""
+
+    __slots__ = ('short', 'long', 'since', 'drifting')
+
+    def __init__(self, since: float):
+        self.short = DecayingMean()
+        self.long = DecayingMean()
+        self.since = since
+        self.drifting = False
+
+    def drift(self) -> float:
+        return self.short.mean - self.long.mean
+
+
+class DucoboxTrendAnalyzer:
+    """Streaming filter-clogging and sensor-drift analytics over the polled values.
+
+    Everything is kept as running fits and means, so memory does not grow
+    with history and no recorder queries are needed:
+
+    - the pressure of each fan is fitted against its speed, once over the
+      first days after a filter change (the baseline) and once with
+      exponential forgetting; degradation is how far the current fit has
+      moved from the baseline at the current speed;
+    - TimeFilterRemain is fitted against time to predict the day it reaches
+      zero at its observed countdown rate;
+    - every node's Temp, Rh and Co2 deviation from the median of its peers is
+      followed short and long term; a sensor drifts when the two differ by
+      more than its threshold (a room that is always warmer does not).
+
+    A rise of TimeFilterRemain restarts the filter fits.
+    """
+
+    def __init__(self, now: float):
+        self._time: float | None = None
+        self._filter_remain: float | None = None
+        self._remain = OnlineRegression()
+        self._remain_since = now
+        self._fans = {side: _FanModel(now) for side, _, _ in FAN_SIDES}
+        self._drift: dict[tuple[int, str], _DriftTracker] = {}
+        self.filter_resets = 0
+
+    def _reset_filter(self, now: float) -> None:
+        self._remain = OnlineRegression()
+        self._remain_since = now
+        self._fans = {side: _FanModel(now) for side, _, _ in FAN_SIDES}
+
+    def update(self, now: float, info: dict, nodes: list[dict]) -> None:
+        """Add the values of one poll; `now` is the wall clock time."""
+        elapsed = now - self._time if self._time is not None else 0.0
+        self._time = now
+
+        remain = safe_get(info, 'HeatRecovery', 'General', 'TimeFilterRemain', 'Val')
+        if isinstance(remain, (int, float)):
+            if self._filter_remain is not None and remain - self._filter_remain > FILTER_RESET_JUMP:
+                _LOGGER.info(f"Filter time remaining rose from {self._filter_remain} to {remain} days, restarting filter trends")
+                self.filter_resets += 1
+                self._reset_filter(now)
+            self._filter_remain = remain
+            self._remain.add(now / DAY, remain)
+
+        fan = safe_get(info, 'Ventilation', 'Fan') or {}
+        for side, speed_key, pressure_key in FAN_SIDES:
+            speed = process_speed(safe_get(fan, speed_key, 'Val'))
+            pressure = process_pressure(safe_get(fan, pressure_key, 'Val'))
+            if speed and pressure is not None:
+                self._fans[side].add(now, elapsed, speed, pressure)
+
+        self._update_drift(now, elapsed, nodes)
+
+    def _update_drift(self, now: float, elapsed: float, nodes: list[dict]) -> None:
+        short_factor = _decay_factor(elapsed, DRIFT_SHORT_HALF_LIFE)
+        long_factor = _decay_factor(elapsed, DRIFT_LONG_HALF_LIFE)
+
+        for key, threshold in DRIFT_THRESHOLDS.items():
+            readings = {}
+            for node in nodes:
+                value = safe_get(node, *_NODE_PATHS[key])
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    readings[node.get('Node')] = value
+            if len(readings) < DRIFT_MIN_PEERS:
+                continue
+
+            for node_id, value in readings.items():
+                peers = median(other for peer_id, other in readings.items() if peer_id != node_id)
+                tracker = self._drift.get((node_id, key))
+                if tracker is None:
+                    tracker = self._drift[(node_id, key)] = _DriftTracker(now)
+                tracker.short.add(value - peers, short_factor)
+                tracker.long.add(value - peers, long_factor)
+
+                drifting = now - tracker.since >= DRIFT_WARMUP and abs(tracker.drift()) > threshold
+                if drifting != tracker.drifting:
+                    tracker.drifting = drifting
+                    if drifting:
+                        _LOGGER.warning(
+                            f"Node {node_id} {key} drifted {tracker.drift():+.1f} from its peers"
+                        )
+                    else:
+                        _LOGGER.info(f"Node {node_id} {key} is back in line with its peers")
+
+    def filter_degradation(self, now: float) -> float | None:
+        """Return the largest degradation (%) of the supply and exhaust fits."""
+        values = [
+            value for value in (model.degradation(now) for model in self._fans.values()) if value is not None
+        ]
+        return max(values) if values else None
+
+    def filter_change_time(self, now: float) -> float | None:
+        """Return the predicted time (epoch seconds) at which TimeFilterRemain reaches zero."""
+        if self._filter_remain is None:
+            return None
+        if self._filter_remain <= 0:
+            return now
+
+        slope = self._remain.slope
+        if now - self._remain_since >= FILTER_PREDICTION_SPAN and slope is not None and slope < 0:
+            predicted = (self._remain.mean_x - self._remain.mean_y / slope) * DAY
+        else:
+            # Not enough history yet: assume one day per day
+            predicted = now + self._filter_remain * DAY
+        return round(max(predicted, now) / 3600) * 3600
+
+    def metrics(self, now: float) -> dict:
+        """Return the box-level trend metrics, merged into the derived metrics of a snapshot."""
+        return {
+            'FilterDegradation': self.filter_degradation(now),
+            'FilterChangeTime': self.filter_change_time(now),
+        }
+
+    def drift(self, node_id: int, key: str) -> tuple[float, bool] | None:
+        """Return (drift from the peers, flagged) of a node parameter, or None when not followed."""
+        tracker = self._drift.get((node_id, key))
+        if tracker is None:
+            return None
+        return round(tracker.drift(), 2), tracker.drifting
+
+    def is_drifting(self, node_id: int, key: str) -> bool:
+        tracker = self._drift.get((node_id, key))
+        return tracker is not None and tracker.drifting
+
+    def as_dict(self) -> dict:
+        return {
+            'version': STATE_VERSION,
+            'time': self._time,
+            'filter_remain': self._filter_remain,
+            'remain': self._remain.as_list(),
+            'remain_since': self._remain_since,
+            'fans': {
+                side: {
+                    'baseline': model.baseline.as_list(),
+                    'baseline_since': model.baseline_since,
+                    'recent': model.recent.as_list(),
+                }
+                for side, model in self._fans.items()
+            },
+            'drift': [
+                [node_id, key, tracker.short.as_list(), tracker.long.as_list(), tracker.since, tracker.drifting]
+                for (node_id, key), tracker in self._drift.items()
+            ],
+            'filter_resets': self.filter_resets,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict | None, now: float) -> 'DucoboxTrendAnalyzer':
+        """Restore an analyzer saved with `as_dict`; starts empty for missing or outdated state."""
+        analyzer = cls(now)
+        if not data or data.get('version') != STATE_VERSION:
+            return analyzer
+
+        try:
+            analyzer._time = data['time']
+            analyzer._filter_remain = data['filter_remain']
+            analyzer._remain = OnlineRegression(*data['remain'])
+            analyzer._remain_since = data['remain_since']
+            for side, saved in data['fans'].items():
+                if side in analyzer._fans:
+                    model = analyzer._fans[side]
+                    model.baseline = OnlineRegression(*saved['baseline'])
+                    model.baseline_since = saved['baseline_since']
+                    model.recent = OnlineRegression(*saved['recent'])
+            for node_id, key, short, long, since, drifting in data['drift']:
+                tracker = analyzer._drift[(node_id, key)] = _DriftTracker(since)
+                tracker.short = DecayingMean(*short)
+                tracker.long = DecayingMean(*long)
+                tracker.drifting = drifting
+            analyzer.filter_resets = data.get('filter_resets', 0)
+        except (KeyError, TypeError, ValueError) as e:
+            _LOGGER.warning(f"Discarding saved trend state: {e}")
+            return cls(now)
+        return analyzer
+
+    def stats(self, now: float) -> dict:
+        return {
+            'fans': {
+                side: {
+                    'baseline_samples': round(model.baseline.weight, 1),
+                    'baseline_complete': model.baseline_complete(now),
+                    'baseline_slope': model.baseline.slope,
+                    'recent_samples': round(model.recent.weight, 1),
+                    'recent_slope': model.recent.slope,
+                    'degradation': model.degradation(now),
+                }
+                for side, model in self._fans.items()
+            },
+            'filter_remain': self._filter_remain,
+            'filter_remain_rate_per_day': self._remain.slope,
+            'filter_change_time': self.filter_change_time(now),
+            'filter_resets': self.filter_resets,
+            'drift_tracked': len(self._drift),
+            'drifting': [
+                {'node': node_id, 'key': key, 'drift': round(tracker.drift(), 2)}
+                for (node_id, key), tracker in self._drift.items()
+                if tracker.drifting
+            ],
+        }
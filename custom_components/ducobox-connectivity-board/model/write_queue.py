@@ -0,0 +1,88 @@
+from collections.abc import Callable
+import time
+
+# Seconds before the first retry after a failed drain; doubled per failure up to the maximum
+RETRY_INITIAL = 10.0
+RETRY_MAX = 600.0
+
+
+def _item_key(item: dict) -> tuple:
+    if 'key' in item:
+        return 'value', item['node'], item['key']
+    return 'action', item['node']
+
+
+class DucoboxWriteQueue:
+    """Writes that could not reach the board, kept until they are sent.
+
+    Items are {'node', 'key', 'value'} for /config/nodes parameters and
+    {'node', 'action', 'option'} for node actions. A newer write replaces a
+    queued one for the same (node, key), or for the same node's action, and
+    moves to the end of the queue, so the queue drains in the order of the
+    latest intents. `save` is called after every change of the items, which
+    DucoboxWriteQueueStore uses to keep them on disk.
+    """
+
+    def __init__(self, items: list[dict] | None = None, save: Callable[[], None] | None = None):
+        self._items: dict[tuple, dict] = {_item_key(item): item for item in items or []}
+        self._save_callback = save
+        self._failures = 0
+        self.next_attempt: float | None = None
+        self.counters = {'queued': 0, 'replaced': 0, 'sent': 0, 'dropped': 0, 'retries': 0}
+
+    def as_dict(self) -> dict:
+        return {'items': list(self._items.values())}
+
+    def _save(self) -> None:
+        if self._save_callback is not None:
+            self._save_callback()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def put_value(self, node_id: int, key: str, value: float) -> None:
+        self._put({'node': node_id, 'key': key, 'value': value})
+
+    def put_action(self, node_id: int, action: str, option: str) -> None:
+        self._put({'node': node_id, 'action': action, 'option': option})
+
+    def _put(self, item: dict) -> None:
+        key = _item_key(item)
+        if self._items.pop(key, None) is not None:
+            self.counters['replaced'] += 1
+        item['queued_at'] = time.time()
+        self._items[key] = item
+        self.counters['queued'] += 1
+        self._save()
+
+    def peek(self) -> dict | None:
+        return next(iter(self._items.values()), None)
+
+    def done(self, item: dict, sent: bool = True) -> None:
+        """Remove a sent (or rejected) item, unless a newer write replaced it meanwhile."""
+        key = _item_key(item)
+        if self._items.get(key) is item:
+            del self._items[key]
+            self._save()
+        self.counters['sent' if sent else 'dropped'] += 1
+        self._failures = 0
+        self.next_attempt = None
+
+    def failed(self) -> float:
+        """Record that the board could not be reached; returns the seconds until the next attempt."""
+        delay = min(RETRY_INITIAL * 2 ** self._failures, RETRY_MAX)
+        self._failures += 1
+        self.counters['retries'] += 1
+        self.next_attempt = time.time() + delay
+        return delay
+
+    def stats(self) -> dict:
+        now = time.time()
+        oldest = min((item['queued_at'] for item in self._items.values()), default=None)
+        return {
+            'depth': len(self._items),
+            'oldest_age': round(now - oldest, 1) if oldest is not None else None,
+            'next_attempt_in': round(max(self.next_attempt - now, 0), 1) if self.next_attempt is not None else None,
+            'items': list(self._items.values()),
+            **self.counters,
+        }
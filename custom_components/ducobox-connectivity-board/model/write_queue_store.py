@@ -0,0 +1,25 @@
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from ..const import DOMAIN
+from .write_queue import DucoboxWriteQueue
+
+STORAGE_VERSION = 1
+STORAGE_KEY = f"{DOMAIN}.write_queue"
+
+
+class DucoboxWriteQueueStore:
+    """The queued writes, kept on disk until they reach the board."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str):
+        self._store = Store(hass, STORAGE_VERSION, f"{STORAGE_KEY}.{entry_id}")
+        self.queue: DucoboxWriteQueue | None = None
+
+    async def async_load(self) -> DucoboxWriteQueue:
+        """Load the saved writes into `queue`; saves every later change of it."""
+        data = await self._store.async_load() or {}
+        self.queue = DucoboxWriteQueue(data.get('items'), self._save)
+        return self.queue
+
+    def _save(self) -> None:
+        self._store.async_delay_save(self.queue.as_dict, 1)
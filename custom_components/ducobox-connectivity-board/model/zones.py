@@ -0,0 +1,54 @@
+from statistics import fmean
+
+from .snapshot import DucoboxSnapshot
+
+# (key, node parameter, aggregate) of the sensors of every zone
+ZONE_AGGREGATES = (
+    ('Co2Max', 'Co2', max),
+    ('RhMean', 'Rh', fmean),
+    ('TempMean', 'Temp', fmean),
+    ('FlowLvlTgtMax', 'FlowLvlTgt', max),
+)
+
+
+def parse_zones(value: str) -> dict[str, frozenset[int]]:
+    """Parse 'Upstairs: 2, 3, 4; Kitchen: 5' into {'Upstairs': {2, 3, 4}, 'Kitchen': {5}}."""
+    zones = {}
+    for part in value.split(';'):
+        part = part.strip()
+        if not part:
+            continue
+        name, separator, node_ids = part.partition(':')
+        name = name.strip()
+        if not separator or not name:
+            raise ValueError(f"expected <zone>: <node id>, ..., got {part}")
+        zones[name] = frozenset(int(node_id) for node_id in node_ids.replace(' ', '').split(',') if node_id)
+        if not zones[name]:
+            raise ValueError(f"zone {name} has no nodes")
+    return zones
+
+
+def compute_zone_aggregates(snapshot: DucoboxSnapshot, zones: dict[str, frozenset[int]]) -> dict[str, dict]:
+    """Compute the aggregates of every zone in one pass over the snapshot's nodes.
+
+    Returns {zone: {key: value}}; a value is None when no node of the zone
+    reports the parameter.
+    """
+    readings: dict[str, dict[str, list]] = {zone: {} for zone in zones}
+    for node_id, node in snapshot.nodes.items():
+        node_zones = [zone for zone, node_ids in zones.items() if node_id in node_ids]
+        if not node_zones:
+            continue
+        for _, parameter, _ in ZONE_AGGREGATES:
+            value = node.get(parameter)
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                for zone in node_zones:
+                    readings[zone].setdefault(parameter, []).append(value)
+
+    aggregates = {}
+    for zone, values in readings.items():
+        aggregates[zone] = {}
+        for key, parameter, aggregate in ZONE_AGGREGATES:
+            value = aggregate(values[parameter]) if parameter in values else None
+            aggregates[zone][key] = round(value, 1) if value is not None else None
+    return aggregates
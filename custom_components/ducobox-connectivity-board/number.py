@@ -1,18 +1,16 @@
 from __future__ import annotations
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.components.number import NumberEntity, NumberMode
-
 from homeassistant.components.number import NumberEntity, NumberMode
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
-from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers import entity_registry as er
 
-from .const import DOMAIN
-from .model.utils import safe_get
+from .const import DOMAIN, CONF_ADVANCED_PARAMETERS_SYNCED
 from .model.coordinator import DucoboxCoordinator
+from .model.config_index import is_common_parameter
 
 import logging
 
@@ -27,19 +25,17 @@ async def async_setup_entry(
     coordinator = hass.data[DOMAIN][entry.entry_id]['coordinator']
 
     # Retrieve MAC address and format device ID and name
-    mac_address = (
-        safe_get(coordinator.data, "info", "General", "Lan", "Mac", "Val") or "unknown_mac"
-    )
+    board = coordinator.data.board
 
-    if mac_address == 'unknown_mac':
+    if not board.mac:
         # if no data -> stop adding device
         return
 
-    device_id = mac_address.replace(":", "").lower() if mac_address else "unknown_mac"
+    device_id = board.device_id
     device_name = f"{device_id}"
 
-    box_name = safe_get(coordinator.data, "info", "General", "Board", "BoxName", "Val") or "Unknown Model"
-    box_subtype = safe_get(coordinator.data, "info", "General", "Board", "BoxSubTypeName", "Val") or ""
+    box_name = board.box_name or "Unknown Model"
+    box_subtype = board.box_subtype or ""
     box_model = f"{box_name} {box_subtype}".replace('_', ' ').strip()
 
     device_info = DeviceInfo(
@@ -47,66 +43,148 @@ async def async_setup_entry(
         name=device_name,
         manufacturer="Ducobox",
         model=box_model,
-        sw_version=safe_get(coordinator.data, "info", "General", "Board", "SwVersionBox", "Val") or "Unknown Version",
+        sw_version=board.sw_version or "Unknown Version",
     )
 
     entities: list[NumberEntity] = []
 
-    # Add node numbers if data is available
-    number_nodes = safe_get(coordinator.data, 'config_nodes', 'Nodes')
-    for node in number_nodes:
-        node_id = node['Node']
-        node_type = safe_get(coordinator.data, 'mappings', 'node_id_to_type', node_id) or 'Unknown'
-        mapped_node_name = safe_get(coordinator.data, 'mappings', 'node_id_to_name', node_id)
-        node_name = f'{device_id}:{mapped_node_name}'
-
-        # Create device info for the node
+    # Add node numbers from the coordinator's config index; advanced
+    # parameters are registered disabled unless all parameters are tracked
+    track_all = coordinator.config_index.track_all
+    node_device_infos: dict[int, DeviceInfo] = {}
+    for node_id, key in coordinator.config_index.keys():
         node_device_id = f"{device_id}-{node_id}"
-        node_device_info = DeviceInfo(
-            identifiers={(DOMAIN, node_device_id)},
-            name=node_name,
-            manufacturer="Ducobox",
-            model=node_type,
-            via_device=(DOMAIN, device_id),
+        node_device_info = node_device_infos.get(node_id)
+        if node_device_info is None:
+            node_type = coordinator.data.node_type(node_id)
+            mapped_node_name = coordinator.data.node_name(node_id)
+            node_name = f'{device_id}:{mapped_node_name}'
+
+            # Create device info for the node
+            node_device_info = node_device_infos[node_id] = DeviceInfo(
+                identifiers={(DOMAIN, node_device_id)},
+                name=node_name,
+                manufacturer="Ducobox",
+                model=node_type,
+                via_device=(DOMAIN, device_id),
+            )
+
+        unique_id = f"{node_device_id}-{key}"
+        entities.append(
+            DucoboxNumberEntity(
+                coordinator=coordinator,
+                node_id=node_id,
+                description=key,
+                device_info=node_device_info,
+                unique_id=unique_id,
+                enabled_default=track_all or is_common_parameter(key),
+            )
         )
 
-        for key, value in node.items():
-            if isinstance(value, dict) and 'Val' in value and 'Min' in value and 'Max' in value and 'Inc' in value:
-                unique_id = f"{node_device_id}-{key}"
-                entities.append(
-                    DucoboxNumberEntity(
-                        coordinator=coordinator,
-                        node_id=node_id,
-                        description=key,
-                        device_info=node_device_info,
-                        unique_id=unique_id,
-                        value=int(value['Val']),
-                        min_value=int(value['Min']),
-                        max_value=int(value['Max']),
-                        step=int(value['Inc'])
-                    )
-                )
-
+    enabled = sum(1 for entity in entities if entity.entity_registry_enabled_default)
+    _LOGGER.info(
+        f"Adding {len(entities)} number entities, {len(entities) - enabled} advanced ones disabled by default"
+    )
+    synced = entry.data.get(CONF_ADVANCED_PARAMETERS_SYNCED)
+    if synced is None:
+        # First start with this option: entities registered before keep their state
+        hass.config_entries.async_update_entry(entry, data={**entry.data, CONF_ADVANCED_PARAMETERS_SYNCED: track_all})
+    elif synced != track_all:
+        _sync_registry(hass, entry, entities, track_all)
     async_add_entities(entities)
 
 
+def _sync_registry(hass: HomeAssistant, entry: ConfigEntry, entities: list, track_all: bool) -> None:
+    """Enable or disable the registered advanced parameter entities after advanced_parameters changed.
+
+    The enabled default only applies when an entity is first registered.
+    Turning the option on enables the entities the integration disabled;
+    turning it off disables the enabled advanced ones. Entities enabled or
+    disabled by the user later are left alone until the option changes
+    again.
+    """
+    registry = er.async_get(hass)
+    advanced = {entity.unique_id for entity in entities if not is_common_parameter(entity.key)}
+    changed = 0
+    for entity_entry in er.async_entries_for_config_entry(registry, entry.entry_id):
+        if entity_entry.domain != 'number' or entity_entry.unique_id not in advanced:
+            continue
+        if track_all and entity_entry.disabled_by is er.RegistryEntryDisabler.INTEGRATION:
+            registry.async_update_entity(entity_entry.entity_id, disabled_by=None)
+            changed += 1
+        elif not track_all and entity_entry.disabled_by is None:
+            registry.async_update_entity(entity_entry.entity_id, disabled_by=er.RegistryEntryDisabler.INTEGRATION)
+            changed += 1
+
+    _LOGGER.info(f"{'Enabled' if track_all else 'Disabled'} {changed} advanced parameter entities")
+    hass.config_entries.async_update_entry(entry, data={**entry.data, CONF_ADVANCED_PARAMETERS_SYNCED: track_all})
+
+
 class DucoboxNumberEntity(CoordinatorEntity, NumberEntity):
-    """Representation of a Ducobox number entity."""
+    """Representation of a Ducobox number entity.
+
+    Values are pushed from the coordinator's config index, so the entity only
+    writes state when its own (node, key) entry changes.
+    """
 
-    def __init__(self, coordinator, node_id, description, device_info, unique_id, value, min_value, max_value, step):
+    def __init__(self, coordinator, node_id, description, device_info, unique_id, enabled_default=True):
         """Initialize the Ducobox number entity."""
         super().__init__(coordinator)
+        self._attr_entity_registry_enabled_default = enabled_default
         self._coordinator = coordinator
         self._node_id = node_id
         self._description = description
         self._device_info = device_info
         self._attr_unique_id = unique_id
         self._attr_name = f"{device_info['name']} {description}"
-        self._attr_native_value = value
-        self._attr_native_min_value = min_value
-        self._attr_native_max_value = max_value
-        self._attr_native_step = step
         self._attr_mode = NumberMode.AUTO
+        self._last_available = None
+        self._apply_config_value(coordinator.config_index.get(node_id, description))
+
+    def _apply_config_value(self, entry) -> None:
+        """Copy a (val, min, max, inc) tuple from the config index."""
+        self._config_value = entry
+        if entry is None:
+            return
+
+        value, min_value, max_value, step = entry
+        self._attr_native_value = int(value)
+        self._attr_native_min_value = int(min_value)
+        self._attr_native_max_value = int(max_value)
+        self._attr_native_step = int(step)
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to config index updates for this parameter."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self._coordinator.config_index.add_listener(
+                self._node_id, self._description, self._handle_config_update
+            )
+        )
+
+    @callback
+    def _handle_config_update(self, entry) -> None:
+        """Handle a changed config index entry."""
+        self._apply_config_value(entry)
+        self.async_write_ha_state()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Only write state on availability changes; values come from the config index."""
+        available = self.available
+        if available != self._last_available:
+            self._last_available = available
+            self.async_write_ha_state()
+
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        return self.coordinator.data_available and self._config_value is not None
+
+    @property
+    def key(self) -> str:
+        """Return the /config/nodes parameter of this entity."""
+        return self._description
 
     @property
     def device_info(self):
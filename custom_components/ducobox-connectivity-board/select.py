@@ -22,14 +22,12 @@ async def async_setup_entry(
     coordinator = hass.data[DOMAIN][entry.entry_id]['coordinator']
 
     # Retrieve MAC address and format device ID and name
-    mac_address = (
-        safe_get(coordinator.data, "info", "General", "Lan", "Mac", "Val") or "unknown_mac"
-    )
-    device_id = mac_address.replace(":", "").lower() if mac_address else "unknown_mac"
+    board = coordinator.data.board
+    device_id = board.device_id
     device_name = f"{device_id}"
 
-    box_name = safe_get(coordinator.data, "info", "General", "Board", "BoxName", "Val") or "Unknown Model"
-    box_subtype = safe_get(coordinator.data, "info", "General", "Board", "BoxSubTypeName", "Val") or ""
+    box_name = board.box_name or "Unknown Model"
+    box_subtype = board.box_subtype or ""
     box_model = f"{box_name} {box_subtype}".replace('_', ' ').strip()
 
     device_info = DeviceInfo(
@@ -37,16 +35,16 @@ async def async_setup_entry(
         name=device_name,
         manufacturer="Ducobox",
         model=box_model,
-        sw_version=safe_get(coordinator.data, "info", "General", "Board", "SwVersionBox", "Val") or "Unknown Version",
+        sw_version=board.sw_version or "Unknown Version",
     )
 
     entities: list[SelectEntity] = []
 
-    action_nodes = safe_get(coordinator.data, 'action_nodes', 'Nodes')
+    action_nodes = safe_get(coordinator.data.action_nodes, 'Nodes') or []
     for node in action_nodes:
         node_id = node['Node']
-        node_type = safe_get(coordinator.data, 'mappings', 'node_id_to_type', node_id) or 'Unknown'
-        mapped_node_name = safe_get(coordinator.data, 'mappings', 'node_id_to_name', node_id)
+        node_type = coordinator.data.node_type(node_id)
+        mapped_node_name = coordinator.data.node_name(node_id)
         node_name = f'{device_id}:{mapped_node_name}'
 
 
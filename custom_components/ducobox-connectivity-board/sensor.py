@@ -4,13 +4,26 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.util import slugify
 from homeassistant.components.sensor import SensorEntity
 
-from .const import DOMAIN
-
-from .model.utils import safe_get
-from .model.devices import SENSORS, NODE_SENSORS
-from .model.coordinator import DucoboxCoordinator, DucoboxSensorEntity, DucoboxNodeSensorEntity
+from .const import DOMAIN, CONF_ROLLING_STATISTICS, DEFAULT_ROLLING_STATISTICS
+
+from .model.devices import (
+    SENSORS,
+    DERIVED_SENSORS,
+    TREND_SENSORS,
+    ZONE_SENSORS,
+    ROLLING_STATISTICS_KEYS,
+    ROLLING_STATISTICS,
+)
+from .model.coordinator import (
+    DucoboxCoordinator,
+    DucoboxSensorEntity,
+    DucoboxNodeSensorEntity,
+    DucoboxRollingStatisticSensorEntity,
+    DucoboxZoneSensorEntity,
+)
 
 
 async def async_setup_entry(
@@ -22,19 +35,17 @@ async def async_setup_entry(
     coordinator = hass.data[DOMAIN][entry.entry_id]['coordinator']
 
     # Retrieve MAC address and format device ID and name
-    mac_address = (
-        safe_get(coordinator.data, "info", "General", "Lan", "Mac", "Val") or "unknown_mac"
-    )
+    board = coordinator.data.board
 
-    if mac_address == 'unknown_mac':
+    if not board.mac:
         # if no data -> stop adding device
         return
 
-    device_id = mac_address.replace(":", "").lower() if mac_address else "unknown_mac"
+    device_id = board.device_id
     device_name = f"{device_id}"
 
-    box_name = safe_get(coordinator.data, "info", "General", "Board", "BoxName", "Val") or "Unknown Model"
-    box_subtype = safe_get(coordinator.data, "info", "General", "Board", "BoxSubTypeName", "Val") or ""
+    box_name = board.box_name or "Unknown Model"
+    box_subtype = board.box_subtype or ""
     box_model = f"{box_name} {box_subtype}".replace('_', ' ').strip()
 
     device_info = DeviceInfo(
@@ -42,10 +53,11 @@ async def async_setup_entry(
         name=device_name,
         manufacturer="Ducobox",
         model=box_model,
-        sw_version=safe_get(coordinator.data, "info", "General", "Board", "SwVersionBox", "Val") or "Unknown Version",
+        sw_version=board.sw_version or "Unknown Version",
     )
 
     entities: list[SensorEntity] = []
+    rolling_statistics = entry.options.get(CONF_ROLLING_STATISTICS, DEFAULT_ROLLING_STATISTICS)
 
     # Add main Ducobox sensors
     for description in SENSORS:
@@ -59,12 +71,51 @@ async def async_setup_entry(
             )
         )
 
+        if rolling_statistics and description.key in ROLLING_STATISTICS_KEYS:
+            for statistic, statistic_name in ROLLING_STATISTICS:
+                entities.append(
+                    DucoboxRollingStatisticSensorEntity(
+                        coordinator=coordinator,
+                        node_id=None,
+                        description=description,
+                        statistic=statistic,
+                        statistic_name=statistic_name,
+                        device_info=device_info,
+                        unique_id=f"{unique_id}-{statistic}",
+                        name=device_name,
+                    )
+                )
+
+    # Add sensors derived from the box snapshot by the coordinator, and the
+    # trend sensors when the coordinator runs the trend analysis
+    trend_sensors = TREND_SENSORS if coordinator.trends is not None else ()
+    for description in (*DERIVED_SENSORS, *trend_sensors):
+        entities.append(
+            DucoboxSensorEntity(
+                coordinator=coordinator,
+                description=description,
+                device_info=device_info,
+                unique_id=f"{device_id}-{description.key}",
+            )
+        )
+
+    # Add the aggregate sensors of the configured zones
+    for zone in coordinator.zones:
+        for description in ZONE_SENSORS:
+            entities.append(
+                DucoboxZoneSensorEntity(
+                    coordinator=coordinator,
+                    zone=zone,
+                    description=description,
+                    device_info=device_info,
+                    unique_id=f"{device_id}-zone-{slugify(zone)}-{description.key}",
+                )
+            )
+
     # Add node sensors if data is available
-    nodes = safe_get(coordinator.data, 'nodes')
-    for node in nodes:
-        node_id = node.get('Node')
-        node_type = safe_get(node, 'General', 'Type', 'Val') or 'Unknown'
-        node_addr = safe_get(node, 'General', 'Addr') or 'Unknown'
+    for node in coordinator.data.nodes.values():
+        node_id = node.node_id
+        node_type = node.node_type
         node_name = f"{device_id}:{node_id}:{node_type}"
 
         # Create device info for the node
@@ -77,8 +128,8 @@ async def async_setup_entry(
             via_device=(DOMAIN, device_id),
         )
 
-        # Get the sensors for this node type
-        node_sensors = NODE_SENSORS.get(node_type, [])
+        # Get the sensors generated from the schema of this node type
+        node_sensors = coordinator.node_sensors.get(node_type, [])
         for description in node_sensors:
             unique_id = f"{node_device_id}-{description.key}"
             entities.append(
@@ -93,4 +144,19 @@ async def async_setup_entry(
                 )
             )
 
+            if rolling_statistics and description.key in ROLLING_STATISTICS_KEYS:
+                for statistic, statistic_name in ROLLING_STATISTICS:
+                    entities.append(
+                        DucoboxRollingStatisticSensorEntity(
+                            coordinator=coordinator,
+                            node_id=node_id,
+                            description=description,
+                            statistic=statistic,
+                            statistic_name=statistic_name,
+                            device_info=node_device_info,
+                            unique_id=f"{unique_id}-{statistic}",
+                            name=node_name,
+                        )
+                    )
+
     async_add_entities(entities)
@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import logging
+
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
+from homeassistant.exceptions import ServiceValidationError
+import homeassistant.helpers.config_validation as cv
+
+from .const import (
+    DOMAIN,
+    SERVICE_GET_SNAPSHOT,
+    SERVICE_SET_MANY,
+    ATTR_CONFIG_ENTRY_ID,
+    ATTR_ITEMS,
+    SERVICE_SAVE_PRESET,
+    SERVICE_APPLY_PRESET,
+    SERVICE_DELETE_PRESET,
+    ATTR_NAME,
+    ATTR_NODES,
+    ATTR_KEYS,
+)
+from .model.coordinator import DucoboxCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+GET_SNAPSHOT_SCHEMA = vol.Schema({
+    vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+})
+
+SET_VALUE_ITEM_SCHEMA = vol.Schema({
+    vol.Required('node'): vol.Coerce(int),
+    vol.Required('key'): cv.string,
+    vol.Required('value'): vol.Coerce(float),
+})
+
+SET_ACTION_ITEM_SCHEMA = vol.Schema({
+    vol.Required('node'): vol.Coerce(int),
+    vol.Required('action'): cv.string,
+    vol.Required('option'): cv.string,
+})
+
+SET_MANY_SCHEMA = vol.Schema({
+    vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+    vol.Required(ATTR_ITEMS): vol.All(
+        cv.ensure_list, [vol.Any(SET_VALUE_ITEM_SCHEMA, SET_ACTION_ITEM_SCHEMA)]
+    ),
+})
+
+SAVE_PRESET_SCHEMA = vol.Schema({
+    vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+    vol.Required(ATTR_NAME): cv.string,
+    vol.Optional(ATTR_ITEMS): vol.All(cv.ensure_list, [SET_VALUE_ITEM_SCHEMA]),
+    vol.Optional(ATTR_NODES): vol.All(cv.ensure_list, [vol.Coerce(int)]),
+    vol.Optional(ATTR_KEYS): vol.All(cv.ensure_list, [cv.string]),
+})
+
+PRESET_SCHEMA = vol.Schema({
+    vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+    vol.Required(ATTR_NAME): cv.string,
+})
+
+
+def get_entry_data(hass: HomeAssistant, call: ServiceCall) -> dict:
+    """Return hass.data of the config entry a service call targets.
+
+    The config entry id may be omitted when only one board is configured.
+    """
+    entries = hass.data.get(DOMAIN, {})
+    entry_id = call.data.get(ATTR_CONFIG_ENTRY_ID)
+
+    if entry_id is None:
+        if len(entries) != 1:
+            raise ServiceValidationError(f"{ATTR_CONFIG_ENTRY_ID} is required when {len(entries)} boards are configured")
+        entry_id = next(iter(entries))
+
+    if entry_id not in entries:
+        raise ServiceValidationError(f"Unknown or unloaded config entry {entry_id}")
+
+    return entries[entry_id]
+
+
+def get_coordinator(hass: HomeAssistant, call: ServiceCall) -> DucoboxCoordinator:
+    return get_entry_data(hass, call)['coordinator']
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration's services."""
+
+    async def async_get_snapshot(call: ServiceCall) -> ServiceResponse:
+        coordinator = get_coordinator(hass, call)
+        if coordinator.data is None:
+            raise ServiceValidationError("No data received from the board yet")
+
+        response = coordinator.data.as_dict()
+        config = coordinator.config_index.node_values()
+        for node in response['nodes']:
+            node['config'] = config.get(node['node'], {})
+        return response
+
+    async def async_set_many(call: ServiceCall) -> ServiceResponse:
+        coordinator = get_coordinator(hass, call)
+        response = await coordinator.async_set_many(call.data[ATTR_ITEMS])
+        _LOGGER.debug(
+            f"set_many: {response['succeeded']} succeeded, {response['failed']} failed "
+            f"on {response['nodes']} nodes in {response['duration']}s"
+        )
+        return response if call.return_response else None
+
+    async def async_save_preset(call: ServiceCall) -> None:
+        entry_data = get_entry_data(hass, call)
+        config_index = entry_data['coordinator'].config_index
+
+        if ATTR_ITEMS in call.data:
+            values = {}
+            for item in call.data[ATTR_ITEMS]:
+                values.setdefault(item['node'], {})[item['key']] = item['value']
+        else:
+            # Capture the current values, optionally limited to some nodes and keys
+            nodes = call.data.get(ATTR_NODES)
+            keys = call.data.get(ATTR_KEYS)
+            values = {
+                node_id: {
+                    key: value for key, value in node_values.items()
+                    if keys is None or key in keys
+                }
+                for node_id, node_values in config_index.node_values().items()
+                if nodes is None or node_id in nodes
+            }
+            values = {node_id: node_values for node_id, node_values in values.items() if node_values}
+
+        if not values:
+            raise ServiceValidationError(f"Preset {call.data[ATTR_NAME]} would be empty")
+
+        await entry_data['presets'].async_set(call.data[ATTR_NAME], values)
+
+    async def async_apply_preset(call: ServiceCall) -> ServiceResponse:
+        entry_data = get_entry_data(hass, call)
+        values = entry_data['presets'].get(call.data[ATTR_NAME])
+        if values is None:
+            raise ServiceValidationError(f"Unknown preset {call.data[ATTR_NAME]}")
+
+        try:
+            response = await entry_data['coordinator'].async_apply_config(values)
+        except ValueError as e:
+            raise ServiceValidationError(f"Preset {call.data[ATTR_NAME]} cannot be applied: {e}") from e
+
+        if not response['success']:
+            _LOGGER.error(f"Applying preset {call.data[ATTR_NAME]} failed: {response['errors']}")
+        return response if call.return_response else None
+
+    async def async_delete_preset(call: ServiceCall) -> None:
+        entry_data = get_entry_data(hass, call)
+        if not await entry_data['presets'].async_remove(call.data[ATTR_NAME]):
+            raise ServiceValidationError(f"Unknown preset {call.data[ATTR_NAME]}")
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_SNAPSHOT,
+        async_get_snapshot,
+        schema=GET_SNAPSHOT_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_MANY,
+        async_set_many,
+        schema=SET_MANY_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SAVE_PRESET,
+        async_save_preset,
+        schema=SAVE_PRESET_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_APPLY_PRESET,
+        async_apply_preset,
+        schema=PRESET_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_DELETE_PRESET,
+        async_delete_preset,
+        schema=PRESET_SCHEMA,
+    )
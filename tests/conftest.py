@@ -0,0 +1,5 @@
+from tools import load_integration
+
+# Registers the integration as the `ducobox_connectivity_board` package, so the
+# Home Assistant-free model modules can be imported by the tests
+load_integration()
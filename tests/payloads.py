@@ -0,0 +1,19 @@
+from ducobox_connectivity_board.model.snapshot import DucoboxSnapshot
+
+
+def node(node_id: int, node_type: str = 'UCCO2', state: str | None = 'AUTO', **values) -> dict:
+    """Return an /info/nodes entry; Temp, Rh and Co2 go under Sensor, other values under Ventilation."""
+    sensor = {key: values.pop(key) for key in ('Temp', 'Rh', 'Co2') if key in values}
+    ventilation = dict(values)
+    if state is not None:
+        ventilation['State'] = state
+    return {
+        'Node': node_id,
+        'General': {'Type': {'Val': node_type}},
+        'Sensor': {'data': sensor},
+        'Ventilation': ventilation,
+    }
+
+
+def snapshot(*nodes: dict) -> DucoboxSnapshot:
+    return DucoboxSnapshot.build({}, list(nodes))
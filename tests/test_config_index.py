@@ -0,0 +1,107 @@
+from ducobox_connectivity_board.model.config_index import DucoboxConfigIndex, to_config_value
+
+
+def _parameter(value, minimum=0, maximum=100, step=1) -> dict:
+    return {'Val': value, 'Min': minimum, 'Max': maximum, 'Inc': step}
+
+
+def _config_nodes(*nodes: dict) -> dict:
+    return {'Nodes': list(nodes)}
+
+
+def test_update_returns_only_changed_keys():
+    index = DucoboxConfigIndex()
+    payload = _config_nodes({'Node': 1, 'FlowMax': _parameter(50), 'TimeMan': _parameter(15)})
+
+    assert index.update(payload) == {(1, 'FlowMax'), (1, 'TimeMan')}
+    assert index.update(payload) == set()
+
+    payload['Nodes'][0]['FlowMax'] = _parameter(60)
+    assert index.update(payload) == {(1, 'FlowMax')}
+    assert index.get(1, 'FlowMax') == (60, 0, 100, 1)
+
+
+def test_removed_parameters_are_reported_as_changed():
+    index = DucoboxConfigIndex()
+    index.update(_config_nodes({'Node': 1, 'FlowMax': _parameter(50)}, {'Node': 2, 'FlowMax': _parameter(40)}))
+
+    assert index.update(_config_nodes({'Node': 1, 'FlowMax': _parameter(50)})) == {(2, 'FlowMax')}
+    assert index.get(2, 'FlowMax') is None
+
+
+def test_non_number_values_are_skipped():
+    index = DucoboxConfigIndex()
+    index.update(_config_nodes({'Node': 1, 'Name': {'Val': 'Kitchen'}, 'FlowMax': _parameter(50)}))
+
+    assert index.keys() == [(1, 'FlowMax')]
+
+
+def test_listeners_are_called_with_the_new_entry():
+    index = DucoboxConfigIndex()
+    index.update(_config_nodes({'Node': 1, 'FlowMax': _parameter(50)}))
+    received = []
+    remove = index.add_listener(1, 'FlowMax', received.append)
+
+    index.update_node({'Node': 1, 'FlowMax': _parameter(70)})
+    remove()
+    index.update_node({'Node': 1, 'FlowMax': _parameter(80)})
+
+    assert received == [(70, 0, 100, 1)]
+
+
+def test_advanced_parameters_are_tracked_only_while_followed():
+    index = DucoboxConfigIndex(track_all=False)
+    index.update(_config_nodes({'Node': 1, 'FlowMax': _parameter(50), 'RhDelta': _parameter(5)}))
+
+    assert index.stats()['tracked'] == 1
+    assert index.stats()['untracked'] == 1
+    # Untracked parameters are still read from the latest payload
+    assert index.get(1, 'RhDelta') == (5, 0, 100, 1)
+
+    received = []
+    remove = index.add_listener(1, 'RhDelta', received.append)
+    index.update(_config_nodes({'Node': 1, 'FlowMax': _parameter(50), 'RhDelta': _parameter(6)}))
+    assert received == [(6, 0, 100, 1)]
+
+    remove()
+    assert index.stats()['tracked'] == 1
+    assert (1, 'RhDelta') in index
+
+
+def test_validate_rejects_unknown_parameters_and_out_of_range_values():
+    index = DucoboxConfigIndex()
+    index.update(_config_nodes({'Node': 1, 'FlowMax': _parameter(50, 10, 100)}))
+
+    assert index.validate(1, 'FlowMax', 10) is None
+    assert index.validate(1, 'FlowMax', 100) is None
+    assert 'outside' in index.validate(1, 'FlowMax', 101)
+    assert 'outside' in index.validate(1, 'FlowMax', 9)
+    assert 'unknown' in index.validate(2, 'FlowMax', 50)
+
+
+def test_validate_rejects_values_between_steps():
+    index = DucoboxConfigIndex()
+    index.update(_config_nodes({'Node': 1, 'FlowMax': _parameter(50, 10, 100, 5), 'RhSetPoint': _parameter(0.5, 0, 1, 0.1)}))
+
+    assert index.validate(1, 'FlowMax', 15) is None
+    assert index.validate(1, 'FlowMax', 15.0) is None
+    assert 'multiple of 5' in index.validate(1, 'FlowMax', 12)
+    assert 'multiple of 5' in index.validate(1, 'FlowMax', 15.5)
+    # Float steps accept values that are a whole number of steps up to rounding errors
+    assert index.validate(1, 'RhSetPoint', 0.7) is None
+    assert index.validate(1, 'RhSetPoint', 0.3) is None
+    assert index.validate(1, 'RhSetPoint', 0.75) is not None
+
+
+def test_validate_without_a_step_only_checks_the_range():
+    index = DucoboxConfigIndex()
+    index.update(_config_nodes({'Node': 1, 'FlowMax': _parameter(50, 0, 100, 0)}))
+
+    assert index.validate(1, 'FlowMax', 33.3) is None
+
+
+def test_to_config_value_keeps_the_value_without_rounding():
+    assert to_config_value(15.0) == 15
+    assert isinstance(to_config_value(15.0), int)
+    assert to_config_value(15) == 15
+    assert to_config_value(0.7) == 0.7
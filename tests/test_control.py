@@ -0,0 +1,68 @@
+from ducobox_connectivity_board.model.control import DucoboxControlEngine, parse_node_ids
+
+from .payloads import node, snapshot
+
+
+def _engine(**options) -> DucoboxControlEngine:
+    return DucoboxControlEngine.from_options({'control_min_hold': 60, **options})
+
+
+def test_demand_uses_hysteresis():
+    engine = _engine()
+
+    assert engine.evaluate(snapshot(node(2, Co2=900)), 0) == []
+    assert engine.evaluate(snapshot(node(2, Co2=1000)), 100) == [(2, 'MAN2')]
+    engine.complete(2, True, 0.1)
+    # Between the low and the high threshold the demand holds
+    assert engine.evaluate(snapshot(node(2, Co2=850)), 200) == []
+    assert engine.evaluate(snapshot(node(2, Co2=800)), 300) == [(2, 'AUTO')]
+
+
+def test_any_active_rule_keeps_the_demand():
+    engine = _engine()
+    engine.evaluate(snapshot(node(2, Co2=1100, Rh=50)), 0)
+    engine.complete(2, True, 0.1)
+
+    assert engine.evaluate(snapshot(node(2, Co2=700, Rh=85)), 100) == []
+    assert engine.evaluate(snapshot(node(2, Co2=700, Rh=60)), 200) == [(2, 'AUTO')]
+
+
+def test_changes_within_the_minimum_hold_are_held():
+    engine = _engine()
+    engine.evaluate(snapshot(node(2, Co2=1100)), 0)
+    engine.complete(2, True, 0.1)
+
+    assert engine.evaluate(snapshot(node(2, Co2=700)), 30) == []
+    assert engine.counters['held'] == 1
+    assert engine.evaluate(snapshot(node(2, Co2=700)), 60) == [(2, 'AUTO')]
+
+
+def test_a_pending_decision_is_not_repeated_and_a_failed_one_is_retried():
+    engine = _engine()
+    assert engine.evaluate(snapshot(node(2, Co2=1100)), 0) == [(2, 'MAN2')]
+    assert engine.evaluate(snapshot(node(2, Co2=1100)), 100) == []
+
+    engine.complete(2, False, 0.1)
+
+    assert engine.counters['failed'] == 1
+    # A failed change can be retried at once with fresh readings
+    assert engine.evaluate(snapshot(node(2, Co2=1100)), 101) == [(2, 'MAN2')]
+
+
+def test_nodes_are_limited_to_the_configured_and_controllable_ones():
+    engine = _engine(control_nodes='2, 3')
+    nodes = snapshot(node(2, Co2=1100), node(3, Co2=1100), node(4, Co2=1100))
+
+    assert engine.evaluate(nodes, 0, controllable=frozenset({3, 4})) == [(3, 'MAN2')]
+
+
+def test_a_zero_threshold_disables_the_rule():
+    engine = _engine(control_rh_high=0)
+
+    assert [rule.key for rule in engine.rules] == ['Co2']
+    assert engine.evaluate(snapshot(node(2, Rh=95)), 0) == []
+
+
+def test_parse_node_ids():
+    assert parse_node_ids('') is None
+    assert parse_node_ids(' 2, 3,,4 ') == frozenset({2, 3, 4})
@@ -0,0 +1,64 @@
+from ducobox_connectivity_board.model.countdown import DucoboxCountdowns
+
+from .payloads import node, snapshot
+
+
+def _poll(countdowns: DucoboxCountdowns, now: float, remain: int | None, state: str = 'MAN2', end: int = 1000, **kwargs):
+    values = {'TimeStateEnd': end}
+    if remain is not None:
+        values['TimeStateRemain'] = remain
+    countdowns.update(snapshot(node(2, state=state, **values), node(1, 'BOX', state=None)), now, **kwargs)
+
+
+def test_the_countdown_is_extrapolated_between_polls():
+    countdowns = DucoboxCountdowns()
+    _poll(countdowns, 100.0, 900)
+
+    assert countdowns.remain(2, 100.0) == 900
+    assert countdowns.remain(2, 130.4) == 870
+    assert countdowns.remain(2, 2000.0) == 0
+    assert countdowns.remain(1, 130.0) is None
+
+
+def test_running_lists_the_nodes_whose_timer_has_not_ended():
+    countdowns = DucoboxCountdowns()
+    _poll(countdowns, 100.0, 60)
+
+    assert countdowns.running(150.0) == [2]
+    assert countdowns.running(160.0) == []
+
+
+def test_a_missing_reading_means_no_timer():
+    countdowns = DucoboxCountdowns()
+    _poll(countdowns, 100.0, None, state='AUTO')
+
+    assert countdowns.remain(2, 100.0) == 0
+
+
+def test_readings_resync_and_measure_the_drift():
+    countdowns = DucoboxCountdowns()
+    _poll(countdowns, 100.0, 900)
+    _poll(countdowns, 160.0, 838)
+
+    assert countdowns.remain(2, 160.0) == 838
+    assert countdowns.stats() == {'nodes': 1, 'max_drift': 2.0, 'resyncs': 1, 'resets': 0}
+
+
+def test_a_restarted_or_changed_timer_is_a_reset():
+    countdowns = DucoboxCountdowns()
+    _poll(countdowns, 100.0, 900)
+    _poll(countdowns, 160.0, 900)
+    _poll(countdowns, 220.0, 1800, state='MAN3', end=3000)
+
+    stats = countdowns.stats()
+    assert stats['resets'] == 2
+    assert stats['max_drift'] == 0.0
+
+
+def test_payloads_that_were_not_refreshed_keep_their_countdown():
+    countdowns = DucoboxCountdowns()
+    _poll(countdowns, 100.0, 900, read_at=lambda node_id: 90.0)
+    _poll(countdowns, 160.0, 900, read_at=lambda node_id: 90.0)
+
+    assert countdowns.remain(2, 160.0) == 830
+    assert countdowns.stats()['resyncs'] == 0
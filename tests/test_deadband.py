@@ -0,0 +1,56 @@
+from ducobox_connectivity_board.model.deadband import DucoboxDeadbandFilter
+
+
+def _filter(**options) -> DucoboxDeadbandFilter:
+    return DucoboxDeadbandFilter.from_options({'deadband_heartbeat': 600, **options})
+
+
+def test_changes_inside_the_absolute_band_are_suppressed():
+    deadband = _filter(deadband_temperature_absolute=0.5)
+
+    assert not deadband.should_publish('temperature', 20.0, 20.4, silence=10)
+    assert deadband.should_publish('temperature', 20.0, 20.6, silence=10)
+    assert deadband.counters['temperature'] == {'published': 1, 'suppressed': 1, 'unchanged': 0}
+
+
+def test_the_larger_of_the_absolute_and_relative_band_applies():
+    deadband = _filter(deadband_carbon_dioxide_absolute=10, deadband_carbon_dioxide_relative=5)
+
+    # 5 % of 1000 ppm is larger than 10 ppm
+    assert not deadband.should_publish('carbon_dioxide', 1000, 1040, silence=10)
+    assert deadband.should_publish('carbon_dioxide', 1000, 1060, silence=10)
+
+
+def test_heartbeat_publishes_a_suppressed_value():
+    deadband = _filter(deadband_humidity_absolute=5)
+
+    assert not deadband.should_publish('humidity', 50, 52, silence=599)
+    assert deadband.should_publish('humidity', 50, 52, silence=600)
+
+
+def test_unchanged_values_are_counted_apart():
+    deadband = _filter(deadband_humidity_absolute=5)
+
+    assert not deadband.should_publish('humidity', 50, 50, silence=1000)
+    assert deadband.counters['humidity'] == {'published': 0, 'suppressed': 0, 'unchanged': 1}
+
+
+def test_unknown_device_classes_and_non_numbers_use_other():
+    deadband = _filter(deadband_other_absolute=100)
+
+    assert not deadband.should_publish(None, 1000, 1050, silence=10)
+    assert not deadband.should_publish('power', 1000, 1050, silence=10)
+    assert deadband.should_publish(None, 'AUTO', 'MAN1', silence=10)
+    assert deadband.should_publish(None, None, 5, silence=10)
+    assert deadband.counters['other']['suppressed'] == 2
+
+
+def test_configure_keeps_the_counters():
+    deadband = _filter(deadband_temperature_absolute=0.5)
+    deadband.should_publish('temperature', 20.0, 20.1, silence=10)
+
+    deadband.configure({'deadband_temperature_absolute': 0.05})
+
+    assert deadband.should_publish('temperature', 20.0, 20.1, silence=10)
+    assert deadband.counters['temperature']['suppressed'] == 1
+    assert deadband.heartbeat == 900
@@ -0,0 +1,137 @@
+import copy
+from datetime import datetime, timezone
+import gzip
+import json
+import os
+
+from ducobox_connectivity_board.model.exporter import (
+    DucoboxExporter,
+    EXPORT_MODE_DIFF,
+    EXPORT_MODE_SNAPSHOT,
+    REMOVED,
+    apply_diff,
+    day_files,
+    diff_payload,
+    iter_file,
+    read_day,
+)
+
+from .payloads import node
+
+BOARD = 'a0b76500a1b2'
+START = datetime(2026, 10, 19, 12, tzinfo=timezone.utc).timestamp()
+
+
+def _data(temp: float, nodes: list[dict] | None = None) -> dict:
+    return {
+        'info': {'Ventilation': {'Sensor': {'TempOda': {'Val': temp}}}, 'General': {'Board': {'UpTime': {'Val': 5}}}},
+        'nodes': nodes if nodes is not None else [node(1, 'BOX'), node(2, Co2=700)],
+        'config_nodes': None,
+    }
+
+
+def test_diff_round_trip():
+    old = {'a': 1, 'b': {'c': [1, 2], 'd': 'x', 'e': {'f': 1}}, 'gone': True}
+    new = {'a': 1, 'b': {'c': [1, 3], 'd': 'x', 'e': {}}, 'added': {'g': None}}
+
+    diff = diff_payload(old, new)
+
+    assert diff == {'b': {'c': [1, 3], 'e': {REMOVED: ['f']}}, 'added': {'g': None}, REMOVED: ['gone']}
+    assert apply_diff(copy.deepcopy(old), json.loads(json.dumps(diff))) == new
+
+
+def test_values_replace_values_of_another_type():
+    old = {'a': {'b': 1}, 'c': 2}
+    new = {'a': 3, 'c': {'d': 4}}
+
+    assert apply_diff(copy.deepcopy(old), diff_payload(old, new)) == new
+
+
+def _export(tmp_path, mode: str, polls: list[dict], records_per_write: int = 2) -> DucoboxExporter:
+    exporter = DucoboxExporter(str(tmp_path), mode)
+    for index, data in enumerate(polls):
+        exporter.add(START + index * 60, BOARD, data)
+        if exporter.stats()['pending'] >= records_per_write:
+            exporter.write(exporter.take())
+    exporter.write(exporter.take())
+    return exporter
+
+
+def _polls() -> list[dict]:
+    return [
+        _data(10.0),
+        _data(10.5),
+        _data(10.5, [node(1, 'BOX'), node(2, Co2=750), node(3, 'UCRH', Rh=55)]),
+        _data(11.0, [node(1, 'BOX'), node(3, 'UCRH', Rh=56)]),
+        _data(11.0, [node(1, 'BOX'), node(3, 'UCRH', Rh=56)]),
+    ]
+
+
+def test_diff_export_reads_back_every_poll(tmp_path):
+    polls = _polls()
+    exporter = _export(tmp_path, EXPORT_MODE_DIFF, polls)
+
+    records = [copy.deepcopy(record) for record in read_day(str(tmp_path), BOARD, '2026-10-19')]
+
+    assert [record['time'] for record in records] == [START + index * 60 for index in range(len(polls))]
+    assert [{key: record[key] for key in ('info', 'nodes', 'config_nodes')} for record in records] == polls
+    assert exporter.counters['records'] == len(polls)
+    assert exporter.stats()['pending'] == 0
+
+
+def test_diff_export_stores_full_payloads_only_first(tmp_path):
+    _export(tmp_path, EXPORT_MODE_DIFF, _polls())
+
+    path, = day_files(str(tmp_path), BOARD, '2026-10-19')
+    with gzip.open(path, 'rt') as file:
+        lines = [json.loads(line) for line in file]
+
+    assert ['full' in line for line in lines] == [True, False, False, False, False]
+    assert lines[-1]['diff'] == {}
+
+
+def test_snapshot_export_stores_full_payloads(tmp_path):
+    polls = _polls()
+    _export(tmp_path, EXPORT_MODE_SNAPSHOT, polls)
+
+    path, = day_files(str(tmp_path), BOARD, '2026-10-19')
+    with gzip.open(path, 'rt') as file:
+        assert all('full' in json.loads(line) for line in file)
+    assert [record['nodes'] for record in iter_file(path)] == [poll['nodes'] for poll in polls]
+
+
+def test_a_new_day_starts_a_new_file(tmp_path):
+    exporter = DucoboxExporter(str(tmp_path))
+    exporter.add(START, BOARD, _data(10.0))
+    exporter.add(START + 86400, BOARD, _data(11.0))
+    exporter.write(exporter.take())
+
+    assert len(day_files(str(tmp_path), BOARD, '2026-10-19')) == 1
+    next_day, = day_files(str(tmp_path), BOARD, '2026-10-20')
+    # The first record of every file holds the full payloads
+    assert next(iter_file(next_day))['info'] == _data(11.0)['info']
+    assert exporter.counters['files'] == 2
+
+
+def test_days_beyond_the_retention_are_removed(tmp_path):
+    os.makedirs(tmp_path / BOARD / '2026-10-01')
+    exporter = DucoboxExporter(str(tmp_path), retention_days=7)
+    exporter.add(START, BOARD, _data(10.0))
+    exporter.write(exporter.take())
+
+    assert sorted(os.listdir(tmp_path / BOARD)) == ['2026-10-19']
+    assert exporter.counters['removed_days'] == 1
+
+
+def test_take_hands_over_the_buffer():
+    exporter = DucoboxExporter('/nonexistent')
+    exporter.add(START, BOARD, _data(10.0))
+
+    assert not exporter.should_flush(START + 1)
+    assert exporter.should_flush(START + 300)
+    records = exporter.take()
+    # Records added while a write runs go into a new buffer
+    exporter.add(START + 60, BOARD, _data(11.0))
+
+    assert len(records) == 1
+    assert exporter.stats()['pending'] == 1
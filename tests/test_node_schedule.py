@@ -0,0 +1,62 @@
+import pytest
+
+from ducobox_connectivity_board.model.node_schedule import (
+    DucoboxNodeScheduler,
+    FULL_REFRESH_INTERVAL,
+    IDLE_NODE_INTERVAL,
+    parse_node_intervals,
+)
+
+from .payloads import node
+
+
+def _scheduler(intervals: dict | None = None) -> DucoboxNodeScheduler:
+    scheduler = DucoboxNodeScheduler(60, intervals or {}, lambda node_type: node_type != 'SWITCH')
+    nodes = [node(1, 'BOX'), node(2, 'UCCO2'), node(3, 'SWITCH'), node(4, 'SWITCH'), node(5, 'SWITCH')]
+    scheduler.full_refresh(nodes, 0)
+    return scheduler
+
+
+def test_the_first_poll_fetches_the_full_list():
+    scheduler = DucoboxNodeScheduler(60, {}, lambda node_type: True)
+
+    assert scheduler.due(0) is None
+
+
+def test_sensor_nodes_are_due_every_base_interval_and_others_less_often():
+    scheduler = _scheduler()
+
+    assert scheduler.due(30) == [1, 2]
+    assert scheduler.interval('SWITCH') == IDLE_NODE_INTERVAL
+    assert scheduler.counters['nodes_skipped'] == 3
+
+
+def test_intervals_override_the_node_type_default():
+    scheduler = _scheduler({'UCCO2': 600})
+
+    assert scheduler.due(60) == [1]
+
+
+def test_the_full_list_is_fetched_when_most_nodes_are_due():
+    scheduler = _scheduler()
+
+    assert scheduler.due(IDLE_NODE_INTERVAL) is None
+    assert scheduler.due(FULL_REFRESH_INTERVAL) is None
+
+
+def test_updates_keep_the_latest_payload_of_known_nodes():
+    scheduler = _scheduler()
+    scheduler.update(node(2, 'UCCO2', Co2=900), 60)
+    scheduler.update(node(9, 'UCCO2'), 60)
+
+    assert scheduler.fetched_at(2) == 60
+    assert scheduler.fetched_at(9) is None
+    assert [payload['Node'] for payload in scheduler.nodes()] == [1, 2, 3, 4, 5]
+    assert scheduler.nodes()[1]['Sensor']['data'] == {'Co2': 900}
+    assert scheduler.due(80) == [1]
+
+
+def test_parse_node_intervals():
+    assert parse_node_intervals(' UCBAT=900, SWITCH = 600 ,') == {'UCBAT': 900, 'SWITCH': 600}
+    with pytest.raises(ValueError):
+        parse_node_intervals('UCBAT')
@@ -0,0 +1,41 @@
+from ducobox_connectivity_board.model.config_index import DucoboxConfigIndex
+from ducobox_connectivity_board.model.presets import diff_preset
+
+
+def _index() -> DucoboxConfigIndex:
+    index = DucoboxConfigIndex()
+    index.update({'Nodes': [
+        {'Node': 1, 'FlowMax': {'Val': 50, 'Min': 10, 'Max': 100, 'Inc': 5}, 'TimeMan': {'Val': 15, 'Min': 5, 'Max': 60, 'Inc': 5}},
+        {'Node': 2, 'FlowMax': {'Val': 40, 'Min': 10, 'Max': 100, 'Inc': 5}},
+    ]})
+    return index
+
+
+def test_only_differing_values_are_changed():
+    changes, original, errors = diff_preset(_index(), {1: {'FlowMax': 60, 'TimeMan': 15}, 2: {'FlowMax': 40}})
+
+    assert changes == {1: {'FlowMax': 60}}
+    assert original == {1: {'FlowMax': 50}}
+    assert errors == []
+
+
+def test_off_step_values_are_rejected():
+    changes, original, errors = diff_preset(_index(), {1: {'FlowMax': 62, 'TimeMan': 20}})
+
+    assert changes == {1: {'TimeMan': 20}}
+    assert original == {1: {'TimeMan': 15}}
+    assert len(errors) == 1
+    assert 'multiple of 5' in errors[0]
+
+
+def test_a_value_near_the_current_one_is_not_rounded_to_it():
+    changes, _, errors = diff_preset(_index(), {1: {'FlowMax': 50.4}})
+
+    assert changes == {}
+    assert len(errors) == 1
+
+
+def test_unknown_and_out_of_range_values_are_rejected():
+    _, _, errors = diff_preset(_index(), {1: {'FlowMax': 105}, 3: {'FlowMax': 50}})
+
+    assert len(errors) == 2
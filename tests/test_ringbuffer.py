@@ -0,0 +1,52 @@
+import pytest
+
+from ducobox_connectivity_board.model.ringbuffer import RingBuffer
+
+
+def test_empty_buffer_has_no_statistics():
+    buffer = RingBuffer(4)
+
+    assert len(buffer) == 0
+    assert buffer.last() is None
+    assert buffer.mean() is None
+    assert buffer.rate() is None
+
+
+def test_statistics_cover_only_the_latest_samples():
+    buffer = RingBuffer(3)
+    for timestamp, value in enumerate([10.0, 1.0, 2.0, 3.0, 4.0]):
+        buffer.append(timestamp, value)
+
+    assert len(buffer) == 3
+    assert buffer.last() == 4.0
+    assert buffer.mean() == pytest.approx(3.0)
+    assert buffer.min() == 2.0
+    assert buffer.max() == 4.0
+    assert buffer.stat('max') == 4.0
+
+
+def test_rate_is_the_slope_per_minute_in_time_order():
+    buffer = RingBuffer(4)
+    # Wraps around, so the slots are no longer in time order
+    for timestamp in range(6):
+        buffer.append(1000.0 + timestamp * 30, 20.0 + timestamp)
+
+    assert buffer.rate() == pytest.approx(2.0)
+    assert buffer.rate(per=3600) == pytest.approx(120.0)
+
+
+def test_rate_needs_two_distinct_times():
+    buffer = RingBuffer(4)
+    buffer.append(5.0, 1.0)
+    buffer.append(5.0, 2.0)
+
+    assert buffer.rate() is None
+
+
+def test_memory_is_fixed_by_the_size():
+    buffer = RingBuffer(10)
+    before = buffer.nbytes
+    for timestamp in range(100):
+        buffer.append(timestamp, timestamp)
+
+    assert buffer.nbytes == before == 160
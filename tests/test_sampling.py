@@ -0,0 +1,68 @@
+import pytest
+
+from ducobox_connectivity_board.model.sampling import SampleWindow
+
+
+def _data(supply_temp: float, co2: int, state: str = 'AUTO') -> dict:
+    return {
+        'info': {
+            'Ventilation': {'Sensor': {'TempSup': {'Val': supply_temp}}},
+            'General': {'Board': {'UpTime': {'Val': 100}}},
+        },
+        'nodes': [
+            {'Node': 2, 'Sensor': {'data': {'Co2': co2}}, 'Ventilation': {'State': state, 'FlowLvlTgt': 30}},
+        ],
+    }
+
+
+def _window(*samples: dict) -> SampleWindow:
+    window = SampleWindow()
+    for sample in samples:
+        window.add(sample)
+    return window
+
+
+@pytest.mark.parametrize('aggregate, temp, co2', [
+    ('mean', 20.0, 700),
+    ('min', 18.0, 600),
+    ('max', 22.0, 800),
+    ('last', 18.0, 600),
+])
+def test_sampled_leaves_are_replaced_by_their_aggregate(aggregate, temp, co2):
+    window = _window(_data(22.0, 800), _data(20.0, 700), _data(18.0, 600))
+    latest = _data(18.0, 600)
+
+    result = window.apply(latest, aggregate)
+
+    assert result['info']['Ventilation']['Sensor']['TempSup']['Val'] == pytest.approx(temp)
+    assert result['nodes'][0]['Sensor']['data']['Co2'] == pytest.approx(co2)
+
+
+def test_values_outside_the_sampled_sections_keep_the_latest_value():
+    window = _window(_data(20.0, 700), _data(21.0, 800, state='MAN1'))
+    latest = _data(21.0, 800, state='MAN1')
+    latest['info']['General']['Board']['UpTime']['Val'] = 160
+
+    result = window.apply(latest, 'mean')
+
+    assert result['info']['General']['Board']['UpTime']['Val'] == 160
+    assert result['nodes'][0]['Ventilation'] == {'State': 'MAN1', 'FlowLvlTgt': 30}
+
+
+def test_apply_does_not_change_the_original_payload():
+    window = _window(_data(20.0, 700), _data(22.0, 900))
+    latest = _data(22.0, 900)
+
+    window.apply(latest, 'mean')
+
+    assert latest['info']['Ventilation']['Sensor']['TempSup']['Val'] == 22.0
+    assert latest['nodes'][0]['Sensor']['data']['Co2'] == 900
+
+
+def test_reset_empties_the_window():
+    window = _window(_data(20.0, 700), _data(22.0, 900))
+    window.reset()
+    latest = _data(22.0, 900)
+
+    assert window.samples == 0
+    assert window.apply(latest, 'mean') is latest
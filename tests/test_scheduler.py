@@ -0,0 +1,103 @@
+import asyncio
+
+from ducobox_connectivity_board.model.scheduler import (
+    DucoboxRequestScheduler,
+    PRIORITY_USER_WRITE,
+    PRIORITY_READ_BACK,
+    PRIORITY_LIVE_POLL,
+    PRIORITY_CONFIG_POLL,
+)
+
+
+async def _grant_order(scheduler: DucoboxRequestScheduler, priorities: list[int]) -> list[tuple[int, int]]:
+    order = []
+
+    async def request(index: int, priority: int) -> None:
+        async with scheduler.slot(priority):
+            order.append((priority, index))
+            await asyncio.sleep(0)
+
+    # Hold the only slot while every request queues up behind it
+    await scheduler.acquire(PRIORITY_LIVE_POLL)
+    tasks = [asyncio.create_task(request(index, priority)) for index, priority in enumerate(priorities)]
+    await asyncio.sleep(0)
+    scheduler.release()
+    await asyncio.gather(*tasks)
+    return order
+
+
+def test_waiters_are_served_by_priority_then_fifo():
+    scheduler = DucoboxRequestScheduler(requests_per_second=1000, max_in_flight=1)
+    priorities = [PRIORITY_CONFIG_POLL, PRIORITY_LIVE_POLL, PRIORITY_USER_WRITE, PRIORITY_READ_BACK, PRIORITY_USER_WRITE]
+
+    order = asyncio.run(_grant_order(scheduler, priorities))
+
+    assert order == [
+        (PRIORITY_USER_WRITE, 2),
+        (PRIORITY_USER_WRITE, 4),
+        (PRIORITY_READ_BACK, 3),
+        (PRIORITY_LIVE_POLL, 1),
+        (PRIORITY_CONFIG_POLL, 0),
+    ]
+
+
+def test_max_in_flight_limits_concurrent_slots():
+    async def run() -> int:
+        scheduler = DucoboxRequestScheduler(requests_per_second=1000, max_in_flight=2)
+        running = peak = 0
+
+        async def request() -> None:
+            nonlocal running, peak
+            async with scheduler.slot(PRIORITY_LIVE_POLL):
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.001)
+                running -= 1
+
+        await asyncio.gather(*(request() for _ in range(6)))
+        assert scheduler.stats()['in_flight'] == 0
+        return peak
+
+    assert asyncio.run(run()) == 2
+
+
+def test_token_bucket_delays_requests_beyond_the_burst():
+    async def run() -> float:
+        scheduler = DucoboxRequestScheduler(requests_per_second=50, max_in_flight=10, burst=1)
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        for _ in range(3):
+            async with scheduler.slot(PRIORITY_LIVE_POLL):
+                pass
+        return loop.time() - started
+
+    # The first request uses the burst token, the other two wait 1/50 s each
+    assert asyncio.run(run()) >= 0.035
+
+
+def test_cancelled_waiter_does_not_hold_a_slot():
+    async def run() -> dict:
+        scheduler = DucoboxRequestScheduler(requests_per_second=1000, max_in_flight=1)
+        await scheduler.acquire(PRIORITY_LIVE_POLL)
+        waiter = asyncio.create_task(scheduler.acquire(PRIORITY_USER_WRITE))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+        scheduler.release()
+        async with scheduler.slot(PRIORITY_CONFIG_POLL):
+            pass
+        return scheduler.stats()
+
+    stats = asyncio.run(run())
+    assert stats['in_flight'] == 0
+    assert stats['queue_depth'] == 0
+    assert stats['classes']['user_write']['requests'] == 0
+
+
+def test_configure_applies_new_limits():
+    scheduler = DucoboxRequestScheduler(requests_per_second=2, max_in_flight=1)
+    scheduler.configure(5, 3)
+
+    stats = scheduler.stats()
+    assert stats['requests_per_second'] == 5
+    assert stats['max_in_flight'] == 3
@@ -0,0 +1,57 @@
+import pytest
+
+from ducobox_connectivity_board.model.statistics import DucoboxStatisticsAccumulator
+
+KEY = (None, 'TempSup')
+HOUR = 1_700_000_000 // 3600 * 3600
+
+
+def test_completed_hours_hold_mean_min_and_max():
+    statistics = DucoboxStatisticsAccumulator()
+    for minute, value in ((0, 10.0), (20, 20.0), (40, 30.0)):
+        statistics.add(KEY, HOUR + minute * 60, value)
+    # The first sample of the next hour closes the hour
+    statistics.add(KEY, HOUR + 3600 + 300, 99.0)
+    statistics.add(KEY, HOUR + 3600 + 600, 99.0)
+
+    assert statistics.pending_rows() == 1
+    assert statistics.pop_hours() == {KEY: [(HOUR, pytest.approx(20.0), 10.0, 30.0)]}
+    assert statistics.pending_rows() == 0
+
+
+def test_short_term_rows_are_kept_per_five_minutes():
+    statistics = DucoboxStatisticsAccumulator(short_term_keep=2)
+    for minute in range(0, 25, 5):
+        statistics.add(KEY, HOUR + minute * 60, float(minute))
+
+    assert statistics.short_term[KEY] == [(HOUR + 600, 10.0, 10.0, 10.0), (HOUR + 900, 15.0, 15.0, 15.0)]
+
+
+def _hour_rows(statistics: DucoboxStatisticsAccumulator, samples: list[tuple[int, float]], published: float):
+    """Feed an hour the way the coordinator does: raw samples, then the published aggregate."""
+    for second, value in samples:
+        statistics.add(KEY, HOUR + second, value)
+        statistics.add_published(KEY, HOUR + second, published)
+    statistics.add(KEY, HOUR + 3600 + 300, 0.0)
+    statistics.add(KEY, HOUR + 3600 + 600, 0.0)
+    return statistics.pop_hours()[KEY]
+
+
+def test_published_values_are_ignored_while_sampling():
+    statistics = DucoboxStatisticsAccumulator(sampling=True)
+    samples = [(0, 10.0), (600, 20.0), (1200, 30.0), (1800, 40.0)]
+
+    (_, mean, minimum, maximum), = _hour_rows(statistics, samples, published=50.0)
+
+    # Every raw sample counts once, and the published aggregate not at all
+    assert (mean, minimum, maximum) == (pytest.approx(25.0), 10.0, 40.0)
+
+
+def test_published_values_are_added_without_sampling():
+    statistics = DucoboxStatisticsAccumulator(sampling=False)
+    for minute, value in ((0, 10.0), (30, 30.0)):
+        statistics.add_published(KEY, HOUR + minute * 60, value)
+    statistics.add_published(KEY, HOUR + 3600 + 300, 0.0)
+    statistics.add_published(KEY, HOUR + 3600 + 600, 0.0)
+
+    assert statistics.pop_hours() == {KEY: [(HOUR, pytest.approx(20.0), 10.0, 30.0)]}
@@ -0,0 +1,121 @@
+import pytest
+
+from ducobox_connectivity_board.model.trends import DAY, DucoboxTrendAnalyzer
+
+from .payloads import node
+
+HOUR = 3600.0
+START = 1_700_000_000.0
+
+
+def _info(speed: float | None = None, pressure: float | None = None, filter_remain: int | None = None) -> dict:
+    info = {'Ventilation': {'Fan': {}}, 'HeatRecovery': {'General': {}}}
+    if speed is not None:
+        info['Ventilation']['Fan'] = {
+            'SpeedSup': {'Val': speed}, 'PressSup': {'Val': pressure},
+            'SpeedEha': {'Val': speed}, 'PressEha': {'Val': pressure},
+        }
+    if filter_remain is not None:
+        info['HeatRecovery']['General']['TimeFilterRemain'] = {'Val': filter_remain}
+    return info
+
+
+def _run_fans(analyzer: DucoboxTrendAnalyzer, start: float, hours: int, pressure_factor: float) -> float:
+    now = start
+    for hour in range(hours):
+        now = start + hour * HOUR
+        speed = 1000 + (hour % 10) * 100
+        analyzer.update(now, _info(speed, speed * pressure_factor), [])
+    return now
+
+
+def test_filter_degradation_follows_the_pressure_at_the_same_speed():
+    analyzer = DucoboxTrendAnalyzer(START)
+    now = _run_fans(analyzer, START, 80, 1.0)
+
+    assert analyzer.filter_degradation(now) == pytest.approx(0.0, abs=0.1)
+
+    now = _run_fans(analyzer, now + HOUR, 24 * 7, 1.3)
+
+    # The forgetting fit still holds some clean-filter samples
+    assert 25.0 < analyzer.filter_degradation(now) <= 30.0
+
+
+def test_filter_degradation_needs_a_complete_baseline():
+    analyzer = DucoboxTrendAnalyzer(START)
+    now = _run_fans(analyzer, START, 24, 1.0)
+
+    assert analyzer.filter_degradation(now) is None
+
+
+def test_a_rise_of_the_filter_time_restarts_the_filter_trends():
+    analyzer = DucoboxTrendAnalyzer(START)
+    analyzer.update(START, _info(filter_remain=10), [])
+    analyzer.update(START + DAY, _info(filter_remain=180), [])
+
+    assert analyzer.filter_resets == 1
+
+
+def test_filter_change_time_assumes_a_day_per_day_without_history():
+    analyzer = DucoboxTrendAnalyzer(START)
+    analyzer.update(START, _info(filter_remain=10), [])
+
+    assert analyzer.filter_change_time(START) == round((START + 10 * DAY) / 3600) * 3600
+
+
+def test_filter_change_time_uses_the_observed_countdown_rate():
+    analyzer = DucoboxTrendAnalyzer(START)
+    # The filter time runs down two days per day
+    for day in range(4):
+        analyzer.update(START + day * DAY, _info(filter_remain=100 - 2 * day), [])
+    now = START + 3 * DAY
+
+    assert analyzer.filter_change_time(now) == pytest.approx(now + 47 * DAY, abs=HOUR)
+
+
+def _nodes(offset: float) -> list[dict]:
+    return [node(2, Temp=20.0 + offset), node(3, Temp=20.5), node(4, Temp=19.5), node(5, Temp=20.0)]
+
+
+def test_a_sensor_that_moves_away_from_its_peers_drifts():
+    analyzer = DucoboxTrendAnalyzer(START)
+    now = START
+    for hour in range(24 * 4):
+        now = START + hour * HOUR
+        analyzer.update(now, _info(), _nodes(0.0))
+    assert not analyzer.is_drifting(2, 'Temp')
+
+    for hour in range(1, 25):
+        analyzer.update(now + hour * HOUR, _info(), _nodes(8.0))
+
+    drift, flagged = analyzer.drift(2, 'Temp')
+    assert flagged
+    assert drift > 1.5
+    assert not analyzer.is_drifting(3, 'Temp')
+
+
+def test_a_constant_offset_is_not_drift():
+    analyzer = DucoboxTrendAnalyzer(START)
+    for hour in range(24 * 5):
+        analyzer.update(START + hour * HOUR, _info(), _nodes(3.0))
+
+    assert not analyzer.is_drifting(2, 'Temp')
+
+
+def test_state_round_trips_through_as_dict():
+    analyzer = DucoboxTrendAnalyzer(START)
+    for hour in range(24 * 4):
+        analyzer.update(START + hour * HOUR, _info(1000 + hour % 10 * 100, 500, 50), _nodes(hour / 24))
+    now = START + 4 * DAY
+
+    restored = DucoboxTrendAnalyzer.from_dict(analyzer.as_dict(), now)
+
+    assert restored.as_dict() == analyzer.as_dict()
+    assert restored.metrics(now) == analyzer.metrics(now)
+
+
+def test_outdated_or_broken_state_starts_empty():
+    empty = DucoboxTrendAnalyzer(START).as_dict()
+
+    assert DucoboxTrendAnalyzer.from_dict({'version': 0}, START).as_dict() == empty
+    assert DucoboxTrendAnalyzer.from_dict({'version': 1, 'time': START}, START).as_dict() == empty
@@ -0,0 +1,73 @@
+from ducobox_connectivity_board.model.write_queue import DucoboxWriteQueue, RETRY_INITIAL, RETRY_MAX
+
+
+def _drain(queue: DucoboxWriteQueue) -> list[dict]:
+    sent = []
+    while (item := queue.peek()) is not None:
+        queue.done(item)
+        sent.append({key: value for key, value in item.items() if key != 'queued_at'})
+    return sent
+
+
+def test_writes_drain_in_the_order_of_the_latest_intents():
+    queue = DucoboxWriteQueue()
+    queue.put_value(1, 'FlowMax', 50)
+    queue.put_action(2, 'SetVentilationState', 'MAN1')
+    queue.put_value(1, 'TimeMan', 15)
+    # Replaces the first write and moves it to the end
+    queue.put_value(1, 'FlowMax', 60)
+    queue.put_action(2, 'SetVentilationState', 'AUTO')
+
+    assert _drain(queue) == [
+        {'node': 1, 'key': 'TimeMan', 'value': 15},
+        {'node': 1, 'key': 'FlowMax', 'value': 60},
+        {'node': 2, 'action': 'SetVentilationState', 'option': 'AUTO'},
+    ]
+    assert queue.counters['replaced'] == 2
+    assert queue.counters['sent'] == 3
+
+
+def test_a_write_replaced_while_it_is_sent_stays_queued():
+    queue = DucoboxWriteQueue()
+    queue.put_value(1, 'FlowMax', 50)
+    item = queue.peek()
+    queue.put_value(1, 'FlowMax', 60)
+
+    queue.done(item)
+
+    assert len(queue) == 1
+    assert queue.peek()['value'] == 60
+
+
+def test_rejected_writes_are_dropped():
+    queue = DucoboxWriteQueue()
+    queue.put_value(1, 'FlowMax', 500)
+    queue.done(queue.peek(), sent=False)
+
+    assert len(queue) == 0
+    assert queue.counters['dropped'] == 1
+
+
+def test_retries_back_off_until_a_write_gets_through():
+    queue = DucoboxWriteQueue()
+    queue.put_value(1, 'FlowMax', 50)
+
+    delays = [queue.failed() for _ in range(8)]
+    assert delays[:3] == [RETRY_INITIAL, RETRY_INITIAL * 2, RETRY_INITIAL * 4]
+    assert delays[-1] == RETRY_MAX
+
+    queue.done(queue.peek())
+    assert queue.next_attempt is None
+    assert queue.failed() == RETRY_INITIAL
+
+
+def test_every_change_is_saved_and_the_items_load_back():
+    saves = []
+    queue = DucoboxWriteQueue(save=lambda: saves.append(queue.as_dict()))
+    queue.put_value(1, 'FlowMax', 50)
+    queue.put_action(2, 'SetVentilationState', 'MAN1')
+    queue.done(queue.peek())
+
+    assert len(saves) == 3
+    restored = DucoboxWriteQueue(saves[-1]['items'])
+    assert _drain(restored) == [{'node': 2, 'action': 'SetVentilationState', 'option': 'MAN1'}]
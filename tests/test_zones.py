@@ -0,0 +1,35 @@
+import pytest
+
+from ducobox_connectivity_board.model.zones import compute_zone_aggregates, parse_zones
+
+from .payloads import node, snapshot
+
+
+def test_parse_zones():
+    assert parse_zones(' Upstairs: 2, 3,4; Kitchen:5 ;') == {
+        'Upstairs': frozenset({2, 3, 4}),
+        'Kitchen': frozenset({5}),
+    }
+    assert parse_zones('') == {}
+
+
+@pytest.mark.parametrize('value', ['Upstairs', ': 2', 'Upstairs:'])
+def test_parse_zones_rejects_malformed_zones(value):
+    with pytest.raises(ValueError):
+        parse_zones(value)
+
+
+def test_aggregates_per_zone():
+    data = snapshot(
+        node(2, Co2=800, Rh=50, Temp=20.0, FlowLvlTgt=30),
+        node(3, Co2=1200, Rh=61, Temp=21.0, FlowLvlTgt=60),
+        node(4, 'UCRH', Rh=70),
+        node(5, 'VLV', FlowLvlTgt=40),
+    )
+    zones = parse_zones('Upstairs: 2, 3, 4; Hall: 4, 5; Empty: 9')
+
+    aggregates = compute_zone_aggregates(data, zones)
+
+    assert aggregates['Upstairs'] == {'Co2Max': 1200, 'RhMean': 60.3, 'TempMean': 20.5, 'FlowLvlTgtMax': 60}
+    assert aggregates['Hall'] == {'Co2Max': None, 'RhMean': 70.0, 'TempMean': None, 'FlowLvlTgtMax': 40}
+    assert aggregates['Empty'] == {'Co2Max': None, 'RhMean': None, 'TempMean': None, 'FlowLvlTgtMax': None}
@@ -0,0 +1,25 @@
+"""Developer tools that run the integration's model code without Home Assistant."""
+import os
+import sys
+import types
+
+INTEGRATION_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    'custom_components',
+    'ducobox-connectivity-board',
+)
+INTEGRATION_PACKAGE = 'ducobox_connectivity_board'
+
+
+def load_integration() -> str:
+    """Make the integration importable as a package without running its __init__.
+
+    The integration's __init__.py imports Home Assistant; registering a bare
+    package module lets the Home Assistant-free modules under `model/` be
+    imported with their relative imports intact.
+    """
+    if INTEGRATION_PACKAGE not in sys.modules:
+        package = types.ModuleType(INTEGRATION_PACKAGE)
+        package.__path__ = [INTEGRATION_DIR]
+        sys.modules[INTEGRATION_PACKAGE] = package
+    return INTEGRATION_PACKAGE
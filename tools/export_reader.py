@@ -0,0 +1,61 @@
+"""Load one day of a board's exported payloads (see the `export` option).
+
+Prints a summary by default, full records as NDJSON with --ndjson, or the
+time series of one /info field as CSV with --field.
+
+    python -m tools.export_reader /config/ducobox_export a0b76500a1b2 --day 2026-10-19
+    python -m tools.export_reader /config/ducobox_export a0b76500a1b2 --field Ventilation/Sensor/TempOda/Val
+"""
+import argparse
+from datetime import datetime, timezone
+import importlib
+import json
+import time
+
+from . import load_integration
+
+package = load_integration()
+exporter_module = importlib.import_module(f'{package}.model.exporter')
+utils_module = importlib.import_module(f'{package}.model.utils')
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('directory', help='export directory (<config>/ducobox_export)')
+    parser.add_argument('board', help='board id: the MAC address without separators')
+    parser.add_argument('--day', help='UTC day as YYYY-MM-DD (default today)')
+    output = parser.add_mutually_exclusive_group()
+    output.add_argument('--ndjson', action='store_true', help='print every record as one JSON line')
+    output.add_argument('--field', help='print time,value of one /info field, e.g. Ventilation/Sensor/TempOda/Val')
+    args = parser.parse_args()
+
+    day = args.day or datetime.now(timezone.utc).strftime('%Y-%m-%d')
+    files = exporter_module.day_files(args.directory, args.board, day)
+    if not files:
+        raise SystemExit(f'No export files for {args.board} on {day}')
+
+    started = time.perf_counter()
+    records = 0
+    first = last = None
+    for record in exporter_module.read_day(args.directory, args.board, day):
+        records += 1
+        first = record['time'] if first is None else first
+        last = record['time']
+        if args.ndjson:
+            print(json.dumps(record, separators=(',', ':')))
+        elif args.field:
+            value = utils_module.safe_get(record['info'], *args.field.split('/'))
+            print(f"{datetime.fromtimestamp(record['time'], tz=timezone.utc).isoformat()},{'' if value is None else value}")
+    elapsed = time.perf_counter() - started
+
+    if not args.ndjson and not args.field:
+        print(f"files:    {len(files)}")
+        print(f"records:  {records}")
+        if records:
+            print(f"first:    {datetime.fromtimestamp(first, tz=timezone.utc).isoformat()}")
+            print(f"last:     {datetime.fromtimestamp(last, tz=timezone.utc).isoformat()}")
+        print(f"loaded:   {elapsed:.2f} s")
+
+
+if __name__ == '__main__':
+    main()
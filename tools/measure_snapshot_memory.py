@@ -0,0 +1,91 @@
+"""Compare the memory held per box by the old dict-of-dicts coordinator data
+and by DucoboxSnapshot, using tracemalloc.
+
+    python -m tools.measure_snapshot_memory --nodes 60
+"""
+import argparse
+import gc
+import importlib
+import random
+import tracemalloc
+
+from . import load_integration
+from . import simulator
+
+package = load_integration()
+snapshot_module = importlib.import_module(f'{package}.model.snapshot')
+derived_module = importlib.import_module(f'{package}.model.derived')
+config_index_module = importlib.import_module(f'{package}.model.config_index')
+
+
+def _legacy_data(rng, node_count, tick, static):
+    """coordinator.data as built before DucoboxSnapshot."""
+    data = {
+        'info': simulator.info_payload(rng, tick),
+        'nodes': simulator.nodes_payload(rng, node_count, tick),
+        'config_nodes': simulator.config_nodes_payload(node_count),
+    }
+    data['mappings'] = {'node_id_to_name': {}, 'node_id_to_type': {}}
+    for node in data['nodes']:
+        node_type = node['General']['Type']['Val']
+        data['mappings']['node_id_to_name'][node['Node']] = f"{node['Node']}:{node_type}"
+        data['mappings']['node_id_to_type'][node['Node']] = node_type
+    data['derived'] = derived_module.compute_derived_metrics(data['info'])
+    return {**data, **static}
+
+
+def _snapshot(rng, node_count, tick, static, previous):
+    info = simulator.info_payload(rng, tick)
+    nodes = simulator.nodes_payload(rng, node_count, tick)
+    return snapshot_module.DucoboxSnapshot.build(
+        info,
+        nodes,
+        derived=derived_module.compute_derived_metrics(info),
+        action_nodes=static['action_nodes'],
+        previous=previous,
+    )
+
+
+def _retained(build):
+    """Return (object, bytes still allocated once `build` returned)."""
+    gc.collect()
+    start = tracemalloc.get_traced_memory()[0]
+    result = build()
+    gc.collect()
+    return result, tracemalloc.get_traced_memory()[0] - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--nodes', type=int, default=60, help='number of nodes per box (default 60)')
+    args = parser.parse_args()
+
+    tracemalloc.start()
+    static, static_bytes = _retained(lambda: {'action_nodes': simulator.action_nodes_payload(args.nodes)})
+
+    legacy, legacy_first = _retained(lambda: _legacy_data(random.Random(1), args.nodes, 0, static))
+    _, legacy_next = _retained(lambda: _legacy_data(random.Random(2), args.nodes, 1, static))
+
+    first, snapshot_first = _retained(lambda: _snapshot(random.Random(1), args.nodes, 0, static, None))
+    _, snapshot_next = _retained(lambda: _snapshot(random.Random(2), args.nodes, 1, static, first))
+
+    def build_index():
+        index = config_index_module.DucoboxConfigIndex()
+        index.update(simulator.config_nodes_payload(args.nodes))
+        return index
+
+    _, index_bytes = _retained(build_index)
+    tracemalloc.stop()
+
+    print(f"nodes per box:                     {args.nodes}")
+    print(f"static /action/nodes (shared):     {static_bytes / 1024:8.1f} KiB")
+    print(f"dict-of-dicts data, generation 1:  {legacy_first / 1024:8.1f} KiB")
+    print(f"dict-of-dicts data, generation 2:  {legacy_next / 1024:8.1f} KiB")
+    print(f"DucoboxSnapshot, generation 1:     {snapshot_first / 1024:8.1f} KiB")
+    print(f"DucoboxSnapshot, generation 2:     {snapshot_next / 1024:8.1f} KiB")
+    print(f"config index (held in both cases): {index_bytes / 1024:8.1f} KiB")
+    print(f"reduction per generation:          {(1 - snapshot_next / legacy_next) * 100:8.1f} %")
+
+
+if __name__ == '__main__':
+    main()
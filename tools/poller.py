@@ -0,0 +1,181 @@
+"""Run the coordinator's fetch, parse and extract pipeline without Home Assistant.
+
+Polls real boards, simulated boards, or both, through the same request
+scheduler the integration uses, and prints the timing of every poll and a
+throughput summary.
+
+    python -m tools.poller --url https://192.168.1.50 --polls 5
+    python -m tools.poller --simulate 20 --nodes 30 --latency 0.05 --polls 10 --interval 0
+"""
+import argparse
+import asyncio
+import concurrent.futures
+import importlib
+import statistics
+import time
+
+from . import load_integration
+from . import simulator
+
+package = load_integration()
+config_index_module = importlib.import_module(f'{package}.model.config_index')
+derived_module = importlib.import_module(f'{package}.model.derived')
+scheduler_module = importlib.import_module(f'{package}.model.scheduler')
+schema_module = importlib.import_module(f'{package}.model.schema')
+snapshot_module = importlib.import_module(f'{package}.model.snapshot')
+utils_module = importlib.import_module(f'{package}.model.utils')
+
+
+class VirtualBoard:
+    """The per-board state of DucoboxCoordinator, minus Home Assistant."""
+
+    def __init__(self, name: str, client, requests_per_second: float, max_in_flight: int):
+        self.name = name
+        self.client = client
+        self.scheduler = scheduler_module.DucoboxRequestScheduler(requests_per_second, max_in_flight)
+        self.config_index = config_index_module.DucoboxConfigIndex()
+        self.node_schema: dict[str, list[dict]] = {}
+        self.node_layout = snapshot_module.NODE_LAYOUT
+        self.action_nodes = None
+        self.snapshot = None
+        self.requests = 0
+
+    async def _request(self, priority: int, func, *args):
+        async with self.scheduler.slot(priority):
+            self.requests += 1
+            return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+    async def setup(self) -> None:
+        self.action_nodes = await self._request(
+            scheduler_module.PRIORITY_CONFIG_POLL, self.client.raw_get, '/action/nodes'
+        )
+
+    async def poll(self) -> dict:
+        """Run one poll and return its timings in seconds."""
+        started = time.perf_counter()
+        info = await self._request(scheduler_module.PRIORITY_LIVE_POLL, self.client.get_info)
+        nodes_response = await self._request(scheduler_module.PRIORITY_LIVE_POLL, self.client.get_nodes)
+        config_nodes = await self._request(
+            scheduler_module.PRIORITY_CONFIG_POLL, self.client.raw_get, '/config/nodes'
+        )
+        fetched = time.perf_counter()
+
+        nodes = [node.dict() for node in getattr(nodes_response, 'Nodes', None) or []]
+        parsed = time.perf_counter()
+
+        self.config_index.update(config_nodes)
+        node_types = {
+            utils_module.safe_get(node, 'General', 'Type', 'Val') or 'Unknown' for node in nodes
+        } - self.node_schema.keys()
+        if node_types:
+            self.node_schema.update(schema_module.compile_node_types(nodes, node_types))
+            self.node_layout = snapshot_module.NODE_LAYOUT.extend(schema_module.layout_fields(self.node_schema))
+        self.snapshot = snapshot_module.DucoboxSnapshot.build(
+            info,
+            nodes,
+            derived=derived_module.compute_derived_metrics(info),
+            action_nodes=self.action_nodes,
+            previous=self.snapshot,
+            node_layout=self.node_layout,
+        )
+        extracted = time.perf_counter()
+
+        return {
+            'fetch': fetched - started,
+            'parse': parsed - fetched,
+            'extract': extracted - parsed,
+            'total': extracted - started,
+            'nodes': len(nodes),
+        }
+
+
+def _percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+async def _run_board(board: VirtualBoard, polls: int, interval: float, quiet: bool, results: list) -> None:
+    await board.setup()
+    for poll in range(1, polls + 1):
+        poll_started = time.monotonic()
+        try:
+            timings = await board.poll()
+        except Exception as e:
+            print(f"{board.name} poll {poll}: failed: {e}")
+            results.append(None)
+        else:
+            results.append(timings)
+            if not quiet:
+                print(
+                    f"{board.name} poll {poll}: {timings['nodes']} nodes, "
+                    f"fetch {timings['fetch'] * 1000:.1f} ms, parse {timings['parse'] * 1000:.2f} ms, "
+                    f"extract {timings['extract'] * 1000:.2f} ms, total {timings['total'] * 1000:.1f} ms"
+                )
+        if poll < polls:
+            await asyncio.sleep(max(0.0, interval - (time.monotonic() - poll_started)))
+
+
+async def _run(args: argparse.Namespace) -> None:
+    boards = []
+    if args.url:
+        from ducopy import DucoPy
+
+        for url in args.url:
+            boards.append(VirtualBoard(
+                url, DucoPy(base_url=url, verify=False), args.requests_per_second, args.max_in_flight
+            ))
+    for index in range(args.simulate):
+        client = simulator.SimulatedDucoClient(
+            node_count=args.nodes, seed=index, latency=args.latency, mac=f'a0:b7:65:00:{index // 256:02x}:{index % 256:02x}'
+        )
+        boards.append(VirtualBoard(f'sim{index}', client, args.requests_per_second, args.max_in_flight))
+
+    if not boards:
+        raise SystemExit('Nothing to poll: pass --url and/or --simulate')
+
+    # Every board may have max_in_flight blocking requests in the executor at once
+    loop = asyncio.get_running_loop()
+    loop.set_default_executor(
+        concurrent.futures.ThreadPoolExecutor(max_workers=len(boards) * args.max_in_flight)
+    )
+
+    results: list[dict | None] = []
+    started = time.perf_counter()
+    await asyncio.gather(*(_run_board(board, args.polls, args.interval, args.quiet, results) for board in boards))
+    elapsed = time.perf_counter() - started
+
+    for board in boards:
+        board.client.close()
+
+    completed = [result for result in results if result is not None]
+    requests = sum(board.requests for board in boards)
+    print()
+    print(f"boards:              {len(boards)}")
+    print(f"polls:               {len(completed)} completed, {len(results) - len(completed)} failed")
+    print(f"elapsed:             {elapsed:.2f} s")
+    print(f"throughput:          {len(completed) / elapsed:.2f} polls/s, {requests / elapsed:.2f} requests/s")
+    if completed:
+        for key in ('fetch', 'parse', 'extract', 'total'):
+            values = [result[key] * 1000 for result in completed]
+            print(
+                f"{key + ' (ms):':<20} mean {statistics.fmean(values):8.2f}, "
+                f"p50 {_percentile(values, 0.5):8.2f}, p95 {_percentile(values, 0.95):8.2f}, max {max(values):8.2f}"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--url', action='append', help='board URL to poll (repeatable; requires ducopy)')
+    parser.add_argument('--simulate', type=int, default=0, help='number of simulated boards (default 0)')
+    parser.add_argument('--nodes', type=int, default=10, help='nodes per simulated board (default 10)')
+    parser.add_argument('--latency', type=float, default=0.02, help='simulated response time in seconds (default 0.02)')
+    parser.add_argument('--polls', type=int, default=5, help='polls per board (default 5)')
+    parser.add_argument('--interval', type=float, default=60.0, help='seconds between poll starts (default 60)')
+    parser.add_argument('--requests-per-second', type=float, default=2.0, help='scheduler rate per board (default 2.0)')
+    parser.add_argument('--max-in-flight', type=int, default=2, help='scheduler concurrency per board (default 2)')
+    parser.add_argument('--quiet', action='store_true', help='only print the summary')
+    asyncio.run(_run(parser.parse_args()))
+
+
+if __name__ == '__main__':
+    main()
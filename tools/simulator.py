@@ -0,0 +1,173 @@
+"""Synthetic Connectivity Board payloads shaped like the real /info, /info/nodes,
+/config/nodes and /action/nodes responses."""
+import random
+import time
+
+NODE_TYPES = ('UCCO2', 'VLVCO2', 'VLVRH', 'VLVCO2RH', 'BSRH', 'UCRH', 'UCBAT', 'SWITCH', 'VLV')
+VENTILATION_STATES = ['AUTO', 'AUT1', 'AUT2', 'AUT3', 'MAN1', 'MAN2', 'MAN3', 'EMPT', 'CNT1', 'CNT2', 'CNT3']
+CONFIG_KEYS = (
+    'FlowLvlAutoMin', 'FlowLvlAutoMax', 'FlowMax', 'FlowLvlMan1', 'FlowLvlMan2', 'FlowLvlMan3',
+    'TimeMan', 'Co2SetPoint', 'RhSetPoint', 'RhDetMode', 'TempDepEnable', 'ShowSensorLvl',
+)
+
+
+def _val(value):
+    return {'Val': value}
+
+
+def info_payload(rng: random.Random, tick: int = 0, mac: str = 'a0:b7:65:00:00:01') -> dict:
+    """Return a /info payload with the modules a DucoBox Energy reports."""
+    return {
+        'General': {
+            'Board': {
+                'PublicApiVersion': _val('2.1'), 'BoxName': _val('ENERGY'), 'BoxSubTypeName': _val('Eu'),
+                'SerialBoardBox': _val('RS2220000001'), 'SerialBoardComm': _val('PS2220000001'),
+                'SerialDucoBox': _val('P000001-220000-001'), 'SerialDucoComm': _val('P000002-220000-001'),
+                'Time': _val(1700000000 + tick * 60), 'UpTime': _val(86400 + tick * 60),
+                'SwVersionBox': _val('16056.10.4.0'), 'SwVersionComm': _val('18293.29.8.0'),
+            },
+            'Lan': {
+                'Mode': _val('WIFI_CLIENT'), 'Ip': _val('192.168.1.50'), 'NetMask': _val('255.255.255.0'),
+                'DefaultGateway': _val('192.168.1.1'), 'Dns': _val('192.168.1.1'), 'Mac': _val(mac),
+                'HostName': _val('duco_000001'), 'RssiWifi': _val(-60 + rng.randint(-3, 3)),
+            },
+        },
+        'Ventilation': {
+            'Sensor': {
+                'TempOda': _val(80 + rng.randint(-5, 5)), 'TempSup': _val(185 + rng.randint(-5, 5)),
+                'TempEta': _val(215 + rng.randint(-3, 3)), 'TempEha': _val(110 + rng.randint(-5, 5)),
+            },
+            'Fan': {
+                'SpeedSup': _val(1450 + rng.randint(-30, 30)), 'SpeedEha': _val(1400 + rng.randint(-30, 30)),
+                'PressSup': _val(450 + rng.randint(-20, 20)), 'PressEha': _val(420 + rng.randint(-20, 20)),
+                'PwmSup': _val(41), 'PwmEha': _val(39),
+            },
+            'Calibration': {'Valid': _val(True), 'State': _val('IDLE'), 'Status': _val('SUCCESS')},
+        },
+        'HeatRecovery': {
+            'General': {'TimeFilterRemain': _val(120 - tick // 1440), 'FilterState': _val('OK')},
+            'Bypass': {'Pos': _val(0), 'TempSupTgt': _val(210)},
+            'ProtectFrost': {'State': _val('INACTIVE'), 'PressReduct': _val(0), 'HeaterOdaPresent': _val(False)},
+        },
+        'NightBoost': {'TempOutsideAvgThs': _val(120), 'TempComfort': _val(210), 'FlowLvlReqZone1': _val(0)},
+        'Diag': {'Errors': []},
+    }
+
+
+def node_payload(rng: random.Random, node_id: int, node_type: str, tick: int = 0) -> dict:
+    """Return one /info/nodes entry in the shape of DucoPy's `NodeInfo.dict()`."""
+    sensor = {}
+    if 'CO2' in node_type:
+        sensor['Co2'] = 500 + rng.randint(0, 700)
+        sensor['IaqCo2'] = rng.randint(40, 100)
+    if 'RH' in node_type or node_type == 'BOX':
+        sensor['Rh'] = round(45 + rng.random() * 20, 1)
+        sensor['IaqRh'] = rng.randint(40, 100)
+    if sensor:
+        sensor['Temp'] = round(20 + rng.random() * 3, 1)
+
+    state = rng.choice(VENTILATION_STATES[:4])
+    return {
+        'Node': node_id,
+        'General': {'Type': {'Id': None, 'Val': node_type}, 'Addr': node_id},
+        'NetworkDuco': {'CommErrorCtr': 0},
+        'Ventilation': {
+            'State': state,
+            'FlowLvlOvrl': 0,
+            'TimeStateRemain': None,
+            'TimeStateEnd': None,
+            'Mode': 'AUTO',
+            'FlowLvlTgt': rng.randint(10, 100),
+        },
+        'Sensor': {'data': sensor} if sensor else None,
+    }
+
+
+def nodes_payload(rng: random.Random, node_count: int, tick: int = 0) -> list[dict]:
+    """Return a BOX node followed by `node_count - 1` nodes of mixed types."""
+    nodes = [node_payload(rng, 1, 'BOX', tick)]
+    for node_id in range(2, node_count + 1):
+        nodes.append(node_payload(rng, node_id, NODE_TYPES[node_id % len(NODE_TYPES)], tick))
+    return nodes
+
+
+def config_nodes_payload(node_count: int) -> dict:
+    """Return a /config/nodes payload with the usual parameters per node."""
+    nodes = []
+    for node_id in range(1, node_count + 1):
+        node = {'Node': node_id, 'SerialBoard': f'RS{node_id:010d}', 'SerialDuco': 'n/a'}
+        for key in CONFIG_KEYS:
+            node[key] = {'Val': 50, 'Min': 0, 'Max': 100, 'Inc': 5}
+        node['Name'] = {'Val': f'Node {node_id}'}
+        nodes.append(node)
+    return {'Nodes': nodes}
+
+
+def action_nodes_payload(node_count: int) -> dict:
+    """Return an /action/nodes payload with SetVentilationState on every node."""
+    return {
+        'Nodes': [
+            {
+                'Node': node_id,
+                'Actions': [
+                    {'Action': 'SetVentilationState', 'ValType': 'Enum', 'Enum': VENTILATION_STATES},
+                    {'Action': 'SetIdentify', 'ValType': 'Boolean'},
+                ],
+            }
+            for node_id in range(1, node_count + 1)
+        ]
+    }
+
+
+class _SimulatedNode:
+    __slots__ = ('_payload',)
+
+    def __init__(self, payload: dict):
+        self._payload = payload
+
+    def dict(self) -> dict:
+        return self._payload
+
+
+class _SimulatedNodes:
+    __slots__ = ('Nodes',)
+
+    def __init__(self, nodes: list[dict]):
+        self.Nodes = [_SimulatedNode(node) for node in nodes]
+
+
+class SimulatedDucoClient:
+    """Blocking stand-in for DucoPy serving the payloads above.
+
+    Each request sleeps `latency` seconds to mimic the board's response time;
+    every get_info call advances the simulated clock by one poll.
+    """
+
+    def __init__(self, node_count: int = 10, seed: int = 0, latency: float = 0.0, mac: str = 'a0:b7:65:00:00:01'):
+        self.node_count = node_count
+        self.latency = latency
+        self.mac = mac
+        self._rng = random.Random(seed)
+        self._tick = 0
+
+    def _respond(self, payload):
+        if self.latency:
+            time.sleep(self.latency)
+        return payload
+
+    def get_info(self, module=None, submodule=None, parameter=None) -> dict:
+        self._tick += 1
+        return self._respond(info_payload(self._rng, self._tick, self.mac))
+
+    def get_nodes(self) -> _SimulatedNodes:
+        return self._respond(_SimulatedNodes(nodes_payload(self._rng, self.node_count, self._tick)))
+
+    def raw_get(self, endpoint: str, params: dict | None = None) -> dict:
+        if endpoint == '/config/nodes':
+            return self._respond(config_nodes_payload(self.node_count))
+        if endpoint == '/action/nodes':
+            return self._respond(action_nodes_payload(self.node_count))
+        raise ValueError(f"Endpoint {endpoint} is not simulated")
+
+    def close(self) -> None:
+        pass